@@ -298,10 +298,14 @@ rst_epilog = """
 
 .. |RadarSeries| replace:: :class:`.RadarSeries`
 
+.. |ReadOnlyError| replace:: :exc:`.ReadOnlyError`
+
 .. |_Relationship| replace:: :class:`._Relationship`
 
 .. |_Relationships| replace:: :class:`_Relationships`
 
+.. |RenderResult| replace:: :class:`.RenderResult`
+
 .. |RGBColor| replace:: :class:`.RGBColor`
 
 .. |_Row| replace:: :class:`_Row`
@@ -320,6 +324,8 @@ rst_epilog = """
 
 .. |ShapeCollection| replace:: :class:`.ShapeCollection`
 
+.. |ShapeSpec| replace:: :class:`.ShapeSpec`
+
 .. |Slide| replace:: :class:`.Slide`
 
 .. |Slides| replace:: :class:`.Slides`
@@ -346,6 +352,8 @@ rst_epilog = """
 
 .. |TextFrame| replace:: :class:`.TextFrame`
 
+.. |TextRecord| replace:: :class:`.TextRecord`
+
 .. |TickLabels| replace:: :class:`.TickLabels`
 
 .. |True| replace:: :class:`True`
@@ -8,27 +8,78 @@ provides some insulation so not so many classes in the other modules need to be
 from __future__ import annotations
 
 import os
-from typing import IO, TYPE_CHECKING
+from typing import IO, TYPE_CHECKING, cast
 
 from pptx.opc.constants import CONTENT_TYPE as CT
-from pptx.package import Package
+from pptx.package import Package, PackageCache
 
 if TYPE_CHECKING:
     from pptx import presentation
     from pptx.parts.presentation import PresentationPart
 
 
-def Presentation(pptx: str | IO[bytes] | None = None) -> presentation.Presentation:
+# -- templates opened with `cached=True` are loaded only once --
+_package_cache = PackageCache()
+_shared_package_cache = PackageCache(share=True)
+
+
+def Presentation(
+    pptx: str | IO[bytes] | None = None,
+    lazy: bool = False,
+    workers: int | None = None,
+    cached: bool = False,
+    read_only: bool = False,
+    share: bool = False,
+) -> presentation.Presentation:
     """
     Return a |Presentation| object loaded from *pptx*, where *pptx* can be
     either a path to a ``.pptx`` file (a string) or a file-like object. If
     *pptx* is missing or ``None``, the built-in default presentation
     "template" is loaded.
+
+    When *lazy* is |True|, the package file is held open and the bytes of
+    images, media and other binary parts are only read from it when they are
+    needed. The file (or file-like object) must remain available until the
+    presentation is closed, using :meth:`.Presentation.close` or a ``with``
+    statement.
+
+    When *workers* is greater than 1, the XML of the presentation's slides,
+    layouts and other XML parts is parsed on that many threads as the
+    presentation is opened, rather than part by part as each is first used.
+    This shortens the time taken to open a large presentation on a machine
+    with more than one core when most of it will be used.
+
+    When *cached* is |True|, *pptx* must be a path. The file is loaded and
+    parsed only the first time, and each call returns a new presentation
+    copied in memory from that first one, until the file changes. This suits
+    a template used to make many presentations, including the built-in
+    default template when *pptx* is ``None``. *lazy* and *workers* do not
+    apply to a cached presentation.
+
+    When *share* is also |True|, a cached presentation shares the XML of
+    each part of that first one until the part is first used, so masters,
+    layouts and other parts it never uses are held in memory only once
+    however many presentations are made from the file. *share* has no
+    effect unless *cached* is |True|.
+
+    When *read_only* is |True|, the presentation is opened for reading only,
+    as when extracting its text. It is opened as though *lazy* were |True| and
+    should be closed in the same way. Changing or saving it raises
+    |ReadOnlyError|. Its XML, never changing, can be read from any number of
+    threads, and iterating over its slides releases the XML of each slide
+    once iteration moves past it. *cached* does not apply.
     """
     if pptx is None:
         pptx = _default_pptx_path()
+    if cached and not read_only and not isinstance(pptx, str):
+        raise ValueError("cached=True requires a filesystem path")
 
-    presentation_part = Package.open(pptx).main_document_part
+    package = (
+        (_shared_package_cache if share else _package_cache).open(cast(str, pptx))
+        if cached and not read_only
+        else Package.open(pptx, lazy=lazy, workers=workers, read_only=read_only)
+    )
+    presentation_part = package.main_document_part
 
     if not _is_pptx_package(presentation_part):
         tmpl = "file '%s' is not a PowerPoint file, content type is '%s'"
@@ -0,0 +1,156 @@
+"""Batch generation of presentations from a template, fanned out over a pool of processes."""
+
+from __future__ import annotations
+
+import itertools
+import os
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from pptx.api import Presentation
+
+if TYPE_CHECKING:
+    from pptx import presentation
+
+    _Task = Tuple[Optional[str], int, Any, Callable[[presentation.Presentation, Any], None], str]
+
+
+class RenderResult(NamedTuple):
+    """Outcome of rendering one row of a batch, see :func:`render_many`."""
+
+    index: int
+    """Position of the row in the `rows` iterable, starting at 0."""
+
+    path: str | None
+    """Path of the saved presentation, or |None| when rendering the row failed."""
+
+    seconds: float
+    """Time taken to open, build and save the presentation, in seconds."""
+
+    error: str | None
+    """Formatted traceback of the exception that stopped the row, or |None| on success."""
+
+
+def render_many(
+    template: str | None,
+    rows: Iterable[Any],
+    build_fn: Callable[[presentation.Presentation, Any], None],
+    out_dir: str,
+    workers: int | None = None,
+    filename_tmpl: str = "%d.pptx",
+) -> Iterator[RenderResult]:
+    """Generate a |RenderResult| for each of `rows` rendered to a presentation in `out_dir`.
+
+    For each row, a presentation is opened from the `template` path (the default template when
+    |None|), `build_fn(prs, row)` is called to fill it in, and it is saved in `out_dir` under
+    `filename_tmpl` formatted with the row index. Rows are rendered on a pool of `workers`
+    processes, all cores by default. Each process loads `template` only once, see the `cached`
+    option of :func:`.Presentation`. With `workers` of 1, rows are rendered in this process.
+
+    Results are generated as each row finishes, so not in row order when there is more than one
+    worker. A row whose `build_fn` or save raises is reported with the error and leaves no file
+    behind. The rest of the batch carries on. `build_fn` and each row must be picklable when more
+    than one worker is used, so `build_fn` is typically a module-level function.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    tasks: Iterator[_Task] = (
+        (template, index, row, build_fn, os.path.join(out_dir, filename_tmpl % index))
+        for index, row in enumerate(rows)
+    )
+
+    if workers <= 1:
+        for task in tasks:
+            yield _render(*task)
+        return
+
+    # -- a worker process that dies breaks its pool, failing each row in flight on it, so the
+    #    rest of the rows are rendered on a new pool --
+    while True:
+        leftover = yield from _render_on_pool(tasks, workers)
+        if leftover is None:
+            return
+        tasks = itertools.chain([leftover], tasks)
+
+
+def _render_on_pool(
+    tasks: Iterator[_Task], workers: int
+) -> Generator[RenderResult, None, _Task | None]:
+    """Generate |RenderResult| of each of `tasks` rendered on a new pool of `workers` processes.
+
+    Returns the task that could not be submitted when the pool broke while `tasks` remained, the
+    rest of `tasks` then remain unconsumed. Returns |None| when all of `tasks` were rendered.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # -- rows are submitted only as workers come free, so `rows` can be a long stream --
+        pending: dict[Future[RenderResult], int] = {}
+        leftover: _Task | None = None
+        for task in itertools.islice(tasks, 2 * workers):
+            try:
+                pending[executor.submit(_render, *task)] = task[1]
+            except BrokenProcessPool:
+                leftover = task
+                break
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield _result(future, pending.pop(future))
+                if leftover is not None:
+                    continue
+                for task in itertools.islice(tasks, 1):
+                    try:
+                        pending[executor.submit(_render, *task)] = task[1]
+                    except BrokenProcessPool:
+                        leftover = task
+        return leftover
+
+
+def _render(
+    template: str | None,
+    index: int,
+    row: Any,
+    build_fn: Callable[[presentation.Presentation, Any], None],
+    path: str,
+) -> RenderResult:
+    """Return |RenderResult| of rendering `row` to a presentation saved at `path`.
+
+    The presentation is saved to a temporary file beside `path` that then replaces it, so a
+    failed save leaves no partial file at `path`.
+    """
+    start = time.perf_counter()
+    tmp_path = "%s.%d.tmp" % (path, os.getpid())
+    try:
+        prs = Presentation(template, cached=True)
+        build_fn(prs, row)
+        prs.save(tmp_path)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return RenderResult(index, None, time.perf_counter() - start, traceback.format_exc())
+    return RenderResult(index, path, time.perf_counter() - start, None)
+
+
+def _result(future: Future[RenderResult], index: int) -> RenderResult:
+    """Return the |RenderResult| of `future`, rendering the row at `index`.
+
+    A worker process that dies while rendering leaves no result, its row is then reported as
+    failed with the error raised by `future`.
+    """
+    try:
+        return future.result()
+    except Exception:
+        return RenderResult(index, None, 0.0, traceback.format_exc())
@@ -21,3 +21,10 @@ class InvalidXmlError(PythonPptxError):
     Raised when a value is encountered in the XML that is not valid according
     to the schema.
     """
+
+
+class ReadOnlyError(PythonPptxError):
+    """
+    Raised on an attempt to change or save a presentation opened with
+    ``read_only=True``.
+    """
@@ -0,0 +1,216 @@
+"""Streaming extraction of the text of a presentation, without loading its object model.
+
+Suits full-text indexing of many presentations, where only the text is wanted. The XML of each
+slide is read straight from the package file and scanned once, with each paragraph discarded as
+soon as its text is taken, so no slide is ever held in memory as a whole tree.
+"""
+
+from __future__ import annotations
+
+import io
+from typing import IO, Iterator, NamedTuple, cast
+
+from lxml import etree
+
+from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import CT_Relationships
+from pptx.opc.packuri import PACKAGE_URI, PackURI
+from pptx.opc.serialized import PackageReader
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
+
+_cNvPr = qn("p:cNvPr")
+_ph = qn("p:ph")
+_sldId = qn("p:sldId")
+_sldIdLst = qn("p:sldIdLst")
+_a_p = qn("a:p")
+_a_t = qn("a:t")
+_a_br = qn("a:br")
+# -- the `mc:Fallback` of an `mc:AlternateContent` repeats the content of its `mc:Choice` --
+_mc_fallback = qn("ve:Fallback")
+_text_tags = frozenset((qn("a:r"), _a_br, qn("a:fld")))
+_shape_tags = frozenset(
+    qn(tag) for tag in ("p:sp", "p:grpSp", "p:graphicFrame", "p:cxnSp", "p:pic", "p:contentPart")
+)
+
+
+class TextRecord(NamedTuple):
+    """The text of one paragraph of a slide, see :func:`iter_text`."""
+
+    slide_idx: int
+    """Zero-based position of the slide in the presentation."""
+
+    shape_id: int | None
+    """Id of the shape containing the paragraph, the `.shape_id` of that shape."""
+
+    shape_name: str | None
+    """Name of the shape containing the paragraph."""
+
+    text: str
+    """Text of the paragraph, having a vertical-tab ("\\v") for each line break."""
+
+    notes_text: str
+    """Text of the notes of the slide, the same for each paragraph of the slide.
+
+    Paragraphs of the notes are separated by a line feed ("\\n"), as in the text of the notes
+    text frame. Empty when the slide has no notes.
+    """
+
+
+def iter_text(pptx: str | IO[bytes]) -> Iterator[TextRecord]:
+    """Generate a |TextRecord| for each paragraph of each slide in the presentation `pptx`.
+
+    `pptx` is a path to a .pptx file or a file-like object containing one. Slides are generated
+    in presentation order, and the paragraphs of each in document order, which for a table is
+    cell by cell, row by row. Paragraphs of charts, SmartArt and other embedded objects are not
+    included. A slide having notes but no paragraphs produces a single record with empty `text`
+    and no shape.
+
+    Text is as given by the `.text` property of each paragraph. The package file is open until
+    the generator is exhausted or closed.
+    """
+    package_reader = PackageReader(pptx)
+    try:
+        slide_partnames = _iter_slide_partnames(package_reader)
+        for slide_idx, (slide_partname, notes_partname) in enumerate(slide_partnames):
+            notes_text = (
+                "" if notes_partname is None else _notes_text(package_reader[notes_partname])
+            )
+            has_text = False
+            for shape_id, shape_name, _, text in _iter_paragraphs(package_reader[slide_partname]):
+                has_text = True
+                yield TextRecord(slide_idx, shape_id, shape_name, text, notes_text)
+            if notes_text and not has_text:
+                yield TextRecord(slide_idx, None, None, "", notes_text)
+    finally:
+        package_reader.close()
+
+
+def _iter_paragraphs(blob: bytes) -> Iterator[tuple[int | None, str | None, str | None, str]]:
+    """Generate (shape_id, shape_name, ph_type, text) for each paragraph in part XML `blob`.
+
+    `ph_type` is the placeholder type of the shape containing the paragraph, "obj" when the
+    placeholder has no explicit type and |None| when the shape is not a placeholder. Elements are
+    cleared once read, so the memory used does not grow with the size of the part. Of the
+    alternatives of an `mc:AlternateContent` element, only the `mc:Choice` is read.
+    """
+    shape_id, shape_name, ph_type = None, None, None
+    fallback_depth = 0
+    events = etree.iterparse(
+        io.BytesIO(blob),
+        events=("start", "end"),
+        tag=(_cNvPr, _ph, _a_p, _mc_fallback, *_shape_tags),
+        resolve_entities=False,
+    )
+    for event, elm in events:
+        tag = elm.tag
+        if tag == _mc_fallback:
+            fallback_depth += 1 if event == "start" else -1
+            if event == "end":
+                elm.clear()
+            continue
+        if fallback_depth:
+            continue
+        if event == "start":
+            # -- attributes of an element are available on its start event. The `p:cNvPr` of a
+            # -- shape comes before its `p:ph` and text, and after any shape before it ends.
+            if tag == _cNvPr:
+                id_str = elm.get("id")
+                shape_id = int(id_str) if id_str is not None and id_str.isdigit() else None
+                shape_name, ph_type = elm.get("name"), None
+            elif tag == _ph:
+                ph_type = elm.get("type", "obj")
+            continue
+        if tag == _a_p:
+            yield shape_id, shape_name, ph_type, _paragraph_text(elm)
+            elm.clear()
+        elif tag in _shape_tags:
+            elm.clear()
+            # -- drop earlier siblings too, which clearing leaves in place as empty elements --
+            parent = elm.getparent()
+            while parent is not None and elm.getprevious() is not None:
+                del parent[0]
+
+
+def _iter_slide_partnames(
+    package_reader: PackageReader,
+) -> Iterator[tuple[PackURI, PackURI | None]]:
+    """Generate (slide_partname, notes_partname) for each slide, in presentation order.
+
+    `notes_partname` is |None| for a slide having no notes. Slides are ordered by the `p:sldId`
+    elements of the presentation part, which is read only as far as the end of that list.
+    """
+    prs_partname = next(
+        (
+            partname
+            for reltype, partname in _rels(package_reader, PACKAGE_URI).values()
+            if reltype == RT.OFFICE_DOCUMENT
+        ),
+        None,
+    )
+    if prs_partname is None or prs_partname not in package_reader:
+        return
+
+    prs_rels = _rels(package_reader, prs_partname)
+    rIds: list[str] = []
+    for _, elm in etree.iterparse(
+        io.BytesIO(package_reader[prs_partname]),
+        tag=(_sldId, _sldIdLst),
+        resolve_entities=False,
+    ):
+        if elm.tag == _sldIdLst:
+            break
+        rIds.append(cast(str, elm.get(qn("r:id"))))
+
+    for rId in rIds:
+        _, slide_partname = prs_rels.get(rId, (None, None))
+        if slide_partname is None or slide_partname not in package_reader:
+            continue
+        notes_partname = next(
+            (
+                partname
+                for reltype, partname in _rels(package_reader, slide_partname).values()
+                if reltype == RT.NOTES_SLIDE and partname in package_reader
+            ),
+            None,
+        )
+        yield slide_partname, notes_partname
+
+
+def _notes_text(blob: bytes) -> str:
+    """Text of the notes placeholder in notes-slide XML `blob`, as given by its text frame."""
+    notes_shape_id = None
+    paragraph_texts: list[str] = []
+    for shape_id, _, ph_type, text in _iter_paragraphs(blob):
+        if ph_type != "body":
+            continue
+        # -- the notes placeholder is the first body placeholder --
+        if not paragraph_texts:
+            notes_shape_id = shape_id
+        elif shape_id != notes_shape_id:
+            break
+        paragraph_texts.append(text)
+    return "\n".join(paragraph_texts)
+
+
+def _paragraph_text(p: etree._Element) -> str:  # pyright: ignore[reportPrivateUsage]
+    """Text of `a:p` element `p`, as given by the `.text` property of a paragraph."""
+    return "".join(
+        "\v" if child.tag == _a_br else (child.findtext(_a_t) or "")
+        for child in p
+        if child.tag in _text_tags
+    )
+
+
+def _rels(package_reader: PackageReader, partname: PackURI) -> dict[str, tuple[str, PackURI]]:
+    """dict {rId: (reltype, target_partname)} of the internal relationships of `partname`."""
+    rels_xml = package_reader.rels_xml_for(partname)
+    if rels_xml is None:
+        return {}
+    base_uri = partname.baseURI
+    return {
+        rel.rId: (rel.reltype, PackURI.from_rel_ref(base_uri, rel.target_ref))
+        for rel in cast(CT_Relationships, parse_xml(rels_xml)).relationship_lst
+        if rel.targetMode != RTM.EXTERNAL
+    }
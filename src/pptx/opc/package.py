@@ -7,15 +7,37 @@ presentations to and from a .pptx file.
 from __future__ import annotations
 
 import collections
-from typing import IO, TYPE_CHECKING, DefaultDict, Iterator, Mapping, Set, cast
-
+import copy
+import os
+import posixpath
+import re
+import shutil
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Counter,
+    DefaultDict,
+    Deque,
+    Iterable,
+    Iterator,
+    Mapping,
+    Set,
+    cast,
+)
+
+from pptx.exc import ReadOnlyError
 from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.oxml import CT_Relationships, serialize_part_xml
 from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
-from pptx.opc.serialized import PackageReader, PackageWriter
+from pptx.opc.serialized import MemberBlob, PackageReader, PackageWriter
 from pptx.opc.shared import CaseInsensitiveDict
 from pptx.oxml import parse_xml
+from pptx.oxml.xmlchemy import mark_read_only, rel_ref_counts
 from pptx.util import lazyproperty
 
 if TYPE_CHECKING:
@@ -73,13 +95,81 @@ class OpcPackage(_RelatableMixin):
     file or file-like object containing a package (.pptx file).
     """
 
-    def __init__(self, pkg_file: str | IO[bytes]):
+    def __init__(self, pkg_file: str | IO[bytes], read_only: bool = False):
         self._pkg_file = pkg_file
+        self._read_only = read_only
+        # -- only a lazily-loaded package holds on to its package reader --
+        self._package_reader: PackageReader | None = None
+        # -- built on first use, see `._partnames` --
+        self._partname_index: _PartnameIndex | None = None
+        # -- the parts whose partname is in the partname index --
+        self._indexed_parts: set[Part] = set()
+        # -- kept current as relationships are added and dropped, see `.register_rel()` --
+        self._part_references = _PartReferences()
+        # -- discarded when any relationship in this package changes, see `._part_graph` --
+        self._part_graph_cache: _PartGraph | None = None
 
     @classmethod
-    def open(cls, pkg_file: str | IO[bytes]) -> Self:
-        """Return an |OpcPackage| instance loaded with the contents of `pkg_file`."""
-        return cls(pkg_file)._load()
+    def open(
+        cls,
+        pkg_file: str | IO[bytes],
+        lazy: bool = False,
+        workers: int | None = None,
+        read_only: bool = False,
+    ) -> Self:
+        """Return an |OpcPackage| instance loaded with the contents of `pkg_file`.
+
+        When `lazy` is True, `pkg_file` is held open after loading and the bytes of each binary
+        part (image, media, etc.) are only read from it when that part's blob is first needed. A
+        package loaded this way should be closed with :meth:`close` when no longer needed.
+
+        When `workers` is greater than 1, the XML of every XML part is parsed while loading, on
+        that many threads, rather than each part being parsed on first access.
+
+        When `read_only` is True, the package is loaded lazily and cannot be changed or saved,
+        see :attr:`read_only`.
+        """
+        return cls(pkg_file, read_only)._load(lazy or read_only, workers)
+
+    def check_writable(self) -> None:
+        """Raise |ReadOnlyError| when this package was opened read-only."""
+        if self._read_only:
+            raise ReadOnlyError("presentation was opened read-only and cannot be changed")
+
+    def clone(self, share: bool = False) -> Self:
+        """Return a new package having a copy of each part and relationship in this package.
+
+        The copy is independent of this package; changing either one does not change the other.
+        Parsed XML is copied as a tree rather than reparsed, and binary parts share their (bytes)
+        blob, so this is much faster than loading the same package again.
+
+        When `share` is True, the copy is copy-on-access: each of its XML parts shares the parsed
+        XML of the part it copies until that XML is first accessed in the copy. Parts never used,
+        like most slide layouts of a large template, are then never copied. This package must not
+        change at all while any such copy exists.
+
+        A copy of a read-only package is read-only too.
+        """
+        package = type(self)(self._pkg_file, self._read_only)
+        clones = {part: part.clone(cast("Package", package), share) for part in self.iter_parts()}
+        package._rels.load_from_rels(self._rels, clones)
+        for part, clone in clones.items():
+            clone.rels.load_from_rels(part.rels, clones)
+        if self._read_only:
+            package._rels.read_only = True
+            for clone in clones.values():
+                clone.rels.read_only = True
+        return package
+
+    def close(self) -> None:
+        """Release the package file this package was loaded from.
+
+        Only a lazily-loaded package holds its package file open after loading. Blobs of binary
+        parts not yet read can no longer be loaded once the package is closed.
+        """
+        if self._package_reader is not None:
+            self._package_reader.close()
+            self._package_reader = None
 
     def drop_rel(self, rId: str) -> None:
         """Remove relationship identified by `rId`."""
@@ -87,40 +177,47 @@ class OpcPackage(_RelatableMixin):
 
     def iter_parts(self) -> Iterator[Part]:
         """Generate exactly one reference to each part in the package."""
-        visited: Set[Part] = set()
-        for rel in self.iter_rels():
-            if rel.is_external:
-                continue
-            part = rel.target_part
-            if part in visited:
-                continue
-            yield part
-            visited.add(part)
+        return iter(self._part_graph.parts)
 
     def iter_rels(self) -> Iterator[_Relationship]:
         """Generate exactly one reference to each relationship in package.
 
-        Performs a depth-first traversal of the rels graph.
+        Relationships are generated in the order of a depth-first traversal of the rels graph.
         """
-        visited: Set[Part] = set()
+        return iter(self._part_graph.rels)
 
-        def walk_rels(rels: _Relationships) -> Iterator[_Relationship]:
-            for rel in rels.values():
-                yield rel
-                # --- external items can have no relationships ---
-                if rel.is_external:
-                    continue
-                # -- all relationships other than those for the package belong to a part. Once
-                # -- that part has been processed, processing it again would lead to the same
-                # -- relationships appearing more than once.
-                part = rel.target_part
-                if part in visited:
-                    continue
-                visited.add(part)
-                # --- recurse into relationships of each unvisited target-part ---
-                yield from walk_rels(part.rels)
+    def iter_target_parts(self, *reltypes: str) -> Iterator[Part]:
+        """Generate exactly one reference to each part targeted by a relationship in `reltypes`.
+
+        Relationships of each reltype are taken in `reltypes` order, each in the order generated
+        by :meth:`iter_rels`. A part related by more than one of them is generated only once.
+        """
+        return iter(self._part_graph.target_parts(reltypes))
 
-        yield from walk_rels(self._rels)
+    def iter_source_parts(self, target_part: Part, *reltypes: str) -> Iterator[Part]:
+        """Generate exactly one reference to each part relating to `target_part` by `reltypes`.
+
+        This is the reverse of following a relationship, like finding the slides based on a slide
+        layout. Parts relating by each reltype are taken in `reltypes` order, each in the order
+        their relationships were added. The package itself is not a part and is never generated.
+
+        The relationships to each part are indexed as they are added and dropped, so this does not
+        walk the package. A part that has left the package but still relates to `target_part`,
+        like a slide dropped from the presentation, is also generated.
+        """
+        return iter(self._part_references.source_parts(target_part, reltypes))
+
+    @property
+    def read_only(self) -> bool:
+        """True when this package was opened read-only.
+
+        A read-only package reads the bytes of each part from the package file only when needed,
+        so it must be closed when no longer needed. Its parts, their relationships and their XML
+        cannot be changed, doing so through this library raises |ReadOnlyError|, as does saving
+        it. Because its XML never changes, a parsed part can be read from any number of threads,
+        and a part no longer needed can be released, to be parsed again if it is used again.
+        """
+        return self._read_only
 
     @property
     def main_document_part(self) -> PresentationPart:
@@ -137,57 +234,476 @@ class OpcPackage(_RelatableMixin):
         to be used to insert the integer portion of the partname. Example:
         '/ppt/slides/slide%d.xml'
         """
-        # --- expected next partname is tmpl % n where n is one greater than the number
-        # --- of existing partnames that match tmpl. Speed up finding the next one
-        # --- (maybe) by searching from the end downward rather than from 1 upward.
-        prefix = tmpl[: (tmpl % 42).find("42")]
-        partnames = {p.partname for p in self.iter_parts() if p.partname.startswith(prefix)}
-        for n in range(len(partnames) + 1, 0, -1):
-            candidate_partname = tmpl % n
-            if candidate_partname not in partnames:
-                return PackURI(candidate_partname)
-        raise Exception("ProgrammingError: ran out of candidate_partnames")  # pragma: no cover
+        return PackURI(self._partnames.next_partname(tmpl))
+
+    def register_rel(self, rel: _Relationship, source_part: Part | None) -> None:
+        """Note that `rel` has been added to the relationships of `source_part`.
 
-    def save(self, pkg_file: str | IO[bytes]) -> None:
+        `source_part` is |None| for a relationship of the package itself. A part takes its
+        partname when the first relationship to it is added, so a part that is constructed but
+        never related to does not hold a partname.
+        """
+        self._part_graph_cache = None
+        if rel.is_external:
+            return
+        target_part = rel.target_part
+        is_first_rel = self._part_references.add(rel, source_part)
+        if self._partname_index is None or target_part in self._indexed_parts:
+            return
+        if is_first_rel:
+            self._partname_index.add(target_part.partname)
+            self._indexed_parts.add(target_part)
+            return
+        # -- a part found to have left the package is related to again, along with any parts
+        # -- only it relates to, so the partname index is rebuilt on next use.
+        self._partname_index = None
+
+    def rename_partname(self, part: Part, partname: str) -> None:
+        """Note that `part` is being renamed to `partname`, from the partname it has now."""
+        if self._partname_index is not None and part in self._indexed_parts:
+            self._partname_index.remove(part.partname)
+            self._partname_index.add(partname)
+
+    def unregister_rel(self, rel: _Relationship) -> None:
+        """Note that `rel` has been dropped from the relationships of a part or this package.
+
+        A part no longer related to by any relationship has left the package, so its partname
+        is available again. A part still related to may have left the package too, when only
+        parts no longer in the package relate to it, like a slide dropped from the presentation
+        that its notes slide still relates to. Finding that takes a walk of the package, so the
+        partname index is instead rebuilt from the parts in the package on its next use.
+        """
+        self._part_graph_cache = None
+        if rel.is_external:
+            return
+        if self._part_references.remove(rel):
+            self._drop_part(rel.target_part)
+        elif rel.target_part in self._part_references:
+            self._partname_index = None
+
+    def save(
+        self,
+        pkg_file: str | IO[bytes],
+        workers: int | None = None,
+        compression: int | None = None,
+        incremental: bool = False,
+    ) -> None:
         """Save this package to `pkg_file`.
 
-        `file` can be either a path to a file (a string) or a file-like object.
+        `file` can be either a path to a file (a string) or a file-like object. When `workers` is
+        greater than 1, package items are compressed on that many threads. `compression` is an
+        optional deflate level, also causing already-compressed media to be stored uncompressed.
+
+        When `incremental` is True and `pkg_file` is the path of an existing zip package, that
+        file is updated in place, appending only the package items it does not already hold.
+        Items are then compressed on the calling thread, so `workers` cannot be used with
+        `incremental` and raises |ValueError|.
+        """
+        if incremental and workers is not None and workers > 1:
+            raise ValueError("workers cannot be used with an incremental save")
+        self.check_writable()
+        parts = tuple(self.iter_parts())
+
+        if incremental and isinstance(pkg_file, str) and zipfile.is_zipfile(pkg_file):
+            PackageWriter.update(pkg_file, self._rels, parts, compression)
+            return
+
+        if self._is_pkg_file(pkg_file):
+            if self._package_reader is not None and self._is_zip_path(pkg_file):
+                self._replace_pkg_file(cast(str, pkg_file), parts, workers, compression)
+                return
+            # -- parts of a lazily-loaded package may still need to read their blob from the
+            # -- package file, so read them all in before that same file is overwritten.
+            for part in parts:
+                part.load_blob()
+
+        PackageWriter.write(pkg_file, self._rels, parts, workers, compression)
+
+    def iter_save(
+        self, workers: int | None = None, compression: int | None = None
+    ) -> Iterator[bytes]:
+        """Generate the bytes of this package serialized as a .pptx file, in chunks.
+
+        Chunks are generated as each part is serialized, so the first arrive before the last part
+        is written. `workers` and `compression` have the same meaning as for :meth:`save`.
         """
-        PackageWriter.write(pkg_file, self._rels, tuple(self.iter_parts()))
+        self.check_writable()
+        return PackageWriter.iter_write(self._rels, tuple(self.iter_parts()), workers, compression)
+
+    def _drop_part(self, part: Part) -> None:
+        """Remove `part`, to which no relationship remains, from the indexes of this package.
 
-    def _load(self) -> Self:
-        """Return the package after loading all parts and relationships."""
-        pkg_xml_rels, parts = _PackageLoader.load(self._pkg_file, cast("Package", self))
+        This is also called for each part found to have left the package while a relationship to
+        it remains, when the partname index is rebuilt. This package only indexes partnames, a
+        subtype can extend this to remove the part from any part indexes of its own.
+        """
+        if self._partname_index is not None and part in self._indexed_parts:
+            self._partname_index.remove(part.partname)
+            self._indexed_parts.discard(part)
+
+    def _is_pkg_file(self, pkg_file: str | IO[bytes]) -> bool:
+        """True when `pkg_file` is the file (path or stream) this package was loaded from."""
+        if pkg_file is self._pkg_file:
+            return True
+        if isinstance(pkg_file, str) and isinstance(self._pkg_file, str):
+            return os.path.exists(pkg_file) and os.path.samefile(pkg_file, self._pkg_file)
+        return False
+
+    @staticmethod
+    def _is_zip_path(pkg_file: str | IO[bytes]) -> bool:
+        """True when `pkg_file` is the path of a file, which is then a zip package."""
+        return isinstance(pkg_file, str) and os.path.isfile(pkg_file)
+
+    def _load(self, lazy: bool = False, workers: int | None = None) -> Self:
+        """Return the package after loading all parts and relationships.
+
+        The package file is closed after loading unless `lazy` is True, in which case parts may
+        still need to read their blob from it.
+        """
+        package_reader = PackageReader(self._pkg_file)
+        pkg_xml_rels, parts = _PackageLoader.load(
+            package_reader, cast("Package", self), lazy, workers
+        )
         self._rels.load_from_xml(PACKAGE_URI, pkg_xml_rels, parts)
+        if self._read_only:
+            self._rels.read_only = True
+            for part in parts.values():
+                part.rels.read_only = True
+        if lazy:
+            self._package_reader = package_reader
+        else:
+            package_reader.close()
         return self
 
+    @property
+    def _part_graph(self) -> _PartGraph:
+        """|_PartGraph| of the parts and relationships currently reachable from this package.
+
+        The graph is walked once and reused until a relationship of this package or one of its
+        parts changes, so repeated queries between changes, like those for all image parts, do
+        not each walk the graph again. Changes to another package do not affect it.
+        """
+        part_graph = self._part_graph_cache
+        if part_graph is None:
+            part_graph = self._part_graph_cache = _PartGraph(tuple(self._walk_rels()))
+        return part_graph
+
+    @property
+    def _partnames(self) -> _PartnameIndex:
+        """|_PartnameIndex| of the partnames of the parts in this package.
+
+        The index is built from the parts in the package on first use. It is kept current from
+        then on as parts are related to, dropped and renamed, so allocating a partname needs no
+        package scan. It is rebuilt when a part may have left the package while still related to,
+        see :meth:`unregister_rel`, and each related part found not to be in the package is
+        dropped from the part indexes.
+        """
+        partname_index = self._partname_index
+        if partname_index is None:
+            parts = set(self.iter_parts())
+            partname_index = self._partname_index = _PartnameIndex(p.partname for p in parts)
+            self._indexed_parts = parts
+            for part in list(self._part_references.iter_parts()):
+                if part not in parts:
+                    self._drop_part(part)
+        return partname_index
+
+    def _replace_pkg_file(
+        self,
+        pkg_file: str,
+        parts: tuple[Part, ...],
+        workers: int | None,
+        compression: int | None,
+    ) -> None:
+        """Save this lazily-loaded package over `pkg_file`, the package file it was loaded from.
+
+        The package is written to a temporary file beside `pkg_file` which then replaces it, so
+        parts still in the package file are copied across without all being read into memory
+        first. Those parts are then pointed at their member in the new package file.
+        """
+        fd, tmp_path = tempfile.mkstemp(
+            suffix=".pptx", dir=os.path.dirname(os.path.abspath(pkg_file))
+        )
+        os.close(fd)
+        try:
+            PackageWriter.write(tmp_path, self._rels, parts, workers, compression)
+            shutil.copymode(pkg_file, tmp_path)
+            self.close()
+            os.replace(tmp_path, pkg_file)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        package_reader = self._package_reader = PackageReader(pkg_file)
+        for part in parts:
+            if part.member_blob is not None:
+                part.relocate_blob(package_reader.member_blob(part.partname))
+
     @lazyproperty
     def _rels(self) -> _Relationships:
         """|Relationships| object containing relationships of this package."""
-        return _Relationships(PACKAGE_URI.baseURI)
+        return _Relationships(PACKAGE_URI.baseURI, self)
+
+    def _walk_rels(self) -> Iterator[_Relationship]:
+        """Generate exactly one reference to each relationship in package.
+
+        Performs a depth-first traversal of the rels graph. The traversal keeps its own stack
+        rather than recursing, so a long chain of parts, like slides each linking to the next,
+        cannot exceed the recursion limit.
+        """
+        visited: Set[Part] = set()
+        # -- the relationships still to be generated of each part on the current path --
+        stack: list[Iterator[_Relationship]] = [iter(self._rels.values())]
+
+        while stack:
+            rel = next(stack[-1], None)
+            if rel is None:
+                stack.pop()
+                continue
+            yield rel
+            # --- external items can have no relationships ---
+            if rel.is_external:
+                continue
+            # -- all relationships other than those for the package belong to a part. Once that
+            # -- part has been processed, processing it again would lead to the same relationships
+            # -- appearing more than once.
+            part = rel.target_part
+            if part in visited:
+                continue
+            visited.add(part)
+            # --- descend into relationships of each unvisited target-part ---
+            stack.append(iter(part.rels.values()))
+
+
+class _PartGraph:
+    """The relationships of a package and the parts they reach, as of when `rels` were collected.
+
+    The graph no longer describes the package once any of its relationships change, the package
+    then discards it.
+    """
+
+    def __init__(self, rels: tuple[_Relationship, ...]):
+        self.rels = rels
+        self._target_parts: dict[tuple[str, ...], tuple[Part, ...]] = {}
+
+    @lazyproperty
+    def parts(self) -> tuple[Part, ...]:
+        """Each part in the package, once, in the order first reached."""
+        return tuple(dict.fromkeys(rel.target_part for rel in self.rels if not rel.is_external))
+
+    def target_parts(self, reltypes: tuple[str, ...]) -> tuple[Part, ...]:
+        """Each part targeted by an internal relationship of a reltype in `reltypes`, once."""
+        target_parts = self._target_parts.get(reltypes)
+        if target_parts is None:
+            rels_by_reltype = self._rels_by_reltype
+            target_parts = self._target_parts[reltypes] = tuple(
+                dict.fromkeys(
+                    rel.target_part
+                    for reltype in reltypes
+                    for rel in rels_by_reltype.get(reltype, ())
+                    if not rel.is_external
+                )
+            )
+        return target_parts
+
+    @lazyproperty
+    def _rels_by_reltype(self) -> dict[str, list[_Relationship]]:
+        """dict {reltype: [rels]} of all relationships in the package."""
+        rels_by_reltype: DefaultDict[str, list[_Relationship]] = collections.defaultdict(list)
+        for rel in self.rels:
+            rels_by_reltype[rel.reltype].append(rel)
+        return dict(rels_by_reltype)
+
+
+class _PartReferences:
+    """Index of the internal relationships to each part of a package.
+
+    Each relationship to a part is recorded along with the part it belongs to, |None| for a
+    relationship of the package itself. A part is in the index while any relationship to it
+    remains.
+    """
+
+    def __init__(self):
+        self._rels_by_target: dict[Part, dict[_Relationship, Part | None]] = {}
+
+    def __contains__(self, part: object) -> bool:
+        """True when a relationship to `part` is in the index."""
+        return part in self._rels_by_target
+
+    def add(self, rel: _Relationship, source_part: Part | None) -> bool:
+        """Add internal relationship `rel` of `source_part`, True when it is the first to its part.
+
+        Adding a relationship already in the index has no effect.
+        """
+        rels = self._rels_by_target.get(rel.target_part)
+        if rels is None:
+            self._rels_by_target[rel.target_part] = {rel: source_part}
+            return True
+        rels[rel] = source_part
+        return False
+
+    def iter_parts(self) -> Iterator[Part]:
+        """Generate each part having a relationship to it."""
+        return iter(self._rels_by_target)
+
+    def remove(self, rel: _Relationship) -> bool:
+        """Remove internal relationship `rel`, True when it was the last to its part.
+
+        Removing a relationship not in the index has no effect.
+        """
+        target_part = rel.target_part
+        rels = self._rels_by_target.get(target_part)
+        if rels is None or rel not in rels:
+            return False
+        del rels[rel]
+        if rels:
+            return False
+        del self._rels_by_target[target_part]
+        return True
+
+    def source_parts(self, target_part: Part, reltypes: tuple[str, ...]) -> tuple[Part, ...]:
+        """Each part having an internal relationship of a reltype in `reltypes` to `target_part`.
+
+        Parts are taken in `reltypes` order, each in the order its relationship was added. The
+        package, having no part, is skipped.
+        """
+        rels = self._rels_by_target.get(target_part, {})
+        return tuple(
+            dict.fromkeys(
+                source_part
+                for reltype in reltypes
+                for rel, source_part in rels.items()
+                if rel.reltype == reltype and source_part is not None
+            )
+        )
+
+
+class _PartnameIndex:
+    """Index of the partnames in a package, for allocating available partnames.
+
+    A partname having a numeric index, like "/ppt/slides/slide21.xml", is also indexed under its
+    prefix, the partname up to that index ("/ppt/slides/slide"), so the indexes in use for a
+    prefix are known without a scan of the package. A partname is counted each time it is added,
+    so one part being renamed to the partname of another that is then renamed itself, as slide
+    parts are when slides are reordered, is recorded accurately.
+    """
+
+    _idx_re = re.compile(r"^(.*\D)(\d+)$")
+
+    def __init__(self, partnames: Iterable[str]):
+        self._partnames: Counter[str] = collections.Counter()
+        self._idxs: DefaultDict[str, Counter[int]] = collections.defaultdict(collections.Counter)
+        # -- number of distinct partnames indexed under each prefix --
+        self._prefix_counts: Counter[str] = collections.Counter()
+        # -- lowest index for a prefix that might be available, all below it are in use --
+        self._lowest_free_idxs: dict[str, int] = {}
+        for partname in partnames:
+            self.add(partname)
+
+    def add(self, partname: str) -> None:
+        """Add `partname` to the index."""
+        self._partnames[partname] += 1
+        prefix, idx = self._split(partname)
+        if prefix is None:
+            return
+        self._idxs[prefix][idx] += 1
+        if self._partnames[partname] == 1:
+            self._prefix_counts[prefix] += 1
+
+    def first_available_idx(self, prefix: str) -> int:
+        """Return the lowest index, starting at 1, not in use by a partname having `prefix`."""
+        idxs = self._idxs[prefix]
+        idx = self._lowest_free_idxs.get(prefix, 1)
+        while idx in idxs:
+            idx += 1
+        self._lowest_free_idxs[prefix] = idx
+        return idx
+
+    def next_partname(self, tmpl: str) -> str:
+        """Return next available partname matching printf-style template `tmpl`.
+
+        This is `tmpl % n` where n is one greater than the number of partnames having its prefix,
+        or the next lower n that is available when that one is taken. This is the partname a
+        scan of the package parts has always given, which is not always the lowest one available,
+        "/ppt/slides/slide3.xml" rather than "slide2.xml" when "slide1.xml" and "slide4.xml"
+        are taken.
+        """
+        prefix = tmpl[: (tmpl % 42).find("42")]
+        for n in range(self._prefix_counts[prefix] + 1, 0, -1):
+            candidate_partname = tmpl % n
+            if candidate_partname not in self._partnames:
+                return candidate_partname
+        raise Exception("ProgrammingError: ran out of candidate_partnames")  # pragma: no cover
+
+    def remove(self, partname: str) -> None:
+        """Remove one occurrence of `partname` from the index.
+
+        Removing a partname not in the index has no effect.
+        """
+        if partname not in self._partnames:
+            return
+        self._decrement(self._partnames, partname)
+        prefix, idx = self._split(partname)
+        if prefix is None:
+            return
+        if partname not in self._partnames:
+            self._decrement(self._prefix_counts, prefix)
+        self._decrement(self._idxs[prefix], idx)
+        if idx not in self._idxs[prefix] and idx < self._lowest_free_idxs.get(prefix, 1):
+            self._lowest_free_idxs[prefix] = idx
+
+    @staticmethod
+    def _decrement(counter: Counter[str] | Counter[int], key: str | int) -> None:
+        """Decrement count of `key` in `counter`, removing it when its count reaches zero."""
+        counter[key] -= 1  # pyright: ignore[reportArgumentType]
+        if counter[key] <= 0:  # pyright: ignore[reportArgumentType]
+            del counter[key]  # pyright: ignore[reportArgumentType]
+
+    @classmethod
+    def _split(cls, partname: str) -> tuple[str | None, int]:
+        """Return (prefix, idx) pair for `partname`, prefix is |None| when it has no index."""
+        match = cls._idx_re.match(posixpath.splitext(partname)[0])
+        if match is None:
+            return None, 0
+        return match.group(1), int(match.group(2))
 
 
 class _PackageLoader:
     """Function-object that loads a package from disk (or other store)."""
 
-    def __init__(self, pkg_file: str | IO[bytes], package: Package):
-        self._pkg_file = pkg_file
+    def __init__(
+        self,
+        package_reader: PackageReader,
+        package: Package,
+        lazy: bool = False,
+        workers: int | None = None,
+    ):
+        self._package_reader = package_reader
         self._package = package
+        self._lazy = lazy
+        self._workers = workers
 
     @classmethod
     def load(
-        cls, pkg_file: str | IO[bytes], package: Package
+        cls,
+        package_reader: PackageReader,
+        package: Package,
+        lazy: bool = False,
+        workers: int | None = None,
     ) -> tuple[CT_Relationships, dict[PackURI, Part]]:
-        """Return (pkg_xml_rels, parts) pair resulting from loading `pkg_file`.
+        """Return (pkg_xml_rels, parts) pair resulting from loading the package in `package_reader`.
 
         The returned `parts` value is a {partname: part} mapping with each part in the package
         included and constructed complete with its relationships to other parts in the package.
+        When `lazy` is True, each part receives a |MemberBlob| in place of its bytes so reading
+        its blob is deferred until it is needed. When `workers` is greater than 1, the XML parts
+        are parsed before returning, on that many threads.
 
         The returned `pkg_xml_rels` value is a `CT_Relationships` object containing the parsed
         package relationships. It is the caller's responsibility (the package object) to load
         those relationships into its |_Relationships| object.
         """
-        return cls(pkg_file, package)._load()
+        return cls(package_reader, package, lazy, workers)._load()
 
     def _load(self) -> tuple[CT_Relationships, dict[PackURI, Part]]:
         """Return (pkg_xml_rels, parts) pair resulting from loading pkg_file."""
@@ -196,6 +712,9 @@ class _PackageLoader:
         for partname, part in parts.items():
             part.load_rels_from_xml(xml_rels[partname], parts)
 
+        if self._workers is not None and self._workers > 1:
+            self._parse_xml_parts(parts.values())
+
         return xml_rels[PACKAGE_URI], parts
 
     @lazyproperty
@@ -206,10 +725,17 @@ class _PackageLoader:
         """
         return _ContentTypeMap.from_xml(self._package_reader[CONTENT_TYPES_URI])
 
-    @lazyproperty
-    def _package_reader(self) -> PackageReader:
-        """|PackageReader| object providing access to package-items in pkg_file."""
-        return PackageReader(self._pkg_file)
+    def _parse_xml_parts(self, parts: Iterable[Part]) -> None:
+        """Parse the XML of each XML part in `parts` on a pool of worker threads.
+
+        lxml releases the GIL while parsing, so parts are parsed concurrently. Each part is
+        parsed on one thread only, and is not otherwise accessed until all are parsed.
+        """
+        xml_parts = [part for part in parts if isinstance(part, XmlPart)]
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            # -- consume the results so an exception raised while parsing is raised here --
+            for _ in executor.map(XmlPart.parse, xml_parts):
+                pass
 
     @lazyproperty
     def _parts(self) -> dict[PackURI, Part]:
@@ -222,13 +748,14 @@ class _PackageLoader:
         content_types = self._content_types
         package = self._package
         package_reader = self._package_reader
+        load_blob = package_reader.member_blob if self._lazy else package_reader.__getitem__
 
         return {
             partname: PartFactory(
                 partname,
                 content_types[partname],
                 package,
-                blob=package_reader[partname],
+                blob=load_blob(partname),
             )
             for partname in (p for p in self._xml_rels if p != "/")
             # -- invalid partnames can arise in some packages; ignore those rather than raise an
@@ -241,27 +768,27 @@ class _PackageLoader:
         """dict {partname: xml_rels} for package and all package parts.
 
         This is used as the basis for other loading operations such as loading parts and
-        populating their relationships.
+        populating their relationships. The relationships are traversed breadth-first from a work
+        queue rather than by recursion, so no package is too deeply linked to load.
         """
         xml_rels: dict[PackURI, CT_Relationships] = {}
-        visited_partnames: Set[PackURI] = set()
+        discovered_partnames: Set[PackURI] = {PACKAGE_URI}
+        pending_partnames: Deque[PackURI] = collections.deque((PACKAGE_URI,))
 
-        def load_rels(source_partname: PackURI, rels: CT_Relationships):
-            """Populate `xml_rels` dict by traversing relationships depth-first."""
-            xml_rels[source_partname] = rels
-            visited_partnames.add(source_partname)
+        while pending_partnames:
+            source_partname = pending_partnames.popleft()
+            rels = xml_rels[source_partname] = self._xml_rels_for(source_partname)
             base_uri = source_partname.baseURI
 
-            # --- recursion stops when there are no unvisited partnames in rels ---
             for rel in rels.relationship_lst:
                 if rel.targetMode == RTM.EXTERNAL:
                     continue
                 target_partname = PackURI.from_rel_ref(base_uri, rel.target_ref)
-                if target_partname in visited_partnames:
+                if target_partname in discovered_partnames:
                     continue
-                load_rels(target_partname, self._xml_rels_for(target_partname))
+                discovered_partnames.add(target_partname)
+                pending_partnames.append(target_partname)
 
-        load_rels(PACKAGE_URI, self._xml_rels_for(PACKAGE_URI))
         return xml_rels
 
     def _xml_rels_for(self, partname: PackURI) -> CT_Relationships:
@@ -287,16 +814,22 @@ class Part(_RelatableMixin):
     """
 
     def __init__(
-        self, partname: PackURI, content_type: str, package: Package, blob: bytes | None = None
+        self,
+        partname: PackURI,
+        content_type: str,
+        package: Package,
+        blob: bytes | MemberBlob | None = None,
     ):
-        # --- XmlPart subtypes, don't store a blob (the original XML) ---
+        # --- XmlPart subtypes only hold a blob (the original XML) until it is parsed ---
         self._partname = partname
         self._content_type = content_type
         self._package = package
         self._blob = blob
 
     @classmethod
-    def load(cls, partname: PackURI, content_type: str, package: Package, blob: bytes) -> Self:
+    def load(
+        cls, partname: PackURI, content_type: str, package: Package, blob: bytes | MemberBlob
+    ) -> Self:
         """Return `cls` instance loaded from arguments.
 
         This one is a straight pass-through, but subtypes may do some pre-processing, see XmlPart
@@ -320,8 +853,17 @@ class Part(_RelatableMixin):
         In particular, the |XmlPart| subclass uses its `self._element` to serialize a blob on
         demand. This works fine for binary parts though.
         """
+        self._check_writable()
         self._blob = blob
 
+    def clone(self, package: Package, share: bool = False) -> Self:
+        """Return a copy of this part belonging to `package`, without its relationships.
+
+        A binary part shares its (immutable) blob with its copy whatever the value of `share`,
+        which only affects how XML parts are copied.
+        """
+        return type(self).load(self._partname, self._content_type, package, self._blob or b"")
+
     @lazyproperty
     def content_type(self) -> str:
         """Content-type (MIME-type) of this part."""
@@ -336,6 +878,32 @@ class Part(_RelatableMixin):
         """
         self._rels.load_from_xml(self._partname.baseURI, xml_rels, parts)
 
+    def load_blob(self) -> None:
+        """Read the blob of this part into memory now rather than when it is first needed.
+
+        After this call the part no longer depends on the package file it was loaded from, which
+        also means it loses its |MemberBlob| and so is no longer eligible for pass-through on save.
+        """
+        self._blob = self._blob
+
+    def relocate_blob(self, member_blob: MemberBlob) -> None:
+        """Read the blob of this unchanged part from `member_blob` from now on.
+
+        Used when the package file this part was loaded from is replaced by one holding the same
+        bytes for this part, as `member_blob`.
+        """
+        self._blob = member_blob
+
+    @property
+    def member_blob(self) -> MemberBlob | None:
+        """|MemberBlob| of the package member this part was loaded from, while still unchanged.
+
+        |None| when the part was not loaded lazily from a package file, or when its blob or XML
+        may have changed since loading. A part having a member-blob can be saved by copying that
+        package member across unchanged.
+        """
+        return self._member_blob
+
     @lazyproperty
     def package(self) -> Package:
         """Package this part belongs to."""
@@ -352,6 +920,9 @@ class Part(_RelatableMixin):
             raise TypeError(  # pragma: no cover
                 "partname must be instance of PackURI, got '%s'" % type(partname).__name__
             )
+        self._check_writable()
+        if self._package is not None:
+            self._package.rename_partname(self, partname)
         self._partname = partname
 
     @lazyproperty
@@ -373,10 +944,33 @@ class Part(_RelatableMixin):
             file.seek(0)
         return file.read()
 
+    @property
+    def _blob(self) -> bytes | None:
+        """Bytes of this part, or |None| when it has none.
+
+        A part loaded lazily holds a |MemberBlob| until its bytes are first needed; they are read
+        from the package at that point and retained. The member-blob itself is retained until a
+        new blob is assigned, so an unchanged part can still be copied across on save.
+        """
+        blob = self._blob_src
+        if isinstance(blob, MemberBlob):
+            blob = self._blob_src = blob.load()
+        return blob
+
+    @_blob.setter
+    def _blob(self, blob: bytes | MemberBlob | None):
+        self._blob_src = blob
+        self._member_blob = blob if isinstance(blob, MemberBlob) else None
+
+    def _check_writable(self) -> None:
+        """Raise |ReadOnlyError| when this part belongs to a read-only package."""
+        if self._package is not None:
+            self._package.check_writable()
+
     @lazyproperty
     def _rels(self) -> _Relationships:
         """Relationships from this part to others."""
-        return _Relationships(self._partname.baseURI)
+        return _Relationships(self._partname.baseURI, self._package, self)
 
 
 class XmlPart(Part):
@@ -387,25 +981,78 @@ class XmlPart(Part):
     """
 
     def __init__(
-        self, partname: PackURI, content_type: str, package: Package, element: BaseOxmlElement
+        self,
+        partname: PackURI,
+        content_type: str,
+        package: Package,
+        element: BaseOxmlElement | None = None,
+        blob: bytes | MemberBlob | None = None,
     ):
-        super(XmlPart, self).__init__(partname, content_type, package)
-        self._element = element
+        super(XmlPart, self).__init__(partname, content_type, package, blob)
+        self._parsed_element = element
+        # -- parsed XML of another part, shared read-only until first access, see `.clone()` --
+        self._shared_element: BaseOxmlElement | None = None
+        # -- XML parsed ahead of first access, the blob stays current until then, see `.parse()` --
+        self._preparsed_element: BaseOxmlElement | None = None
+        # -- held while this part of a read-only package is parsed, see `._parse_read_only()` --
+        self._parse_lock = threading.Lock()
 
     @classmethod
-    def load(cls, partname: PackURI, content_type: str, package: Package, blob: bytes):
-        """Return instance of `cls` loaded with parsed XML from `blob`."""
-        return cls(
-            partname, content_type, package, element=cast("BaseOxmlElement", parse_xml(blob))
-        )
+    def load(cls, partname: PackURI, content_type: str, package: Package, blob: bytes | MemberBlob):
+        """Return instance of `cls` holding the XML in `blob`, to be parsed on first access.
+
+        Parsing is deferred so loading a package does not pay to parse parts that are never used.
+        """
+        return cls(partname, content_type, package, blob=blob)
 
     @property
     def blob(self) -> bytes:  # pyright: ignore[reportIncompatibleMethodOverride]
-        """bytes XML serialization of this part."""
+        """bytes XML serialization of this part.
+
+        A loaded part that has never been parsed cannot have changed, so its original XML is
+        returned unchanged rather than being parsed and reserialized. Likewise a part still
+        sharing the XML of the part it was cloned from serializes that XML without copying it.
+        """
+        if self._parsed_element is None:
+            if self._blob_src is not None:
+                return cast(bytes, self._blob)
+            if self._shared_element is not None:
+                return serialize_part_xml(self._shared_element)
         return serialize_part_xml(self._element)
 
     # -- XmlPart cannot set its blob, which is why pyright complains --
 
+    def clone(self, package: Package, share: bool = False) -> Self:
+        """Return a copy of this part belonging to `package`, without its relationships.
+
+        The XML of a part that has been parsed is copied as an element tree, avoiding a reparse.
+        When `share` is True, that tree is not copied until the XML of the copy is first accessed,
+        so a copy that is only saved never copies it at all. This part must then never change.
+        """
+        element = self._parsed_element
+        if element is None:
+            element = self._shared_element
+        if element is not None and self._package is not None and self._package.read_only:
+            # -- the XML of a read-only package never changes, so its copy can use it as is --
+            return type(self)(self._partname, self._content_type, package, element=element)
+        if element is None:
+            preparsed_element = self._preparsed_element
+            clone = super(XmlPart, self).clone(package, share)
+            # -- a copy of a part parsed ahead of time keeps its blob too, and is parsed already --
+            if preparsed_element is not None:
+                if share:
+                    clone._shared_element = preparsed_element
+                else:
+                    clone._preparsed_element = copy.deepcopy(preparsed_element)
+            return clone
+        if share:
+            clone = type(self)(self._partname, self._content_type, package)
+            clone._shared_element = element
+            return clone
+        return type(self)(
+            self._partname, self._content_type, package, element=copy.deepcopy(element)
+        )
+
     def drop_rel(self, rId: str) -> None:
         """Remove relationship identified by `rId` if its reference count is under 2.
 
@@ -415,6 +1062,38 @@ class XmlPart(Part):
         if self._rel_ref_count(rId) < 2:
             self._rels.pop(rId)
 
+    def parse(self) -> None:
+        """Parse the XML of this part now, rather than on first access.
+
+        The part keeps its original XML until its XML is first accessed, so a part parsed this
+        way but never used is still saved by copying that XML across unchanged. A part that is
+        already parsed is unaffected.
+        """
+        if self._package is not None and self._package.read_only:
+            self._element
+            return
+        if (
+            self._parsed_element is not None
+            or self._shared_element is not None
+            or self._preparsed_element is not None
+        ):
+            return
+        self._preparsed_element = cast("BaseOxmlElement", parse_xml(self._blob))
+
+    def release(self) -> None:
+        """Discard the parsed XML of this part of a read-only package, to save memory.
+
+        The XML is parsed again from the package file if this part is accessed again, so this
+        only has effect while the package is open. Objects already holding elements of the
+        discarded XML can still be read. A part of a package that is not read-only may have
+        changed and is unaffected.
+        """
+        if self._package is None or not self._package.read_only:
+            return
+        if self._member_blob is None:
+            return
+        self._parsed_element = None
+
     @property
     def part(self):
         """This part.
@@ -425,9 +1104,59 @@ class XmlPart(Part):
         """
         return self
 
+    @property
+    def _element(self) -> BaseOxmlElement:
+        """Root element of the XML of this part.
+
+        A loaded part parses its blob on first access; the blob is released once parsed because
+        from then on the element is the source of truth for the part's XML. A part sharing the
+        XML of another takes its own copy of that XML on first access, since any access could be
+        a step towards changing it. A part parsed ahead of time by `.parse()` takes that XML, and
+        releases its blob, in the same way.
+        """
+        element = self._parsed_element
+        if element is None:
+            shared_element = self._shared_element
+            if shared_element is not None:
+                element = self._parsed_element = copy.deepcopy(shared_element)
+                self._shared_element = None
+                self._blob = None
+            elif self._package is not None and self._package.read_only:
+                element = self._parse_read_only()
+            else:
+                element = self._preparsed_element
+                if element is None:
+                    element = cast("BaseOxmlElement", parse_xml(self._blob))
+                self._parsed_element = element
+                self._preparsed_element = None
+                self._blob = None
+        return element
+
+    def _parse_read_only(self) -> BaseOxmlElement:
+        """Return the XML of this part of a read-only package, parsing it if not yet parsed.
+
+        The part is parsed once, by whichever thread asks first. Each part has a lock of its own,
+        so threads parsing different parts do not wait on each other. Its bytes are then dropped,
+        but its member-blob is kept so the part can be released and parsed again, see
+        `.release()`.
+        """
+        with self._parse_lock:
+            element = self._parsed_element
+            if element is None:
+                element = cast("BaseOxmlElement", parse_xml(self._blob))
+                mark_read_only(element)
+                if self._member_blob is not None:
+                    self._blob_src = self._member_blob
+                self._parsed_element = element
+        return element
+
     def _rel_ref_count(self, rId: str) -> int:
-        """Return int count of references in this part's XML to `rId`."""
-        return len([r for r in cast("list[str]", self._element.xpath("//@r:id")) if r == rId])
+        """Return int count of references in this part's XML to `rId`.
+
+        The references are counted once, on first call, and the counts kept current from then on
+        as the XML changes, so this does not search the XML on each call.
+        """
+        return max(rel_ref_counts(self._element)[rId], 0)
 
 
 class PartFactory:
@@ -439,7 +1168,9 @@ class PartFactory:
 
     part_type_for: dict[str, type[Part]] = {}
 
-    def __new__(cls, partname: PackURI, content_type: str, package: Package, blob: bytes) -> Part:
+    def __new__(
+        cls, partname: PackURI, content_type: str, package: Package, blob: bytes | MemberBlob
+    ) -> Part:
         PartClass = cls._part_cls_for(content_type)
         return PartClass.load(partname, content_type, package, blob)
 
@@ -499,10 +1230,27 @@ class _Relationships(Mapping[str, "_Relationship"]):
     Iterating this collection has normal mapping semantics, generating the keys (rIds) of the
     mapping. `rels.keys()`, `rels.values()`, and `rels.items() can be used as they would be for a
     `dict`.
+
+    Relationships are also indexed by relationship type and by target, and the indexes are kept
+    current as relationships are added and removed, so adding a relationship to a part that
+    already has many takes no longer than adding the first.
+
+    The package these relationships belong to, when given, is told of each relationship added
+    or dropped, so it can keep its views of the relationship graph current.
     """
 
-    def __init__(self, base_uri: str):
+    def __init__(
+        self, base_uri: str, package: OpcPackage | None = None, source_part: Part | None = None
+    ):
         self._base_uri = base_uri
+        # -- the package is told of each relationship added or dropped, to index its parts --
+        self._package = package
+        # -- the part these relationships belong to, |None| for those of the package itself --
+        self._source_part = source_part
+        # -- set for the relationships of a read-only package, which then cannot change --
+        self.read_only = False
+        # -- lowest rId number that might be available, all below it are in use --
+        self._rId_cursor = 1
 
     def __contains__(self, rId: object) -> bool:
         """Implement 'in' operation, like `"rId7" in relationships`."""
@@ -565,8 +1313,24 @@ class _Relationships(Mapping[str, "_Relationship"]):
                         continue
                 yield _Relationship.from_xml(base_uri, rel_elm, parts)
 
-        self._rels.clear()
-        self._rels.update((rel.rId, rel) for rel in iter_valid_rels())
+        self._load(iter_valid_rels())
+
+    def load_from_rels(self, rels: _Relationships, parts: Mapping[Part, Part]) -> None:
+        """Replace any relationships in this collection with copies of those in `rels`.
+
+        Each copy of an internal relationship targets the part that `parts` maps the target of
+        the original to. Used to copy the relationships of a package into a clone of it.
+        """
+        self._load(
+            _Relationship(
+                self._base_uri,
+                rel.rId,
+                rel.reltype,
+                RTM.EXTERNAL if rel.is_external else RTM.INTERNAL,
+                rel.target_ref if rel.is_external else parts[rel.target_part],
+            )
+            for rel in rels.values()
+        )
 
     def part_with_reltype(self, reltype: str) -> Part:
         """Return target part of relationship with matching `reltype`.
@@ -582,14 +1346,20 @@ class _Relationships(Mapping[str, "_Relationship"]):
         if len(rels_of_reltype) > 1:
             raise ValueError("multiple relationships of type '%s' in collection" % reltype)
 
-        return rels_of_reltype[0].target_part
+        return next(iter(rels_of_reltype.values())).target_part
 
     def pop(self, rId: str) -> _Relationship:
         """Return |_Relationship| identified by `rId` after removing it from collection.
 
         The caller is responsible for ensuring it is no longer required.
         """
-        return self._rels.pop(rId)
+        self._check_writable()
+        rel = self._rels[rId]
+        self._unindex_rel(rel)
+        del self._rels[rId]
+        if self._package is not None:
+            self._package.unregister_rel(rel)
+        return rel
 
     @property
     def xml(self):
@@ -619,14 +1389,21 @@ class _Relationships(Mapping[str, "_Relationship"]):
 
     def _add_relationship(self, reltype: str, target: Part | str, is_external: bool = False) -> str:
         """Return str rId of |_Relationship| newly added to spec."""
+        self._check_writable()
         rId = self._next_rId
-        self._rels[rId] = _Relationship(
+        rel = _Relationship(
             self._base_uri,
             rId,
             reltype,
             target_mode=RTM.EXTERNAL if is_external else RTM.INTERNAL,
             target=target,
         )
+        # -- index before adding, an index built on first use here would already include it --
+        self._rels_by_reltype[reltype][rId] = rel
+        self._rIds_by_target.setdefault((reltype, is_external, target), {})[rId] = None
+        self._rels[rId] = rel
+        if self._package is not None:
+            self._package.register_rel(rel, self._source_part)
         return rId
 
     def _get_matching(
@@ -636,14 +1413,34 @@ class _Relationships(Mapping[str, "_Relationship"]):
 
         Returns `None` on no matching relationship
         """
-        for rel in self._rels_by_reltype[reltype]:
-            if rel.is_external != is_external:
-                continue
-            rel_target = rel.target_ref if rel.is_external else rel.target_part
-            if rel_target == target:
-                return rel.rId
+        rIds = self._rIds_by_target.get((reltype, is_external, target))
+        return next(iter(rIds)) if rIds else None
 
-        return None
+    def _load(self, rels: Iterable[_Relationship]) -> None:
+        """Replace any relationships in this collection with `rels`, which have their rIds."""
+        package = self._package
+        if package is not None:
+            for rel in self._rels.values():
+                package.unregister_rel(rel)
+        self._rels.clear()
+        self._rels_by_reltype.clear()
+        self._rIds_by_target.clear()
+        self._rId_cursor = 1
+        for rel in rels:
+            self._rels[rel.rId] = rel
+            self._index_rel(rel)
+            if package is not None:
+                package.register_rel(rel, self._source_part)
+
+    def _index_rel(self, rel: _Relationship) -> None:
+        """Add `rel` to the reltype and target indexes."""
+        self._rels_by_reltype[rel.reltype][rel.rId] = rel
+        self._rIds_by_target.setdefault(self._target_key(rel), {})[rel.rId] = None
+
+    def _check_writable(self) -> None:
+        """Raise |ReadOnlyError| when these are the relationships of a read-only package."""
+        if self.read_only:
+            raise ReadOnlyError("presentation was opened read-only and cannot be changed")
 
     @property
     def _next_rId(self) -> str:
@@ -652,30 +1449,66 @@ class _Relationships(Mapping[str, "_Relationship"]):
         The next rId is the first unused key starting from "rId1" and making use of any gaps in
         numbering, e.g. 'rId2' for rIds ['rId1', 'rId3'].
         """
-        # --- The common case is where all sequential numbers starting at "rId1" are
-        # --- used and the next available rId is "rId%d" % (len(rels)+1). So we start
-        # --- there and count down to produce the best performance.
-        for n in range(len(self) + 1, 0, -1):
-            rId_candidate = "rId%d" % n  # like 'rId19'
-            if rId_candidate not in self._rels:
-                return rId_candidate
-        raise Exception(
-            "ProgrammingError: Impossible to have more distinct rIds than relationships"
-        )
+        # --- The cursor only moves back when a relationship below it is removed, so in the
+        # --- common case of adding one relationship after another, this is a single lookup.
+        n = self._rId_cursor
+        while "rId%d" % n in self._rels:
+            n += 1
+        self._rId_cursor = n
+        return "rId%d" % n
 
     @lazyproperty
     def _rels(self) -> dict[str, _Relationship]:
         """dict {rId: _Relationship} containing relationships of this collection."""
         return {}
 
-    @property
-    def _rels_by_reltype(self) -> dict[str, list[_Relationship]]:
-        """defaultdict {reltype: [rels]} for all relationships in collection."""
-        D: DefaultDict[str, list[_Relationship]] = collections.defaultdict(list)
+    @lazyproperty
+    def _rels_by_reltype(self) -> DefaultDict[str, dict[str, _Relationship]]:
+        """defaultdict {reltype: {rId: rel}} for all relationships in collection.
+
+        The relationships of each reltype are in the order they were added. Built on first use and
+        kept current from then on as relationships are added and removed, each in constant time.
+        """
+        D: DefaultDict[str, dict[str, _Relationship]] = collections.defaultdict(dict)
         for rel in self.values():
-            D[rel.reltype].append(rel)
+            D[rel.reltype][rel.rId] = rel
         return D
 
+    @lazyproperty
+    def _rIds_by_target(self) -> dict[tuple[str, bool, Part | str], dict[str, None]]:
+        """dict {(reltype, is_external, target): {rId: None}} for relationships in collection.
+
+        The rIds of the relationships having each reltype and target are the keys of a dict, in
+        the order they were added, the first being the one matched. Built on first use and kept
+        current from then on.
+        """
+        rIds: dict[tuple[str, bool, Part | str], dict[str, None]] = {}
+        for rel in self.values():
+            rIds.setdefault(self._target_key(rel), {})[rel.rId] = None
+        return rIds
+
+    @staticmethod
+    def _target_key(rel: _Relationship) -> tuple[str, bool, Part | str]:
+        """Return (reltype, is_external, target) key of `rel` in the target index."""
+        is_external = rel.is_external
+        return rel.reltype, is_external, rel.target_ref if is_external else rel.target_part
+
+    def _unindex_rel(self, rel: _Relationship) -> None:
+        """Remove `rel` from the reltype and target indexes and free its rId for reuse."""
+        rId = rel.rId
+        del self._rels_by_reltype[rel.reltype][rId]
+
+        # -- another relationship to the same target takes its place, if there is one --
+        key = self._target_key(rel)
+        rIds = self._rIds_by_target.get(key)
+        if rIds is not None:
+            rIds.pop(rId, None)
+            if not rIds:
+                del self._rIds_by_target[key]
+
+        if rId.startswith("rId") and rId[3:].isdigit() and int(rId[3:]) < self._rId_cursor:
+            self._rId_cursor = int(rId[3:])
+
 
 class _Relationship:
     """Value object describing link from a part or package to another part."""
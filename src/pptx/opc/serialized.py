@@ -2,22 +2,41 @@
 
 from __future__ import annotations
 
+import collections
+import io
 import os
 import posixpath
+import struct
+import threading
+import time
 import zipfile
-from typing import IO, TYPE_CHECKING, Any, Container, Sequence
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, TYPE_CHECKING, Any, Container, Deque, Iterator, Sequence, cast
+
+from lxml import etree
 
 from pptx.exc import PackageNotFoundError
 from pptx.opc.constants import CONTENT_TYPE as CT
-from pptx.opc.oxml import CT_Types, serialize_part_xml
+from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
+from pptx.opc.oxml import CT_Relationships, CT_Types, serialize_part_xml
 from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
 from pptx.opc.shared import CaseInsensitiveDict
-from pptx.opc.spec import default_content_types
+from pptx.opc.spec import compressed_content_types, default_content_types
+from pptx.oxml import parse_xml
 from pptx.util import lazyproperty
 
 if TYPE_CHECKING:
     from pptx.opc.package import Part, _Relationships  # pyright: ignore[reportPrivateUsage]
 
+# -- zip records written or read by the zip package writers and reader, see APPNOTE.TXT --
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_CENTRAL_DIRECTORY_ENTRY = struct.Struct("<4s4B4HL2L5H2L")
+_END_RECORD = struct.Struct("<4s4H2LH")
+_END_RECORD_64 = struct.Struct("<4sQ2H2L4Q")
+_END_LOCATOR_64 = struct.Struct("<4sLQL")
+_ZIP64_LIMIT = (1 << 31) - 1
+
 
 class PackageReader(Container[bytes]):
     """Provides access to package-parts of an OPC package with dict semantics.
@@ -37,6 +56,17 @@ class PackageReader(Container[bytes]):
         """Return bytes for part corresponding to `pack_uri`."""
         return self._blob_reader[pack_uri]
 
+    def close(self) -> None:
+        """Release the physical package, closing the zip archive when there is one.
+
+        Member blobs not yet read can no longer be loaded once the package is closed.
+        """
+        self._blob_reader.close()
+
+    def member_blob(self, pack_uri: PackURI) -> MemberBlob:
+        """Return a |MemberBlob| deferring the read of the member identified by `pack_uri`."""
+        return MemberBlob(self._blob_reader, pack_uri)
+
     def rels_xml_for(self, partname: PackURI) -> bytes | None:
         """Return optional rels item XML for `partname`.
 
@@ -57,30 +87,101 @@ class PackageWriter:
 
     `pkg_file` can be either a path to a zip file (a string) or a file-like object. `pkg_rels` is
     the |_Relationships| object containing relationships for the package. `parts` is a sequence of
-    |Part| subtype instance to be written to the package.
+    |Part| subtype instance to be written to the package. When `workers` is greater than 1, zip
+    members are compressed on that many threads. `compression` is an optional deflate level that
+    also causes parts of an already-compressed content type to be stored without compression.
 
     Its single API classmethod is :meth:`write`. This class is not intended to be instantiated.
     """
 
-    def __init__(self, pkg_file: str | IO[bytes], pkg_rels: _Relationships, parts: Sequence[Part]):
+    def __init__(
+        self,
+        pkg_file: str | IO[bytes],
+        pkg_rels: _Relationships,
+        parts: Sequence[Part],
+        workers: int | None = None,
+        compression: int | None = None,
+    ):
         self._pkg_file = pkg_file
         self._pkg_rels = pkg_rels
         self._parts = parts
+        self._workers = workers
+        self._compression = compression
 
     @classmethod
     def write(
-        cls, pkg_file: str | IO[bytes], pkg_rels: _Relationships, parts: Sequence[Part]
+        cls,
+        pkg_file: str | IO[bytes],
+        pkg_rels: _Relationships,
+        parts: Sequence[Part],
+        workers: int | None = None,
+        compression: int | None = None,
     ) -> None:
         """Write a physical package (.pptx file) to `pkg_file`.
 
         The serialized package contains `pkg_rels` and `parts`, a content-types stream based on
         the content type of each part, and a .rels file for each part that has relationships.
         """
-        cls(pkg_file, pkg_rels, parts)._write()
+        cls(pkg_file, pkg_rels, parts, workers, compression)._write()
+
+    @classmethod
+    def update(
+        cls,
+        pkg_file: str,
+        pkg_rels: _Relationships,
+        parts: Sequence[Part],
+        compression: int | None = None,
+    ) -> None:
+        """Update the zip package (.pptx file) at path `pkg_file` in place.
+
+        The updated package contains `pkg_rels` and `parts`, just as one produced by :meth:`write`.
+        Members already in the package file with the same content are left where they are though,
+        only new and changed ones are appended. See |_ZipPkgUpdater| for details.
+        """
+        cls(pkg_file, pkg_rels, parts, compression=compression)._update()
+
+    @classmethod
+    def iter_write(
+        cls,
+        pkg_rels: _Relationships,
+        parts: Sequence[Part],
+        workers: int | None = None,
+        compression: int | None = None,
+    ) -> Iterator[bytes]:
+        """Generate the bytes of a physical package (.pptx file) in chunks as it is written.
+
+        The package is the same one :meth:`write` produces. The bytes for each part are generated
+        as soon as that part is written, so the package can be passed along as it is produced
+        rather than being held in memory whole.
+        """
+        return cls(_ChunkStream(), pkg_rels, parts, workers, compression)._iter_write()
+
+    def _iter_write(self) -> Iterator[bytes]:
+        """Generate chunks of physical package (.pptx file) as its items are written."""
+        chunk_stream = cast(_ChunkStream, self._pkg_file)
+        with _PhysPkgWriter.factory(
+            cast(IO[bytes], chunk_stream), self._workers, self._compression
+        ) as phys_writer:
+            self._write_content_types_stream(phys_writer)
+            self._write_pkg_rels(phys_writer)
+            for part in self._parts:
+                self._write_part(phys_writer, part)
+                yield from chunk_stream.drain()
+        yield from chunk_stream.drain()
+
+    def _update(self) -> None:
+        """Update physical package (.pptx file) in place."""
+        pkg_file = cast(str, self._pkg_file)
+        with _ZipPkgUpdater(pkg_file, _CompressionPolicy(self._compression)) as phys_writer:
+            self._write_content_types_stream(phys_writer)
+            self._write_pkg_rels(phys_writer)
+            self._write_parts(phys_writer)
 
     def _write(self) -> None:
         """Write physical package (.pptx file)."""
-        with _PhysPkgWriter.factory(self._pkg_file) as phys_writer:
+        with _PhysPkgWriter.factory(
+            self._pkg_file, self._workers, self._compression
+        ) as phys_writer:
             self._write_content_types_stream(phys_writer)
             self._write_pkg_rels(phys_writer)
             self._write_parts(phys_writer)
@@ -96,21 +197,61 @@ class PackageWriter:
             serialize_part_xml(_ContentTypesItem.xml_for(self._parts)),
         )
 
-    def _write_parts(self, phys_writer: _PhysPkgWriter) -> None:
-        """Write blob of each part in `parts` to the package.
+    def _write_part(self, phys_writer: _PhysPkgWriter, part: Part) -> None:
+        """Write blob of `part` to the package.
 
-        A rels item for each part is also written when the part has relationships.
+        A part still having the |MemberBlob| it was loaded with is unchanged, so its package member
+        is copied across rather than its blob being written. A rels item for the part is also
+        written when the part has relationships.
         """
+        member_blob = part.member_blob
+        if member_blob is None:
+            phys_writer.write(part.partname, part.blob, part.content_type)
+        else:
+            phys_writer.write_member(part.partname, member_blob)
+        if part._rels:  # pyright: ignore[reportPrivateUsage]
+            phys_writer.write(part.partname.rels_uri, part.rels.xml)
+
+    def _write_parts(self, phys_writer: _PhysPkgWriter) -> None:
+        """Write blob of each part in `parts` to the package."""
         for part in self._parts:
-            phys_writer.write(part.partname, part.blob)
-            if part._rels:  # pyright: ignore[reportPrivateUsage]
-                phys_writer.write(part.partname.rels_uri, part.rels.xml)
+            self._write_part(phys_writer, part)
 
     def _write_pkg_rels(self, phys_writer: _PhysPkgWriter) -> None:
         """Write the XML rels item for `pkg_rels` ('/_rels/.rels') to the package."""
         phys_writer.write(PACKAGE_URI.rels_uri, self._pkg_rels.xml)
 
 
+class MemberBlob:
+    """Deferred blob of a member of a physical package.
+
+    Holds a reference to the physical reader and the member's partname rather than its bytes. The
+    member is read, and inflated when the package is zipped, only when :meth:`load` is called.
+    """
+
+    def __init__(self, blob_reader: _PhysPkgReader, pack_uri: PackURI):
+        self._blob_reader = blob_reader
+        self._pack_uri = pack_uri
+
+    def load(self) -> bytes:
+        """Return the bytes of this member, read from the package."""
+        return self._blob_reader[self._pack_uri]
+
+    def zip_entry(self) -> tuple[zipfile.ZipInfo, bytes] | None:
+        """Return (zip_info, compressed_bytes) pair for this member, still compressed.
+
+        Returns |None| when the package this member belongs to is not a zip archive.
+        """
+        return self._blob_reader.zip_entry(self._pack_uri)
+
+    def zip_info(self) -> zipfile.ZipInfo | None:
+        """Return `ZipInfo` describing this member, without reading the member itself.
+
+        Returns |None| when the package this member belongs to is not a zip archive.
+        """
+        return self._blob_reader.zip_info(self._pack_uri)
+
+
 class _PhysPkgReader(Container[PackURI]):
     """Base class for physical package reader objects."""
 
@@ -126,6 +267,26 @@ class _PhysPkgReader(Container[PackURI]):
             f"`{type(self).__name__}` must implement `.__contains__()`"
         )
 
+    def close(self) -> None:
+        """Release any resources held by this reader.
+
+        Default is to do nothing, which suits a reader that holds no open file between reads.
+        """
+
+    def zip_entry(self, pack_uri: PackURI) -> tuple[zipfile.ZipInfo, bytes] | None:
+        """Return (zip_info, compressed_bytes) pair for the member identified by `pack_uri`.
+
+        Default is |None|, only a zip package has compressed members to provide.
+        """
+        return None
+
+    def zip_info(self, pack_uri: PackURI) -> zipfile.ZipInfo | None:
+        """Return `ZipInfo` describing the member identified by `pack_uri`.
+
+        Default is |None|, only a zip package has members described by a `ZipInfo`.
+        """
+        return None
+
     @classmethod
     def factory(cls, pkg_file: str | IO[bytes]) -> _PhysPkgReader:
         """Return |_PhysPkgReader| subtype instance appropriage for `pkg_file`."""
@@ -170,76 +331,586 @@ class _DirPkgReader(_PhysPkgReader):
 
 
 class _ZipPkgReader(_PhysPkgReader):
-    """Implements |PhysPkgReader| interface for a zip-file OPC package."""
+    """Implements |PhysPkgReader| interface for a zip-file OPC package.
+
+    The zip archive is held open from first access until :meth:`close` is called. Only the central
+    directory is read up-front; each member is read and inflated when it is requested.
+    """
 
     def __init__(self, pkg_file: str | IO[bytes]):
         self._pkg_file = pkg_file
+        # -- serializes reads of a stream package, shared by the `ZipFile` and `.zip_entry()` --
+        self._lock = threading.Lock()
 
     def __contains__(self, pack_uri: object) -> bool:
         """Return True when part identified by `pack_uri` is present in zip archive."""
-        return pack_uri in self._blobs
+        return pack_uri in self._members
 
     def __getitem__(self, pack_uri: PackURI) -> bytes:
         """Return bytes for part corresponding to `pack_uri`.
 
         Raises |KeyError| if no matching member is present in zip archive.
         """
-        if pack_uri not in self._blobs:
+        if pack_uri not in self._members:
             raise KeyError("no member '%s' in package" % pack_uri)
-        return self._blobs[pack_uri]
+        if isinstance(self._pkg_file, str):
+            return self._zipf.read(self._members[pack_uri])
+        with self._lock:
+            return self._zipf.read(self._members[pack_uri])
+
+    def close(self) -> None:
+        """Close the zip archive, releasing its file handle."""
+        self._zipf.close()
+
+    def zip_entry(self, pack_uri: PackURI) -> tuple[zipfile.ZipInfo, bytes]:
+        """Return (zip_info, compressed_bytes) pair for the member identified by `pack_uri`.
+
+        The member data is read as stored in the archive, without being inflated. A package file
+        is opened for the read, a stream package is read under the lock its members are read
+        under, since it is shared with the `ZipFile`.
+        """
+        zip_info = self.zip_info(pack_uri)
+        if isinstance(self._pkg_file, str):
+            with open(self._pkg_file, "rb") as f:
+                return zip_info, self._read_raw(f, zip_info)
+        with self._lock:
+            return zip_info, self._read_raw(self._pkg_file, zip_info)
+
+    def zip_info(self, pack_uri: PackURI) -> zipfile.ZipInfo:
+        """Return `ZipInfo` (central-directory entry) of the member identified by `pack_uri`."""
+        return self._members[pack_uri]
 
     @lazyproperty
-    def _blobs(self) -> dict[PackURI, bytes]:
-        """dict mapping partname to package part binaries."""
-        with zipfile.ZipFile(self._pkg_file, "r") as z:
-            return {PackURI("/%s" % name): z.read(name) for name in z.namelist()}
+    def _members(self) -> dict[PackURI, zipfile.ZipInfo]:
+        """dict mapping partname to the `ZipInfo` (central-directory entry) of its member."""
+        return {PackURI("/%s" % info.filename): info for info in self._zipf.infolist()}
+
+    @staticmethod
+    def _read_raw(f: IO[bytes], zip_info: zipfile.ZipInfo) -> bytes:
+        """Return the data of the member described by `zip_info`, read from archive file `f`.
+
+        The data follows the local header of the member, which starts at the `header_offset`
+        given by its `ZipInfo`.
+        """
+        f.seek(zip_info.header_offset)
+        header = f.read(_LOCAL_HEADER.size)
+        if len(header) != _LOCAL_HEADER.size or header[:4] != b"PK\x03\x04":
+            raise zipfile.BadZipFile("bad local header for member '%s'" % zip_info.filename)
+        name_len, extra_len = _LOCAL_HEADER.unpack(header)[-2:]
+        f.seek(name_len + extra_len, os.SEEK_CUR)
+        return f.read(zip_info.compress_size)
+
+    @lazyproperty
+    def _zipf(self) -> zipfile.ZipFile:
+        """`ZipFile` instance open for reading."""
+        return zipfile.ZipFile(self._pkg_file, "r")
 
 
 class _PhysPkgWriter:
     """Base class for physical package writer objects."""
 
     @classmethod
-    def factory(cls, pkg_file: str | IO[bytes]) -> _ZipPkgWriter:
+    def factory(
+        cls,
+        pkg_file: str | IO[bytes],
+        workers: int | None = None,
+        compression: int | None = None,
+    ) -> _PhysPkgWriter:
         """Return |_PhysPkgWriter| subtype instance appropriage for `pkg_file`.
 
-        Currently the only subtype is `_ZipPkgWriter`, but a `_DirPkgWriter` could be implemented
-        or even a `_StreamPkgWriter`.
+        A `_DirPkgWriter` is returned when `pkg_file` is the path of an existing directory.
+        Otherwise a `_ParallelZipPkgWriter` is returned when `workers` is greater than 1, or else a
+        `_ZipPkgWriter`. Either can write to a stream that cannot seek, like a socket or a pipe.
         """
-        return _ZipPkgWriter(pkg_file)
+        if isinstance(pkg_file, str) and os.path.isdir(pkg_file):
+            return _DirPkgWriter(pkg_file)
+
+        compression_policy = _CompressionPolicy(compression)
+        if workers is not None and workers > 1:
+            return _ParallelZipPkgWriter(pkg_file, compression_policy, workers)
+        return _ZipPkgWriter(pkg_file, compression_policy)
+
+    def __enter__(self) -> _PhysPkgWriter:
+        """Enable use as a context-manager."""
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """Complete the package on exit from context."""
+
+    def write(self, pack_uri: PackURI, blob: bytes, content_type: str = CT.XML) -> None:
+        """Write `blob` to package with membername corresponding to `pack_uri`.
 
-    def write(self, pack_uri: PackURI, blob: bytes) -> None:
-        """Write `blob` to package with membername corresponding to `pack_uri`."""
+        `content_type` is that of the part `blob` is the content of, when it matters.
+        """
         raise NotImplementedError(  # pragma: no cover
             f"`{type(self).__name__}` must implement `.write()`"
         )
 
+    def write_member(self, pack_uri: PackURI, member_blob: MemberBlob) -> None:
+        """Write unchanged member of a source package to this package as `pack_uri`.
+
+        Default is to write the member's bytes as for any other blob. Subclasses can override to
+        copy the member across more efficiently.
+        """
+        self.write(pack_uri, member_blob.load())
+
+
+class _DirPkgWriter(_PhysPkgWriter):
+    """Implements |PhysPkgWriter| interface for an OPC package expanded into a directory.
+
+    `path` is the path to an existing directory. Each member is written, uncompressed, to the file
+    at its membername within that directory. A file that already holds the same bytes is not
+    rewritten, so the files of unchanged parts keep their modification time.
+
+    When the directory already holds an expanded package, the files of that package this writer
+    did not write, like those of a deleted slide, are removed on exit. Otherwise a stale `.rels`
+    file could be read back in with the new package. Only files that package lists are removed, its
+    content-types item and the parts and rels items reachable from its relationships, and only in
+    the folders of a package. Any other file in the directory is left alone.
+    """
+
+    # -- top-level folders the members of a presentation package are in --
+    _pkg_folders = frozenset(("_rels", "customXml", "docProps", "ppt"))
+
+    def __init__(self, path: str):
+        self._path = os.path.abspath(path)
+        # -- the package being replaced is listed before any of its files is overwritten --
+        self._old_membernames = (
+            self._pkg_membernames()
+            if os.path.isfile(self._file_path(CONTENT_TYPES_URI.membername))
+            else set()
+        )
+        self._membernames: set[str] = set()
+
+    def __exit__(self, *exc: Any) -> None:
+        """Remove files of the package this one replaces, unless writing did not complete."""
+        if exc and exc[0] is not None:
+            return
+        self._remove_stale_files()
+
+    def write(self, pack_uri: PackURI, blob: bytes, content_type: str = CT.XML) -> None:
+        """Write `blob` to the file for `pack_uri` in the package directory.
+
+        `content_type` has no bearing since no member of a directory package is compressed.
+        """
+        membername = pack_uri.membername
+        self._membernames.add(membername)
+        path = self._file_path(membername)
+        if self._file_holds(path, blob):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(blob)
+
+    def _file_path(self, membername: str) -> str:
+        """Filesystem path of the file for `membername` in the package directory."""
+        return os.path.join(self._path, *membername.split("/"))
+
+    @staticmethod
+    def _file_holds(path: str, blob: bytes) -> bool:
+        """True when a file exists at `path` and its contents are exactly `blob`."""
+        try:
+            if os.path.getsize(path) != len(blob):
+                return False
+            with open(path, "rb") as f:
+                return f.read() == blob
+        except OSError:
+            return False
+
+    def _pkg_membernames(self) -> set[str]:
+        """Membernames of the package the directory holds, in the folders of a package.
+
+        These are the content-types item, each part it overrides the content type of, and each
+        part and rels item reachable from the package relationships. An item that cannot be read
+        or parsed adds nothing more.
+        """
+        pkg_reader = _DirPkgReader(self._path)
+        membernames = {CONTENT_TYPES_URI.membername}
+        try:
+            types = cast(CT_Types, parse_xml(pkg_reader[CONTENT_TYPES_URI]))
+            membernames.update(
+                PackURI(override.partName).membername for override in types.override_lst
+            )
+        except (KeyError, ValueError, etree.XMLSyntaxError):
+            pass
+
+        visited: set[PackURI] = set()
+        partnames = [PACKAGE_URI]
+        while partnames:
+            partname = partnames.pop()
+            if partname in visited:
+                continue
+            visited.add(partname)
+            membernames.add(partname.membername)
+            rels_uri = partname.rels_uri
+            try:
+                rels = cast(CT_Relationships, parse_xml(pkg_reader[rels_uri]))
+            except (KeyError, ValueError, etree.XMLSyntaxError):
+                continue
+            membernames.add(rels_uri.membername)
+            partnames.extend(
+                PackURI.from_rel_ref(partname.baseURI, rel.target_ref)
+                for rel in rels.relationship_lst
+                if rel.targetMode != RTM.EXTERNAL
+            )
+
+        return {
+            membername
+            for membername in membernames
+            if membername == CONTENT_TYPES_URI.membername
+            or membername.split("/", 1)[0] in self._pkg_folders
+        }
+
+    def _remove_stale_files(self) -> None:
+        """Remove each file of the replaced package that was not written by this writer.
+
+        Directories left empty by removing a file are removed too, other than the package
+        directory itself.
+        """
+        for membername in self._old_membernames - self._membernames:
+            path = self._file_path(membername)
+            if not os.path.isfile(path):
+                continue
+            os.remove(path)
+            dirpath = os.path.dirname(path)
+            while dirpath != self._path and not os.listdir(dirpath):
+                os.rmdir(dirpath)
+                dirpath = os.path.dirname(dirpath)
+
 
 class _ZipPkgWriter(_PhysPkgWriter):
-    """Implements |PhysPkgWriter| interface for a zip-file (.pptx file) OPC package."""
+    """Implements |PhysPkgWriter| interface for a zip-file (.pptx file) OPC package.
 
-    def __init__(self, pkg_file: str | IO[bytes]):
+    Each member is compressed in memory and written with a local header giving its CRC and sizes,
+    so members are written straight through, even to a stream that cannot seek. The central
+    directory listing them is written on exit. The archive is written here rather than by
+    `zipfile.ZipFile`, which has no interface for adding a member that is already compressed.
+    """
+
+    def __init__(
+        self, pkg_file: str | IO[bytes], compression_policy: _CompressionPolicy | None = None
+    ):
         self._pkg_file = pkg_file
+        self._compression_policy = (
+            _CompressionPolicy(None) if compression_policy is None else compression_policy
+        )
+        self._zip_infos: list[zipfile.ZipInfo] = []
+        # -- count of bytes written, so the file position is known without asking the file --
+        self._written = 0
 
     def __enter__(self) -> _ZipPkgWriter:
-        """Enable use as a context-manager. Opening zip for writing happens here."""
+        """Enable use as a context-manager."""
         return self
 
-    def __exit__(self, *exc: list[Any]) -> None:
-        """Close the zip archive on exit from context.
+    def __exit__(self, *exc: Any) -> None:
+        """Write the central directory on exit from context, unless writing did not complete.
 
-        Closing flushes any pending physical writes and releasing any resources it's using.
+        The package file is closed when this writer opened it, a stream is left open.
         """
-        self._zipf.close()
+        try:
+            if not exc or exc[0] is None:
+                self._write_central_directory()
+        finally:
+            if isinstance(self._pkg_file, str) and "_fp" in self.__dict__:
+                self._fp.close()
+
+    def write(self, pack_uri: PackURI, blob: bytes, content_type: str = CT.XML) -> None:
+        """Write `blob` to zip package with membername corresponding to `pack_uri`.
+
+        The member is compressed as the compression policy prescribes for `content_type`.
+        """
+        compress_type, compresslevel = self._compression_policy(content_type)
+        zip_info, data = self._compress(pack_uri.membername, blob, compress_type, compresslevel)
+        self._write_compressed(zip_info, data)
 
-    def write(self, pack_uri: PackURI, blob: bytes) -> None:
-        """Write `blob` to zip package with membername corresponding to `pack_uri`."""
-        self._zipf.writestr(pack_uri.membername, blob)
+    def write_member(self, pack_uri: PackURI, member_blob: MemberBlob) -> None:
+        """Write unchanged member of a source package to this zip package as `pack_uri`.
+
+        A member of a zip package is copied across still compressed, avoiding both inflating it
+        and deflating it again. Such a member keeps the compression it has in the source package.
+        """
+        zip_entry = member_blob.zip_entry()
+        if zip_entry is None:
+            self.write(pack_uri, member_blob.load())
+            return
+
+        src_info, data = zip_entry
+        zip_info = zipfile.ZipInfo(pack_uri.membername, date_time=src_info.date_time)
+        zip_info.compress_type = src_info.compress_type
+        zip_info.CRC = src_info.CRC
+        zip_info.compress_size = src_info.compress_size
+        zip_info.file_size = src_info.file_size
+        zip_info.external_attr = src_info.external_attr
+        self._write_compressed(zip_info, data)
+
+    @staticmethod
+    def _compress(
+        membername: str, blob: bytes, compress_type: int, compresslevel: int | None
+    ) -> tuple[zipfile.ZipInfo, bytes]:
+        """Return (zip_info, compressed_bytes) pair for `blob` stored as `membername`.
+
+        The member is compressed and described just as `ZipFile.writestr()` would do it.
+        `compress_type` is either `ZIP_DEFLATED` or `ZIP_STORED`.
+        """
+        zip_info = zipfile.ZipInfo(membername, date_time=time.localtime(time.time())[:6])
+        zip_info.compress_type = compress_type
+        zip_info.external_attr = 0o600 << 16
+        if compress_type == zipfile.ZIP_STORED:
+            data = blob
+        else:
+            level = zlib.Z_DEFAULT_COMPRESSION if compresslevel is None else compresslevel
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+            data = compressor.compress(blob) + compressor.flush()
+        zip_info.CRC = zlib.crc32(blob)
+        zip_info.file_size = len(blob)
+        zip_info.compress_size = len(data)
+        return zip_info, data
 
     @lazyproperty
-    def _zipf(self) -> zipfile.ZipFile:
-        """`ZipFile` instance open for writing."""
-        return zipfile.ZipFile(
-            self._pkg_file, "w", compression=zipfile.ZIP_DEFLATED, strict_timestamps=False
+    def _fp(self) -> IO[bytes]:
+        """File the archive is written to, opened on first use when the package is a path."""
+        if isinstance(self._pkg_file, str):
+            return open(self._pkg_file, "wb")
+        return self._pkg_file
+
+    @lazyproperty
+    def _start_offset(self) -> int:
+        """Position in the file at which this writer started writing.
+
+        This is the position of a stream that can tell it, as it is for `ZipFile`, and 0 for one
+        that cannot, like a socket or a pipe.
+        """
+        try:
+            return self._fp.tell()
+        except (AttributeError, OSError):
+            return 0
+
+    def _write_central_directory(self) -> None:
+        """Write the central directory listing each member written, then its end records.
+
+        The ZIP64 forms of the end records are added when the archive is too large for the
+        original ones, as `zipfile` does.
+        """
+        fp = self._fp
+        start = self._start_offset + self._written
+        entries = b"".join(_central_directory_entry(zip_info) for zip_info in self._zip_infos)
+        fp.write(entries)
+        end = start + len(entries)
+
+        count, size = len(self._zip_infos), len(entries)
+        if count > 0xFFFF or size > _ZIP64_LIMIT or start > _ZIP64_LIMIT:
+            fp.write(
+                _END_RECORD_64.pack(b"PK\x06\x06", 44, 45, 45, 0, 0, count, count, size, start)
+            )
+            fp.write(_END_LOCATOR_64.pack(b"PK\x06\x07", 0, end, 1))
+            count, size, start = min(count, 0xFFFF), min(size, 0xFFFFFFFF), min(start, 0xFFFFFFFF)
+        fp.write(_END_RECORD.pack(b"PK\x05\x06", 0, 0, count, count, size, start, 0))
+        fp.flush()
+
+    def _write_compressed(self, zip_info: zipfile.ZipInfo, data: bytes) -> None:
+        """Append member described by `zip_info` having already-compressed `data`.
+
+        `zip_info` must carry the compress-type, CRC, and sizes of `data`.
+        """
+        zip_info.header_offset = self._start_offset + self._written
+        header = zip_info.FileHeader()
+        self._fp.write(header)
+        self._fp.write(data)
+        self._written += len(header) + len(data)
+        self._zip_infos.append(zip_info)
+
+
+class _ZipPkgUpdater(_ZipPkgWriter):
+    """Zip-file package writer that updates an existing zip package in place.
+
+    A member having the same name, CRC, and size as an entry already in the archive is kept where it
+    is rather than written again. Other members are appended at the end of the file, followed by a
+    new central directory listing just the members kept or written. The data of entries not kept,
+    and the old central directory, remain in the file as unused space until the package is next
+    written in full.
+
+    Nothing already in the file is overwritten. When writing fails part way, the file is truncated
+    back to its original length, which leaves the package as it was.
+    """
+
+    def __exit__(self, *exc: Any) -> None:
+        """Write the central directory, or restore the file when writing did not complete.
+
+        The file is restored too when writing the central directory itself fails.
+        """
+        completed = not exc or exc[0] is None
+        try:
+            if completed:
+                self._write_central_directory()
+        except BaseException:
+            completed = False
+            raise
+        finally:
+            if "_fp" in self.__dict__:
+                try:
+                    if not completed:
+                        self._fp.truncate(self._start_offset)
+                finally:
+                    self._fp.close()
+
+    def write(self, pack_uri: PackURI, blob: bytes, content_type: str = CT.XML) -> None:
+        """Write `blob` as `pack_uri`, unless the archive already has a member holding it."""
+        if self._keep(pack_uri, zlib.crc32(blob), len(blob)):
+            return
+        super(_ZipPkgUpdater, self).write(pack_uri, blob, content_type)
+
+    def write_member(self, pack_uri: PackURI, member_blob: MemberBlob) -> None:
+        """Write unchanged `member_blob` as `pack_uri` unless the archive already holds it.
+
+        Whether the archive holds the member is decided from its `ZipInfo`, without reading it.
+        """
+        zip_info = member_blob.zip_info()
+        if zip_info is not None and self._keep(pack_uri, zip_info.CRC, zip_info.file_size):
+            return
+        super(_ZipPkgUpdater, self).write_member(pack_uri, member_blob)
+
+    @lazyproperty
+    def _entries(self) -> dict[str, zipfile.ZipInfo]:
+        """Entries of the archive before this update, by membername."""
+        with zipfile.ZipFile(self._pkg_file) as zipf:
+            return {info.filename: info for info in zipf.infolist()}
+
+    @lazyproperty
+    def _fp(self) -> IO[bytes]:
+        """Package file open for appending to, such that its existing bytes are not overwritten."""
+        return open(cast(str, self._pkg_file), "ab")
+
+    def _keep(self, pack_uri: PackURI, crc: int, size: int) -> bool:
+        """Keep existing entry for `pack_uri` when it has `crc` and `size`.
+
+        Returns True when the entry was kept, False when the archive has no such entry.
+        """
+        zip_info = self._entries.get(pack_uri.membername)
+        if zip_info is None or crc != zip_info.CRC or size != zip_info.file_size:
+            return False
+        self._zip_infos.append(zip_info)
+        return True
+
+
+class _ParallelZipPkgWriter(_ZipPkgWriter):
+    """Zip-file package writer that deflates members on a pool of worker threads.
+
+    zlib releases the GIL while compressing, so members are compressed concurrently while the
+    caller goes on to serialize further parts. Compressed members are appended to the archive in
+    the order they were written, so the archive has the same members in the same sequence as one
+    produced by |_ZipPkgWriter|.
+    """
+
+    def __init__(
+        self, pkg_file: str | IO[bytes], compression_policy: _CompressionPolicy, workers: int
+    ):
+        super(_ParallelZipPkgWriter, self).__init__(pkg_file, compression_policy)
+        self._workers = workers
+        self._pending: Deque[Future[tuple[zipfile.ZipInfo, bytes]]] = collections.deque()
+
+    def __exit__(self, *exc: list[Any]) -> None:
+        """Append members still being compressed, then close the zip archive."""
+        try:
+            self._append_compressed(wait=True)
+        finally:
+            self._executor.shutdown()
+            super(_ParallelZipPkgWriter, self).__exit__(*exc)
+
+    def write(self, pack_uri: PackURI, blob: bytes, content_type: str = CT.XML) -> None:
+        """Queue `blob` to be compressed by a worker thread and appended as `pack_uri`."""
+        compress_type, compresslevel = self._compression_policy(content_type)
+        self._pending.append(
+            self._executor.submit(
+                self._compress, pack_uri.membername, blob, compress_type, compresslevel
+            )
+        )
+        self._append_compressed()
+
+    def _append_compressed(self, wait: bool = False) -> None:
+        """Append each compressed member at the head of the queue to the archive.
+
+        Appending stops at the first member still being compressed, unless `wait` is True or
+        the queue is long enough that uncompressed blobs might pile up in memory, in which case
+        this waits for that member.
+        """
+        pending = self._pending
+        while pending and (wait or len(pending) > 2 * self._workers or pending[0].done()):
+            zip_info, data = pending.popleft().result()
+            super(_ParallelZipPkgWriter, self)._write_compressed(zip_info, data)
+
+    @lazyproperty
+    def _executor(self) -> ThreadPoolExecutor:
+        """Thread pool on which members are compressed."""
+        return ThreadPoolExecutor(max_workers=self._workers)
+
+    def _write_compressed(self, zip_info: zipfile.ZipInfo, data: bytes) -> None:
+        """Queue member having already-compressed `data` behind those still being compressed."""
+        future: Future[tuple[zipfile.ZipInfo, bytes]] = Future()
+        future.set_result((zip_info, data))
+        self._pending.append(future)
+        self._append_compressed()
+
+
+class _ChunkStream(io.RawIOBase):
+    """Write-only stream that accumulates the bytes written to it until they are drained.
+
+    It cannot seek or tell, which a zip package writer does not need, each member being written
+    straight through.
+    """
+
+    def __init__(self):
+        super(_ChunkStream, self).__init__()
+        self._chunks: list[bytes] = []
+
+    def drain(self) -> Iterator[bytes]:
+        """Generate each chunk written since the last drain, discarding it from this stream."""
+        chunks, self._chunks = self._chunks, []
+        return iter(chunks)
+
+    def writable(self) -> bool:
+        """This stream is always writable."""
+        return True
+
+    def write(self, b: Any) -> int:
+        """Accumulate bytes-like `b` as a chunk, returning its length in bytes."""
+        chunk = bytes(b)
+        self._chunks.append(chunk)
+        return len(chunk)
+
+
+class _CompressionPolicy:
+    """Decides how each member of a zip package is compressed, based on its content type.
+
+    When `level` is |None|, every member is deflated at the default level, as `zipfile` does it.
+    Otherwise `level` is a deflate level from 0 to 9 and members of an already-compressed content
+    type, like JPEG images, video, or embedded Excel workbooks, are stored without compression.
+    Deflating those costs time and saves little or nothing. All other members, XML in particular,
+    are deflated at `level`. A `level` of 0 stores every member.
+    """
+
+    def __init__(self, level: int | None):
+        if level is not None and not 0 <= level <= 9:
+            raise ValueError(f"compression level must be between 0 and 9, got {level}")
+        self._level = level
+
+    def __call__(self, content_type: str) -> tuple[int, int | None]:
+        """Return (compress_type, compresslevel) pair for member having `content_type`."""
+        level = self._level
+        if level is None:
+            return zipfile.ZIP_DEFLATED, None
+        if level == 0 or self._is_compressed(content_type):
+            return zipfile.ZIP_STORED, None
+        return zipfile.ZIP_DEFLATED, level
+
+    @staticmethod
+    def _is_compressed(content_type: str) -> bool:
+        """True when content of `content_type` is already compressed.
+
+        Any audio or video content type is taken to be compressed, since media parts can have a
+        content type not among the known ones.
+        """
+        return content_type in compressed_content_types or content_type.startswith(
+            ("audio/", "video/")
         )
 
 
@@ -294,3 +965,73 @@ class _ContentTypesItem:
                 overrides[partname] = content_type
 
         return defaults, overrides
+
+
+def _central_directory_entry(zip_info: zipfile.ZipInfo) -> bytes:
+    """Return central-directory entry for the member described by `zip_info`.
+
+    Sizes and offset too large for the entry are given in a ZIP64 extra field instead, as
+    `zipfile` does.
+    """
+    dt = zip_info.date_time
+    dosdate = (dt[0] - 1980) << 9 | dt[1] << 5 | dt[2]
+    dostime = dt[3] << 11 | dt[4] << 5 | (dt[5] // 2)
+    file_size, compress_size = zip_info.file_size, zip_info.compress_size
+    header_offset = zip_info.header_offset
+
+    zip64_fields: list[int] = []
+    if file_size > _ZIP64_LIMIT or compress_size > _ZIP64_LIMIT:
+        zip64_fields += [file_size, compress_size]
+        file_size = compress_size = 0xFFFFFFFF
+    if header_offset > _ZIP64_LIMIT:
+        zip64_fields.append(header_offset)
+        header_offset = 0xFFFFFFFF
+    extra = _strip_zip64_extra(zip_info.extra)
+    min_version = 0
+    if zip64_fields:
+        n = len(zip64_fields)
+        extra = struct.pack("<HH%dQ" % n, 1, 8 * n, *zip64_fields) + extra
+        min_version = 45
+
+    try:
+        filename, flag_bits = zip_info.filename.encode("ascii"), zip_info.flag_bits & ~0x800
+    except UnicodeEncodeError:
+        filename, flag_bits = zip_info.filename.encode("utf-8"), zip_info.flag_bits | 0x800
+    return (
+        _CENTRAL_DIRECTORY_ENTRY.pack(
+            b"PK\x01\x02",
+            max(min_version, zip_info.create_version),
+            zip_info.create_system,
+            max(min_version, zip_info.extract_version),
+            zip_info.reserved,
+            flag_bits,
+            zip_info.compress_type,
+            dostime,
+            dosdate,
+            zip_info.CRC,
+            compress_size,
+            file_size,
+            len(filename),
+            len(extra),
+            len(zip_info.comment),
+            0,
+            zip_info.internal_attr,
+            zip_info.external_attr,
+            header_offset,
+        )
+        + filename
+        + extra
+        + zip_info.comment
+    )
+
+
+def _strip_zip64_extra(extra: bytes) -> bytes:
+    """Return `extra` with any ZIP64 field removed, leaving the other extra fields."""
+    fields: list[bytes] = []
+    i = 0
+    while i + 4 <= len(extra):
+        field_id, size = struct.unpack("<HH", extra[i : i + 4])
+        if field_id != 1:
+            fields.append(extra[i : i + 4 + size])
+        i += 4 + size
+    return b"".join(fields)
@@ -42,3 +42,25 @@ image_content_types = {
     "wdp": CT.MS_PHOTO,
     "wmf": CT.X_WMF,
 }
+
+
+# -- content types of parts whose content is already compressed, such that deflating them again
+# -- costs time for little or no reduction in size. Embedded Office documents are zip packages.
+compressed_content_types = {
+    CT.ASF,
+    CT.AVI,
+    CT.GIF,
+    CT.JPEG,
+    CT.MOV,
+    CT.MP4,
+    CT.MPG,
+    CT.MS_PHOTO,
+    CT.MS_VIDEO,
+    CT.PML_PRESENTATION,
+    CT.PNG,
+    CT.SML_SHEET,
+    CT.VIDEO,
+    CT.WML_DOCUMENT,
+    CT.WMV,
+    CT.X_MS_VIDEO,
+}
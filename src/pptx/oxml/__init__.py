@@ -5,8 +5,10 @@ Also makes available a handful of functions that wrap its typical uses.
 
 from __future__ import annotations
 
+import copy
 import os
-from typing import TYPE_CHECKING, Type
+import threading
+from typing import TYPE_CHECKING, Callable, Type
 
 from lxml import etree
 
@@ -21,6 +23,26 @@ element_class_lookup = etree.ElementNamespaceClassLookup()
 oxml_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
 oxml_parser.set_element_class_lookup(element_class_lookup)
 
+# -- an lxml parser parses for only one thread at a time, so each thread parses with its own --
+_thread_parsers = threading.local()
+_thread_parsers.parser = oxml_parser
+
+# -- {key: element} of each prototype parsed by `clone_prototype()`, never handed out itself --
+_prototypes: dict[str, BaseOxmlElement] = {}
+
+
+def clone_prototype(key: str, xml: Callable[[], str]) -> BaseOxmlElement:
+    """Return a new copy of the prototype element identified by `key`.
+
+    The prototype is parsed from the XML returned by `xml()` on the first call for `key` and kept
+    from then on, so each later call only copies it, which is several times faster than parsing.
+    The caller patches the variable parts of the copy, like its id and position.
+    """
+    prototype = _prototypes.get(key)
+    if prototype is None:
+        prototype = _prototypes[key] = parse_xml(xml())
+    return copy.deepcopy(prototype)
+
 
 def parse_from_template(template_file_name: str):
     """Return an element loaded from the XML in the template file identified by `template_name`."""
@@ -33,7 +55,7 @@ def parse_from_template(template_file_name: str):
 
 def parse_xml(xml: str | bytes):
     """Return root lxml element obtained by parsing XML character string in `xml`."""
-    return etree.fromstring(xml, oxml_parser)
+    return etree.fromstring(xml, _thread_parser())
 
 
 def register_element_cls(nsptagname: str, cls: Type[BaseOxmlElement]):
@@ -46,6 +68,21 @@ def register_element_cls(nsptagname: str, cls: Type[BaseOxmlElement]):
     namespace[nsptag.local_part] = cls
 
 
+def _thread_parser() -> etree.XMLParser:
+    """Return the oxml parser for the calling thread, creating it on first call from a thread.
+
+    The parser of each thread is configured like `oxml_parser`, which is the parser of the thread
+    that first imported this module, so parts can be parsed concurrently on worker threads.
+    """
+    parser = getattr(_thread_parsers, "parser", None)
+    if parser is None:
+        parser = _thread_parsers.parser = etree.XMLParser(
+            remove_blank_text=True, resolve_entities=False
+        )
+        parser.set_element_class_lookup(element_class_lookup)
+    return parser
+
+
 from pptx.oxml.action import CT_Hyperlink  # noqa: E402
 
 register_element_cls("a:hlinkClick", CT_Hyperlink)
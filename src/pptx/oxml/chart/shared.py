@@ -16,6 +16,7 @@ from pptx.oxml.xmlchemy import (
     OptionalAttribute,
     RequiredAttribute,
     ZeroOrOne,
+    check_writable,
 )
 
 
@@ -47,6 +48,7 @@ class CT_Boolean_Explicit(BaseOxmlElement):
     @val.setter
     def val(self, value):
         val_str = "1" if bool(value) is True else "0"
+        check_writable(self)
         self.set("val", val_str)
 
 
@@ -10,7 +10,7 @@ from lxml.etree import _Element  # pyright: ignore[reportPrivateUsage]
 
 from pptx.oxml import parse_xml
 from pptx.oxml.ns import nsdecls, qn
-from pptx.oxml.xmlchemy import BaseOxmlElement, ZeroOrOne
+from pptx.oxml.xmlchemy import BaseOxmlElement, ZeroOrOne, check_writable
 
 
 class CT_CoreProperties(BaseOxmlElement):
@@ -162,6 +162,7 @@ class CT_CoreProperties(BaseOxmlElement):
         if not isinstance(value, int) or value < 1:  # pyright: ignore[reportUnnecessaryIsInstance]
             tmpl = "revision property requires positive int, got '%s'"
             raise ValueError(tmpl % value)
+        check_writable(self)
         revision = self.get_or_add_revision()
         revision.text = str(value)
 
@@ -258,6 +259,7 @@ class CT_CoreProperties(BaseOxmlElement):
         if not isinstance(value, dt.datetime):  # pyright: ignore[reportUnnecessaryIsInstance]
             tmpl = "property requires <type 'datetime.datetime'> object, got %s"
             raise ValueError(tmpl % type(value))
+        check_writable(self)
         element = self._get_or_add(prop_name)
         dt_str = value.strftime("%Y-%m-%dT%H:%M:%SZ")
         element.text = dt_str
@@ -276,6 +278,7 @@ class CT_CoreProperties(BaseOxmlElement):
         if len(value) > 255:
             tmpl = "exceeded 255 char limit for property, got:\n\n'%s'"
             raise ValueError(tmpl % value)
+        check_writable(self)
         element = self._get_or_add(prop_name)
         element.text = value
 
@@ -7,7 +7,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Callable, cast
 
 from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE, PP_PLACEHOLDER
-from pptx.oxml import parse_xml
+from pptx.oxml import clone_prototype, parse_xml
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.shapes.shared import BaseShapeElement
 from pptx.oxml.simpletypes import (
@@ -245,51 +245,84 @@ class CT_Shape(BaseShapeElement):
         """`a:ln` grand-child element or |None| if not present."""
         return self.spPr.ln
 
+    @staticmethod
+    def autoshape_sp_xml(
+        id_: int,
+        name: str,
+        prst: str,
+        x: int,
+        y: int,
+        cx: int,
+        cy: int,
+        fill: str | None = None,
+        text: str | None = None,
+        xmlns: str = "",
+    ) -> str:
+        """Return XML of a `p:sp` element configured as an auto shape, see `new_autoshape_sp()`.
+
+        `fill` is the hex RGB value of a solid fill, like "3C2F80", the fill of the shape style
+        is used when it is |None|. `text` is the text of the shape, as assigned to the `.text`
+        property of its text frame. The root element has the namespace declarations in `xmlns`,
+        none by default, for parsing inside an element that declares the "a" and "p" prefixes.
+        """
+        fill_xml = "" if fill is None else _solidFill_xml(fill)
+        p_xml = '<a:p><a:pPr algn="ctr"/></a:p>' if text is None else CT_TextBody.p_lst_xml(text)
+        return (
+            f"<p:sp{xmlns and ' '}{xmlns}>\n"
+            f"  <p:nvSpPr>\n"
+            f'    <p:cNvPr id="{id_}" name="{name}"/>\n'
+            f"    <p:cNvSpPr/>\n"
+            f"    <p:nvPr/>\n"
+            f"  </p:nvSpPr>\n"
+            f"  <p:spPr>\n"
+            f"    <a:xfrm>\n"
+            f'      <a:off x="{x}" y="{y}"/>\n'
+            f'      <a:ext cx="{cx}" cy="{cy}"/>\n'
+            f"    </a:xfrm>\n"
+            f'    <a:prstGeom prst="{prst}">\n'
+            f"      <a:avLst/>\n"
+            f"    </a:prstGeom>\n"
+            f"    {fill_xml}\n"
+            f"  </p:spPr>\n"
+            f"  <p:style>\n"
+            f'    <a:lnRef idx="1">\n'
+            f'      <a:schemeClr val="accent1"/>\n'
+            f"    </a:lnRef>\n"
+            f'    <a:fillRef idx="3">\n'
+            f'      <a:schemeClr val="accent1"/>\n'
+            f"    </a:fillRef>\n"
+            f'    <a:effectRef idx="2">\n'
+            f'      <a:schemeClr val="accent1"/>\n'
+            f"    </a:effectRef>\n"
+            f'    <a:fontRef idx="minor">\n'
+            f'      <a:schemeClr val="lt1"/>\n'
+            f"    </a:fontRef>\n"
+            f"  </p:style>\n"
+            f"  <p:txBody>\n"
+            f'    <a:bodyPr rtlCol="0" anchor="ctr"/>\n'
+            f"    <a:lstStyle/>\n"
+            f"    {p_xml}\n"
+            f"  </p:txBody>\n"
+            f"</p:sp>"
+        )
+
     @staticmethod
     def new_autoshape_sp(
         id_: int, name: str, prst: str, left: int, top: int, width: int, height: int
     ) -> CT_Shape:
         """Return a new `p:sp` element tree configured as a base auto shape."""
-        xml = (
-            "<p:sp %s>\n"
-            "  <p:nvSpPr>\n"
-            '    <p:cNvPr id="%s" name="%s"/>\n'
-            "    <p:cNvSpPr/>\n"
-            "    <p:nvPr/>\n"
-            "  </p:nvSpPr>\n"
-            "  <p:spPr>\n"
-            "    <a:xfrm>\n"
-            '      <a:off x="%s" y="%s"/>\n'
-            '      <a:ext cx="%s" cy="%s"/>\n'
-            "    </a:xfrm>\n"
-            '    <a:prstGeom prst="%s">\n'
-            "      <a:avLst/>\n"
-            "    </a:prstGeom>\n"
-            "  </p:spPr>\n"
-            "  <p:style>\n"
-            '    <a:lnRef idx="1">\n'
-            '      <a:schemeClr val="accent1"/>\n'
-            "    </a:lnRef>\n"
-            '    <a:fillRef idx="3">\n'
-            '      <a:schemeClr val="accent1"/>\n'
-            "    </a:fillRef>\n"
-            '    <a:effectRef idx="2">\n'
-            '      <a:schemeClr val="accent1"/>\n'
-            "    </a:effectRef>\n"
-            '    <a:fontRef idx="minor">\n'
-            '      <a:schemeClr val="lt1"/>\n'
-            "    </a:fontRef>\n"
-            "  </p:style>\n"
-            "  <p:txBody>\n"
-            '    <a:bodyPr rtlCol="0" anchor="ctr"/>\n'
-            "    <a:lstStyle/>\n"
-            "    <a:p>\n"
-            '      <a:pPr algn="ctr"/>\n'
-            "    </a:p>\n"
-            "  </p:txBody>\n"
-            "</p:sp>" % (nsdecls("a", "p"), "%d", "%s", "%d", "%d", "%d", "%d", "%s")
-        ) % (id_, name, left, top, width, height, prst)
-        return cast(CT_Shape, parse_xml(xml))
+        sp = cast(
+            CT_Shape,
+            clone_prototype(
+                "p:sp/autoshape",
+                lambda: CT_Shape.autoshape_sp_xml(
+                    0, "", "rect", 0, 0, 0, 0, xmlns=nsdecls("a", "p")
+                ),
+            ),
+        )
+        sp._init_clone(sp.nvSpPr.cNvPr, id_, name, left, top, width, height)
+        sp.prstGeom.set("prst", prst)
+        return sp
 
     @staticmethod
     def new_freeform_sp(shape_id: int, name: str, x: int, y: int, cx: int, cy: int):
@@ -298,51 +331,9 @@ class CT_Shape(BaseShapeElement):
         The returned shape has a `a:custGeom` subtree but no paths in its
         path list.
         """
-        xml = (
-            "<p:sp %s>\n"
-            "  <p:nvSpPr>\n"
-            '    <p:cNvPr id="%s" name="%s"/>\n'
-            "    <p:cNvSpPr/>\n"
-            "    <p:nvPr/>\n"
-            "  </p:nvSpPr>\n"
-            "  <p:spPr>\n"
-            "    <a:xfrm>\n"
-            '      <a:off x="%s" y="%s"/>\n'
-            '      <a:ext cx="%s" cy="%s"/>\n'
-            "    </a:xfrm>\n"
-            "    <a:custGeom>\n"
-            "      <a:avLst/>\n"
-            "      <a:gdLst/>\n"
-            "      <a:ahLst/>\n"
-            "      <a:cxnLst/>\n"
-            '      <a:rect l="l" t="t" r="r" b="b"/>\n'
-            "      <a:pathLst/>\n"
-            "    </a:custGeom>\n"
-            "  </p:spPr>\n"
-            "  <p:style>\n"
-            '    <a:lnRef idx="1">\n'
-            '      <a:schemeClr val="accent1"/>\n'
-            "    </a:lnRef>\n"
-            '    <a:fillRef idx="3">\n'
-            '      <a:schemeClr val="accent1"/>\n'
-            "    </a:fillRef>\n"
-            '    <a:effectRef idx="2">\n'
-            '      <a:schemeClr val="accent1"/>\n'
-            "    </a:effectRef>\n"
-            '    <a:fontRef idx="minor">\n'
-            '      <a:schemeClr val="lt1"/>\n'
-            "    </a:fontRef>\n"
-            "  </p:style>\n"
-            "  <p:txBody>\n"
-            '    <a:bodyPr rtlCol="0" anchor="ctr"/>\n'
-            "    <a:lstStyle/>\n"
-            "    <a:p>\n"
-            '      <a:pPr algn="ctr"/>\n'
-            "    </a:p>\n"
-            "  </p:txBody>\n"
-            "</p:sp>" % (nsdecls("a", "p"), "%d", "%s", "%d", "%d", "%d", "%d")
-        ) % (shape_id, name, x, y, cx, cy)
-        return cast(CT_Shape, parse_xml(xml))
+        sp = cast(CT_Shape, clone_prototype("p:sp/freeform", CT_Shape._freeform_sp_xml))
+        sp._init_clone(sp.nvSpPr.cNvPr, shape_id, name, x, y, cx, cy)
+        return sp
 
     @staticmethod
     def new_placeholder_sp(
@@ -387,11 +378,64 @@ class CT_Shape(BaseShapeElement):
     @staticmethod
     def new_textbox_sp(id_, name, left, top, width, height):
         """Return a new `p:sp` element tree configured as a base textbox shape."""
-        tmpl = CT_Shape._textbox_sp_tmpl()
-        xml = tmpl % (id_, name, left, top, width, height)
-        sp = parse_xml(xml)
+        sp = cast(
+            CT_Shape,
+            clone_prototype(
+                "p:sp/textbox",
+                lambda: CT_Shape.textbox_sp_xml(0, "", 0, 0, 0, 0, xmlns=nsdecls("a", "p")),
+            ),
+        )
+        sp._init_clone(sp.nvSpPr.cNvPr, id_, name, left, top, width, height)
         return sp
 
+    @staticmethod
+    def _freeform_sp_xml() -> str:
+        """XML of the prototype `p:sp` element of a freeform shape, having no paths."""
+        return (
+            "<p:sp %s>\n"
+            "  <p:nvSpPr>\n"
+            '    <p:cNvPr id="0" name=""/>\n'
+            "    <p:cNvSpPr/>\n"
+            "    <p:nvPr/>\n"
+            "  </p:nvSpPr>\n"
+            "  <p:spPr>\n"
+            "    <a:xfrm>\n"
+            '      <a:off x="0" y="0"/>\n'
+            '      <a:ext cx="0" cy="0"/>\n'
+            "    </a:xfrm>\n"
+            "    <a:custGeom>\n"
+            "      <a:avLst/>\n"
+            "      <a:gdLst/>\n"
+            "      <a:ahLst/>\n"
+            "      <a:cxnLst/>\n"
+            '      <a:rect l="l" t="t" r="r" b="b"/>\n'
+            "      <a:pathLst/>\n"
+            "    </a:custGeom>\n"
+            "  </p:spPr>\n"
+            "  <p:style>\n"
+            '    <a:lnRef idx="1">\n'
+            '      <a:schemeClr val="accent1"/>\n'
+            "    </a:lnRef>\n"
+            '    <a:fillRef idx="3">\n'
+            '      <a:schemeClr val="accent1"/>\n'
+            "    </a:fillRef>\n"
+            '    <a:effectRef idx="2">\n'
+            '      <a:schemeClr val="accent1"/>\n'
+            "    </a:effectRef>\n"
+            '    <a:fontRef idx="minor">\n'
+            '      <a:schemeClr val="lt1"/>\n'
+            "    </a:fontRef>\n"
+            "  </p:style>\n"
+            "  <p:txBody>\n"
+            '    <a:bodyPr rtlCol="0" anchor="ctr"/>\n'
+            "    <a:lstStyle/>\n"
+            "    <a:p>\n"
+            '      <a:pPr algn="ctr"/>\n'
+            "    </a:p>\n"
+            "  </p:txBody>\n"
+            "</p:sp>" % nsdecls("a", "p")
+        )
+
     @property
     def prst(self):
         """Value of `prst` attribute of `a:prstGeom` element or |None| if not present."""
@@ -412,33 +456,50 @@ class CT_Shape(BaseShapeElement):
         return CT_TextBody.new_p_txBody()
 
     @staticmethod
-    def _textbox_sp_tmpl():
+    def textbox_sp_xml(
+        id_: int,
+        name: str,
+        x: int,
+        y: int,
+        cx: int,
+        cy: int,
+        fill: str | None = None,
+        text: str | None = None,
+        xmlns: str = "",
+    ) -> str:
+        """Return XML of a `p:sp` element configured as a text box, see `new_textbox_sp()`.
+
+        `fill`, `text` and `xmlns` are as for `autoshape_sp_xml()`, except the text box has no
+        fill when `fill` is |None|.
+        """
+        fill_xml = "<a:noFill/>" if fill is None else _solidFill_xml(fill)
+        p_xml = "<a:p/>" if text is None else CT_TextBody.p_lst_xml(text)
         return (
-            "<p:sp %s>\n"
+            "<p:sp%s>\n"
             "  <p:nvSpPr>\n"
-            '    <p:cNvPr id="%s" name="%s"/>\n'
+            '    <p:cNvPr id="%d" name="%s"/>\n'
             '    <p:cNvSpPr txBox="1"/>\n'
             "    <p:nvPr/>\n"
             "  </p:nvSpPr>\n"
             "  <p:spPr>\n"
             "    <a:xfrm>\n"
-            '      <a:off x="%s" y="%s"/>\n'
-            '      <a:ext cx="%s" cy="%s"/>\n'
+            '      <a:off x="%d" y="%d"/>\n'
+            '      <a:ext cx="%d" cy="%d"/>\n'
             "    </a:xfrm>\n"
             '    <a:prstGeom prst="rect">\n'
             "      <a:avLst/>\n"
             "    </a:prstGeom>\n"
-            "    <a:noFill/>\n"
+            "    %s\n"
             "  </p:spPr>\n"
             "  <p:txBody>\n"
             '    <a:bodyPr wrap="none">\n'
             "      <a:spAutoFit/>\n"
             "    </a:bodyPr>\n"
             "    <a:lstStyle/>\n"
-            "    <a:p/>\n"
+            "    %s\n"
             "  </p:txBody>\n"
-            "</p:sp>" % (nsdecls("a", "p"), "%d", "%s", "%d", "%d", "%d", "%d")
-        )
+            "</p:sp>"
+        ) % (xmlns and " " + xmlns, id_, name, x, y, cx, cy, fill_xml, p_xml)
 
 
 class CT_ShapeNonVisual(BaseShapeElement):
@@ -453,3 +514,8 @@ class CT_ShapeNonVisual(BaseShapeElement):
     nvPr: CT_ApplicationNonVisualDrawingProps = (  # pyright: ignore[reportAssignmentType]
         OneAndOnlyOne("p:nvPr")
     )
+
+
+def _solidFill_xml(rgb: str) -> str:
+    """Return XML of an `a:solidFill` element of the color having hex RGB value `rgb`."""
+    return f'<a:solidFill><a:srgbClr val="{rgb}"/></a:solidFill>'
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, cast
 
-from pptx.oxml import parse_xml
+from pptx.oxml import clone_prototype
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.shapes.shared import BaseShapeElement
 from pptx.oxml.simpletypes import ST_DrawingElementId, XsdUnsignedInt
@@ -32,6 +32,67 @@ class CT_Connector(BaseShapeElement):
     spPr: CT_ShapeProperties = OneAndOnlyOne("p:spPr")  # pyright: ignore[reportAssignmentType]
     del _tag_seq
 
+    @staticmethod
+    def cxnSp_xml(
+        id_: int,
+        name: str,
+        prst: str,
+        x: int,
+        y: int,
+        cx: int,
+        cy: int,
+        flipH: bool,
+        flipV: bool,
+        line: str | None = None,
+        xmlns: str = "",
+    ) -> str:
+        """Return XML of a `p:cxnSp` element configured as a base connector.
+
+        `line` is the hex RGB value of the line color, like "3C2F80", the line color of the
+        connector style is used when it is |None|. The root element has the namespace
+        declarations in `xmlns`, none by default, for parsing inside an element that declares the
+        "a" and "p" prefixes.
+        """
+        flip = (' flipH="1"' if flipH else "") + (' flipV="1"' if flipV else "")
+        ln_xml = (
+            ""
+            if line is None
+            else f'<a:ln><a:solidFill><a:srgbClr val="{line}"/></a:solidFill></a:ln>'
+        )
+        return (
+            f"<p:cxnSp{xmlns and ' '}{xmlns}>\n"
+            f"  <p:nvCxnSpPr>\n"
+            f'    <p:cNvPr id="{id_}" name="{name}"/>\n'
+            f"    <p:cNvCxnSpPr/>\n"
+            f"    <p:nvPr/>\n"
+            f"  </p:nvCxnSpPr>\n"
+            f"  <p:spPr>\n"
+            f"    <a:xfrm{flip}>\n"
+            f'      <a:off x="{x}" y="{y}"/>\n'
+            f'      <a:ext cx="{cx}" cy="{cy}"/>\n'
+            f"    </a:xfrm>\n"
+            f'    <a:prstGeom prst="{prst}">\n'
+            f"      <a:avLst/>\n"
+            f"    </a:prstGeom>\n"
+            f"    {ln_xml}\n"
+            f"  </p:spPr>\n"
+            f"  <p:style>\n"
+            f'    <a:lnRef idx="2">\n'
+            f'      <a:schemeClr val="accent1"/>\n'
+            f"    </a:lnRef>\n"
+            f'    <a:fillRef idx="0">\n'
+            f'      <a:schemeClr val="accent1"/>\n'
+            f"    </a:fillRef>\n"
+            f'    <a:effectRef idx="1">\n'
+            f'      <a:schemeClr val="accent1"/>\n'
+            f"    </a:effectRef>\n"
+            f'    <a:fontRef idx="minor">\n'
+            f'      <a:schemeClr val="tx1"/>\n'
+            f"    </a:fontRef>\n"
+            f"  </p:style>\n"
+            f"</p:cxnSp>"
+        )
+
     @classmethod
     def new_cxnSp(
         cls,
@@ -46,42 +107,24 @@ class CT_Connector(BaseShapeElement):
         flipV: bool,
     ) -> CT_Connector:
         """Return a new `p:cxnSp` element tree configured as a base connector."""
-        flip = (' flipH="1"' if flipH else "") + (' flipV="1"' if flipV else "")
-        return cast(
+        cxnSp = cast(
             CT_Connector,
-            parse_xml(
-                f"<p:cxnSp {nsdecls('a', 'p')}>\n"
-                f"  <p:nvCxnSpPr>\n"
-                f'    <p:cNvPr id="{id_}" name="{name}"/>\n'
-                f"    <p:cNvCxnSpPr/>\n"
-                f"    <p:nvPr/>\n"
-                f"  </p:nvCxnSpPr>\n"
-                f"  <p:spPr>\n"
-                f"    <a:xfrm{flip}>\n"
-                f'      <a:off x="{x}" y="{y}"/>\n'
-                f'      <a:ext cx="{cx}" cy="{cy}"/>\n'
-                f"    </a:xfrm>\n"
-                f'    <a:prstGeom prst="{prst}">\n'
-                f"      <a:avLst/>\n"
-                f"    </a:prstGeom>\n"
-                f"  </p:spPr>\n"
-                f"  <p:style>\n"
-                f'    <a:lnRef idx="2">\n'
-                f'      <a:schemeClr val="accent1"/>\n'
-                f"    </a:lnRef>\n"
-                f'    <a:fillRef idx="0">\n'
-                f'      <a:schemeClr val="accent1"/>\n'
-                f"    </a:fillRef>\n"
-                f'    <a:effectRef idx="1">\n'
-                f'      <a:schemeClr val="accent1"/>\n'
-                f"    </a:effectRef>\n"
-                f'    <a:fontRef idx="minor">\n'
-                f'      <a:schemeClr val="tx1"/>\n'
-                f"    </a:fontRef>\n"
-                f"  </p:style>\n"
-                f"</p:cxnSp>"
+            clone_prototype(
+                "p:cxnSp",
+                lambda: cls.cxnSp_xml(
+                    0, "", "line", 0, 0, 0, 0, False, False, xmlns=nsdecls("a", "p")
+                ),
             ),
         )
+        spPr = cxnSp.spPr
+        xfrm = spPr.xfrm
+        if flipH:
+            xfrm.set("flipH", "1")
+        if flipV:
+            xfrm.set("flipV", "1")
+        cxnSp._init_clone(cxnSp.nvCxnSpPr.cNvPr, id_, name, x, y, cx, cy)
+        spPr.prstGeom.set("prst", prst)
+        return cxnSp
 
 
 class CT_ConnectorNonVisual(BaseOxmlElement):
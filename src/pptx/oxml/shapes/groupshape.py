@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Iterator
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
 
 from pptx.enum.shapes import MSO_CONNECTOR_TYPE
 from pptx.oxml import parse_xml
@@ -12,7 +12,7 @@ from pptx.oxml.shapes.connector import CT_Connector
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from pptx.oxml.shapes.picture import CT_Picture
 from pptx.oxml.shapes.shared import BaseShapeElement
-from pptx.oxml.xmlchemy import BaseOxmlElement, OneAndOnlyOne, ZeroOrOne
+from pptx.oxml.xmlchemy import BaseOxmlElement, OneAndOnlyOne, ZeroOrOne, next_id
 from pptx.util import Emu
 
 if TYPE_CHECKING:
@@ -68,7 +68,7 @@ class CT_GroupShape(BaseShapeElement):
 
     def add_freeform_sp(self, x: int, y: int, cx: int, cy: int) -> CT_Shape:
         """Append a new freeform `p:sp` with specified position and size."""
-        shape_id = self._next_shape_id
+        shape_id = self.allocate_shape_id()
         name = "Freeform %d" % (shape_id - 1,)
         sp = CT_Shape.new_freeform_sp(shape_id, name, x, y, cx, cy)
         self.insert_element_before(sp, "p:extLst")
@@ -80,7 +80,7 @@ class CT_GroupShape(BaseShapeElement):
         The element contains no sub-shapes, is positioned at (0, 0), and has
         width and height of zero.
         """
-        shape_id = self._next_shape_id
+        shape_id = self.allocate_shape_id()
         name = "Group %d" % (shape_id - 1,)
         grpSp = CT_GroupShape.new_grpSp(shape_id, name)
         self.insert_element_before(grpSp, "p:extLst")
@@ -102,6 +102,17 @@ class CT_GroupShape(BaseShapeElement):
         self.insert_element_before(sp, "p:extLst")
         return sp
 
+    def add_shapes(self, shape_xmls: Iterable[str]) -> None:
+        """Append the shape elements having the XML in `shape_xmls`, in order.
+
+        Each item is the XML of one shape element without namespace declarations, like that of
+        `CT_Shape.autoshape_sp_xml()`. The shapes are parsed together and moved into this
+        group/shapetree in one pass, which is much faster than adding a large number of shapes
+        one at a time.
+        """
+        xml = "<p:spTree %s>%s</p:spTree>" % (nsdecls("a", "p", "r"), "".join(shape_xmls))
+        self.move_children_from(parse_xml(xml), "p:extLst")
+
     def add_table(
         self, id_: int, name: str, rows: int, cols: int, x: int, y: int, cx: int, cy: int
     ) -> CT_GraphicalObjectFrame:
@@ -185,6 +196,30 @@ class CT_GroupShape(BaseShapeElement):
         grpSp = parse_xml(xml)
         return grpSp
 
+    def allocate_shape_id(self) -> int:
+        """Return a unique shape id suitable for use with a new shape element.
+
+        The returned id is 1 greater than the maximum @id used so far anywhere in the slide,
+        including ids returned earlier but not yet assigned, and is not returned again. Only the
+        first call for a slide searches it, so allocating an id takes constant time however many
+        shapes the slide has. In practice, the minimum id is 2 because the spTree element is always
+        assigned id="1".
+        """
+        return next_id(self.getroottree().getroot())
+
+    @property
+    def next_shape_id(self) -> int:
+        """The shape id the next call to `.allocate_shape_id()` will return.
+
+        Reading this property does not allocate the id.
+        """
+        return next_id(self.getroottree().getroot(), 0)
+
+    def next_shape_ids(self, count: int) -> range:
+        """Return `count` consecutive unique shape ids, each as would be `.allocate_shape_id()`."""
+        first_id = next_id(self.getroottree().getroot(), count)
+        return range(first_id, first_id + count)
+
     def recalculate_extents(self) -> None:
         """Adjust x, y, cx, and cy to incorporate all contained shapes.
 
@@ -233,21 +268,6 @@ class CT_GroupShape(BaseShapeElement):
 
         return x, y, cx, cy
 
-    @property
-    def _next_shape_id(self) -> int:
-        """Return unique shape id suitable for use with a new shape element.
-
-        The returned id is the next available positive integer drawing object
-        id in shape tree, starting from 1 and making use of any gaps in
-        numbering. In practice, the minimum id is 2 because the spTree
-        element itself is always assigned id="1".
-        """
-        id_str_lst = self.xpath("//@id")
-        used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
-        for n in range(1, len(used_ids) + 2):
-            if n not in used_ids:
-                return n
-
 
 class CT_GroupShapeNonVisual(BaseShapeElement):
     """`p:nvGrpSpPr` element."""
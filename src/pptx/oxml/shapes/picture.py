@@ -3,10 +3,9 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, cast
-from xml.sax.saxutils import escape
 
-from pptx.oxml import parse_xml
-from pptx.oxml.ns import nsdecls
+from pptx.oxml import clone_prototype, parse_xml
+from pptx.oxml.ns import nsdecls, qn
 from pptx.oxml.shapes.shared import BaseShapeElement
 from pptx.oxml.xmlchemy import BaseOxmlElement, OneAndOnlyOne
 
@@ -68,7 +67,15 @@ class CT_Picture(BaseShapeElement):
     @classmethod
     def new_pic(cls, shape_id, name, desc, rId, x, y, cx, cy):
         """Return new `<p:pic>` element tree configured with supplied parameters."""
-        return parse_xml(cls._pic_tmpl() % (shape_id, name, escape(desc), rId, x, y, cx, cy))
+        pic = cast(
+            CT_Picture,
+            clone_prototype("p:pic", lambda: cls._pic_tmpl() % (0, "", "", "", 0, 0, 0, 0)),
+        )
+        cNvPr = pic.nvPicPr.cNvPr
+        pic._init_clone(cNvPr, shape_id, name, x, y, cx, cy)
+        cNvPr.set("descr", desc)
+        pic.blipFill.blip.set(qn("r:embed"), rId)
+        return pic
 
     @classmethod
     def new_video_pic(
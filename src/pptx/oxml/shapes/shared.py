@@ -206,6 +206,23 @@ class BaseShapeElement(BaseOxmlElement):
         """
         return self.xpath("./*[1]")[0]
 
+    def _init_clone(
+        self, cNvPr: CT_NonVisualDrawingProps, id_: int, name: str, x: int, y: int, cx: int, cy: int
+    ) -> None:
+        """Set id, name, position and size of this shape element, cloned from its prototype.
+
+        `cNvPr` is the `p:cNvPr` element of this shape. The `a:xfrm` element of this shape must
+        have its `a:off` and `a:ext` children.
+        """
+        cNvPr.set("id", "%d" % id_)
+        cNvPr.set("name", name)
+        xfrm = self.xfrm
+        off, ext = xfrm.off, xfrm.ext
+        off.set("x", "%d" % x)
+        off.set("y", "%d" % y)
+        ext.set("cx", "%d" % cx)
+        ext.set("cy", "%d" % cy)
+
     def _get_xfrm_attr(self, name: str) -> Length | None:
         xfrm = self.xfrm
         if xfrm is None:
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import copy
 from typing import TYPE_CHECKING, Callable, Iterator, cast
 
 from pptx.enum.text import MSO_VERTICAL_ANCHOR
-from pptx.oxml import parse_xml
+from pptx.oxml import clone_prototype
 from pptx.oxml.dml.fill import CT_GradientFillProperties
-from pptx.oxml.ns import nsdecls
+from pptx.oxml.ns import nsdecls, qn
 from pptx.oxml.simpletypes import ST_Coordinate, ST_Coordinate32, XsdBoolean, XsdInt
 from pptx.oxml.text import CT_TextBody
 from pptx.oxml.xmlchemy import (
@@ -109,26 +110,31 @@ class CT_Table(BaseOxmlElement):
         if tableStyleId is None:
             tableStyleId = "{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}"
 
-        xml = cls._tbl_tmpl() % (tableStyleId)
-        tbl = cast(CT_Table, parse_xml(xml))
+        tbl = cast(CT_Table, clone_prototype("a:tbl", lambda: cls._tbl_tmpl() % ""))
+        tbl.tblPr.find(qn("a:tableStyleId")).text = tableStyleId
 
         # add specified number of rows and columns
         rowheight = height // rows
         colwidth = width // cols
 
+        tblGrid = tbl.tblGrid
         for col in range(cols):
             # adjust width of last col to absorb any div error
             if col == cols - 1:
                 colwidth = width - ((cols - 1) * colwidth)
-            tbl.tblGrid.add_gridCol(width=Emu(colwidth))
+            tblGrid.add_gridCol(width=Emu(colwidth))
 
-        for row in range(rows):
+        # -- build the first row, then copy it for the rest, which is faster than adding cells --
+        tr = tbl.add_tr(height=Emu(rowheight))
+        for col in range(cols):
+            tr.add_tc()
+        for row in range(1, rows):
             # adjust height of last row to absorb any div error
             if row == rows - 1:
                 rowheight = height - ((rows - 1) * rowheight)
-            tr = tbl.add_tr(height=Emu(rowheight))
-            for col in range(cols):
-                tr.add_tc()
+            tr = copy.deepcopy(tr)
+            tr.set("h", "%d" % rowheight)
+            tbl.append(tr)
 
         return tbl
 
@@ -308,15 +314,18 @@ class CT_TableCell(BaseOxmlElement):
         """Return a new `a:tc` element subtree."""
         return cast(
             CT_TableCell,
-            parse_xml(
-                f"<a:tc {nsdecls('a')}>\n"
-                f"  <a:txBody>\n"
-                f"    <a:bodyPr/>\n"
-                f"    <a:lstStyle/>\n"
-                f"    <a:p/>\n"
-                f"  </a:txBody>\n"
-                f"  <a:tcPr/>\n"
-                f"</a:tc>"
+            clone_prototype(
+                "a:tc",
+                lambda: (
+                    f"<a:tc {nsdecls('a')}>\n"
+                    f"  <a:txBody>\n"
+                    f"    <a:bodyPr/>\n"
+                    f"    <a:lstStyle/>\n"
+                    f"    <a:p/>\n"
+                    f"  </a:txBody>\n"
+                    f"  <a:tcPr/>\n"
+                    f"</a:tc>"
+                ),
             ),
         )
 
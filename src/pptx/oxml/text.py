@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Callable, cast
+from typing import TYPE_CHECKING, Callable, Iterator, cast
+from xml.sax.saxutils import escape
 
 from pptx.enum.lang import MSO_LANGUAGE_ID
 from pptx.enum.text import (
@@ -37,6 +38,7 @@ from pptx.oxml.xmlchemy import (
     ZeroOrMore,
     ZeroOrOne,
     ZeroOrOneChoice,
+    check_writable,
 )
 from pptx.util import Emu, Length
 
@@ -63,6 +65,7 @@ class CT_RegularTextRun(BaseOxmlElement):
 
     @text.setter
     def text(self, value: str):  # pyright: ignore[reportIncompatibleMethodOverride]
+        check_writable(self)
         self.t.text = self._escape_ctrl_chars(value)
 
     @staticmethod
@@ -167,6 +170,31 @@ class CT_TextBody(BaseOxmlElement):
         txPr = parse_xml(xml)
         return txPr
 
+    @staticmethod
+    def p_lst_xml(text: str) -> str:
+        """Return XML of the `a:p` elements assigning `text` to a text frame would produce.
+
+        Each line-feed in `text` starts a new paragraph and each vertical-tab becomes a line
+        break, as for the `.text` property of |TextFrame|. The XML has no namespace declarations,
+        for parsing inside an element that declares the "a" prefix.
+        """
+
+        def iter_p_content_xml(p_text: str) -> Iterator[str]:
+            for idx, r_str in enumerate(p_text.split("\v")):
+                # ---breaks are only added _between_ items, not at start---
+                if idx > 0:
+                    yield "<a:br/>"
+                # ---runs that would be empty are not added---
+                if r_str:
+                    t_text = CT_RegularTextRun._escape_ctrl_chars(  # pyright: ignore
+                        r_str
+                    )
+                    yield "<a:r><a:t>%s</a:t></a:r>" % escape(t_text)
+
+        return "".join(
+            "<a:p>%s</a:p>" % "".join(iter_p_content_xml(p_text)) for p_text in text.split("\n")
+        )
+
     def unclear_content(self):
         """Ensure p:txBody has at least one a:p child.
 
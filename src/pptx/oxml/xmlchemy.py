@@ -2,17 +2,57 @@
 
 from __future__ import annotations
 
+import collections
 import re
-from typing import Any, Callable, Iterable, Protocol, Sequence, Type, cast
+import weakref
+from typing import Any, Callable, Counter, Iterable, Protocol, Sequence, Type, cast
 
 from lxml import etree
 from lxml.etree import ElementBase, _Element  # pyright: ignore[reportPrivateUsage]
 
-from pptx.exc import InvalidXmlError
+from pptx.exc import InvalidXmlError, ReadOnlyError
 from pptx.oxml import oxml_parser
 from pptx.oxml.ns import NamespacePrefixedTag, _nsmap, qn  # pyright: ignore[reportPrivateUsage]
 from pptx.util import lazyproperty
 
+# -- {root-element: Counter} of the relationship references (r:id, r:embed, etc.) in each XML
+# -- tree that has been asked for them, see `rel_ref_counts()`.
+_rel_ref_counts: weakref.WeakKeyDictionary[BaseOxmlElement, Counter[str]] = (
+    weakref.WeakKeyDictionary()
+)
+
+# -- {root-element: Counter} of the shape names (`p:cNvPr/@name`) in each XML tree that has been
+# -- asked for them, see `shape_name_counts()`.
+_shape_name_counts: weakref.WeakKeyDictionary[BaseOxmlElement, Counter[str]] = (
+    weakref.WeakKeyDictionary()
+)
+
+# -- {root-element: int} the greatest @id value in each XML tree that has had an id allocated from
+# -- it, see `next_id()`.
+_max_ids: weakref.WeakKeyDictionary[BaseOxmlElement, int] = weakref.WeakKeyDictionary()
+
+# -- {element: int} the number of times a child has been added to or removed from each element
+# -- that has been asked for it, see `child_changes()`.
+_child_changes: weakref.WeakKeyDictionary[BaseOxmlElement, int] = weakref.WeakKeyDictionary()
+
+# -- root elements of the XML trees of parts of read-only packages, see `mark_read_only()` --
+_read_only_roots: weakref.WeakSet[BaseOxmlElement] = weakref.WeakSet()
+
+# -- every attribute in the relationships namespace is a reference to a relationship by rId --
+_rel_refs_xpath = etree.XPath("descendant-or-self::*/@r:*", namespaces={"r": _nsmap["r"]})
+
+_shape_names_xpath = etree.XPath("descendant-or-self::p:cNvPr/@name", namespaces={"p": _nsmap["p"]})
+_cNvPr_tag = qn("p:cNvPr")
+
+# -- XML id-values have document scope, so every `@id` is considered, not just those of shapes --
+_ids_xpath = etree.XPath("descendant-or-self::*/@id")
+
+# -- the same, for the descendants of an element only, see `BaseOxmlElement.move_children_from()`
+_descendant_rel_refs_xpath = etree.XPath("descendant::*/@r:*", namespaces={"r": _nsmap["r"]})
+_descendant_shape_names_xpath = etree.XPath(
+    "descendant::p:cNvPr/@name", namespaces={"p": _nsmap["p"]}
+)
+
 
 class AttributeType(Protocol):
     """Interface for an object that can act as an attribute type.
@@ -43,6 +83,178 @@ def OxmlElement(nsptag_str: str, nsmap: dict[str, str] | None = None) -> BaseOxm
     return oxml_parser.makeelement(nsptag.clark_name, nsmap=nsmap)
 
 
+def mark_read_only(root: BaseOxmlElement) -> None:
+    """Cause changes to the XML tree of `root` through this package's element classes to raise.
+
+    Adding, moving or removing an element in the tree, or assigning an attribute or text through
+    its property, raises |ReadOnlyError|. A change made directly through the `lxml` API is not
+    seen, so an element class that sets text or attributes through that API calls
+    `check_writable()` first.
+    """
+    _read_only_roots.add(root)
+
+
+def check_writable(element: _Element) -> None:
+    """Raise |ReadOnlyError| when `element` belongs to a tree marked read-only."""
+    # -- the common case of no read-only tree in the process is kept as cheap as possible --
+    if not _read_only_roots:
+        return
+    if element.getroottree().getroot() in _read_only_roots:
+        raise ReadOnlyError("presentation was opened read-only and cannot be changed")
+
+
+def next_id(root: _Element, count: int = 1) -> int:
+    """Return an integer @id value not yet used in the XML tree of `root`.
+
+    The id is 1 greater than the greatest integer @id in the tree, which is found by searching
+    the tree on the first call only. When `root` is a |BaseOxmlElement|, that maximum is kept
+    from then on, including each id returned, so later calls are free. An id-bearing element
+    added to the tree, or an `id` attribute assigned through its property, raises the maximum as
+    needed, so the returned id never collides with one already in the tree. An id assigned only
+    through the `lxml` API is not seen.
+
+    A `count` greater than 1 allocates that many consecutive ids, starting with the one returned.
+    A `count` of 0 returns the next id without allocating it.
+    """
+    if not isinstance(root, BaseOxmlElement):
+        return _max_id(root) + 1
+    max_id = _max_ids.get(root)
+    if max_id is None:
+        max_id = _max_id(root)
+    _max_ids[root] = max_id + count
+    return max_id + 1
+
+
+def _max_id(element: _Element) -> int:
+    """Return the greatest integer @id in `element` or its descendants, 0 if there is none."""
+    return max((int(id_str) for id_str in _ids_xpath(element) if id_str.isdigit()), default=0)
+
+
+def _note_ids(element: _Element, tree_element: _Element | None = None) -> None:
+    """Raise the maximum id kept for the tree of `element` to cover the ids in `element`.
+
+    The ids are noted for the tree of `tree_element` instead when it is given.
+    """
+    # -- the common case of no maximum kept for any tree is kept as cheap as possible --
+    if not _max_ids:
+        return
+    root = (element if tree_element is None else tree_element).getroottree().getroot()
+    if not isinstance(root, BaseOxmlElement):
+        return
+    max_id = _max_ids.get(root)
+    if max_id is None:
+        return
+    added_max_id = _max_id(element)
+    if added_max_id > max_id:
+        _max_ids[root] = added_max_id
+
+
+def child_changes(element: BaseOxmlElement) -> int:
+    """Return the number of times a child has been added to or removed from `element`.
+
+    Counting starts at 0 on the first call for `element` and is kept only while `element` itself
+    is referenced, so a caller comparing counts must hold on to `element`. A number unchanged
+    since an earlier call means the children of `element` are the same, in the same order, as
+    they were then. A change made only through the `lxml` API is not seen.
+    """
+    return _child_changes.setdefault(element, 0)
+
+
+def _note_child_change(element: _Element | None) -> None:
+    """Count a child added to or removed from `element`, when its changes are being counted."""
+    # -- the common case of no element having its changes counted is kept as cheap as possible --
+    if not _child_changes or element is None:
+        return
+    if isinstance(element, BaseOxmlElement) and element in _child_changes:
+        _child_changes[element] += 1
+
+
+def rel_ref_counts(root: _Element) -> Counter[str]:
+    """Return count of references to each rId in the XML tree of `root`.
+
+    The references are counted on the first call for a tree. When `root` is a |BaseOxmlElement|,
+    the same counts are kept current from then on as relationship-reference attributes, like
+    `r:id` and `r:embed`, are assigned and as elements are added to or removed from the tree, so
+    later calls are free. A change made only through the `lxml` API of a plain element is not
+    seen, which can only cause a reference to be counted after its removal.
+    """
+    if not isinstance(root, BaseOxmlElement):
+        return collections.Counter(_rel_refs_xpath(root))
+    counts = _rel_ref_counts.get(root)
+    if counts is None:
+        counts = _rel_ref_counts[root] = collections.Counter(_rel_refs_xpath(root))
+    return counts
+
+
+def _count_rel_refs(element: _Element, sign: int) -> None:
+    """Add (or subtract, for `sign` -1) the references in `element` to the counts of its tree."""
+    counts = _tree_counts(_rel_ref_counts, element)
+    if counts is None:
+        return
+    for rId in _rel_refs_xpath(element):
+        counts[rId] += sign
+
+
+def _recount_rel_ref(element: _Element, old_rId: str | None, new_rId: str | None) -> None:
+    """Update reference counts of tree of `element` for a change of one of its rIds."""
+    counts = _tree_counts(_rel_ref_counts, element)
+    if counts is None:
+        return
+    if old_rId is not None:
+        counts[old_rId] -= 1
+    if new_rId is not None:
+        counts[new_rId] += 1
+
+
+def shape_name_counts(root: _Element) -> Counter[str]:
+    """Return count of shapes having each name in the XML tree of `root`.
+
+    A shape name is the `name` attribute of a `p:cNvPr` element. Like the counts of
+    `rel_ref_counts()`, the names are counted on the first call for a tree and, when `root` is a
+    |BaseOxmlElement|, kept current from then on as shapes are added, renamed or removed, so
+    finding whether a name is in use takes constant time.
+    """
+    if not isinstance(root, BaseOxmlElement):
+        return collections.Counter(_shape_names_xpath(root))
+    counts = _shape_name_counts.get(root)
+    if counts is None:
+        counts = _shape_name_counts[root] = collections.Counter(_shape_names_xpath(root))
+    return counts
+
+
+def _count_shape_names(element: _Element, sign: int) -> None:
+    """Add (or subtract, for `sign` -1) the shape names in `element` to the counts of its tree."""
+    counts = _tree_counts(_shape_name_counts, element)
+    if counts is None:
+        return
+    for name in _shape_names_xpath(element):
+        counts[name] += sign
+
+
+def _recount_shape_name(element: _Element, old_name: str | None, new_name: str | None) -> None:
+    """Update shape-name counts of tree of `element` for a change of its name."""
+    if element.tag != _cNvPr_tag:
+        return
+    counts = _tree_counts(_shape_name_counts, element)
+    if counts is None:
+        return
+    if old_name is not None:
+        counts[old_name] -= 1
+    if new_name is not None:
+        counts[new_name] += 1
+
+
+def _tree_counts(
+    registry: weakref.WeakKeyDictionary[BaseOxmlElement, Counter[str]], element: _Element
+) -> Counter[str] | None:
+    """Return the counts kept in `registry` for the tree `element` belongs to, if there are any."""
+    # -- the common case of no counts kept for any tree is kept as cheap as possible --
+    if not registry:
+        return None
+    root = element.getroottree().getroot()
+    return registry.get(root) if isinstance(root, BaseOxmlElement) else None
+
+
 def serialize_for_reading(element: ElementBase):
     """
     Serialize *element* to human-readable XML suitable for tests. No XML
@@ -153,7 +365,14 @@ class BaseAttribute:
         The property returns the interpreted value of this attribute on access and changes the
         attribute value to its ST_* counterpart on assignment.
         """
-        property_ = property(self._getter, self._setter, None)
+        setter = self._setter
+        if self._attr_name.startswith("r:"):
+            setter = self._rel_ref_setter(setter)
+        elif self._attr_name == "id":
+            setter = self._id_setter(setter)
+        elif self._attr_name == "name":
+            setter = self._name_setter(setter)
+        property_ = property(self._getter, setter, None)
         # assign unconditionally to overwrite element name definition
         setattr(self._element_cls, self._prop_name, property_)
 
@@ -168,6 +387,44 @@ class BaseAttribute:
         """Callable suitable for the "get" side of the attribute property descriptor."""
         raise NotImplementedError("must be implemented by each subclass")
 
+    @staticmethod
+    def _id_setter(
+        setter: Callable[[BaseOxmlElement, Any], None],
+    ) -> Callable[[BaseOxmlElement, Any], None]:
+        """Wrap `setter` of an `id` attribute to keep the maximum id of the tree current."""
+
+        def set_id_value(obj: BaseOxmlElement, value: Any) -> None:
+            setter(obj, value)
+            _note_ids(obj)
+
+        return set_id_value
+
+    @staticmethod
+    def _name_setter(
+        setter: Callable[[BaseOxmlElement, Any], None],
+    ) -> Callable[[BaseOxmlElement, Any], None]:
+        """Wrap `setter` of a `name` attribute to keep shape-name counts current."""
+
+        def set_name_value(obj: BaseOxmlElement, value: Any) -> None:
+            old_name = obj.get("name")
+            setter(obj, value)
+            _recount_shape_name(obj, old_name, obj.get("name"))
+
+        return set_name_value
+
+    def _rel_ref_setter(
+        self, setter: Callable[[BaseOxmlElement, Any], None]
+    ) -> Callable[[BaseOxmlElement, Any], None]:
+        """Wrap `setter` of a relationship-reference attribute to keep reference counts current."""
+        clark_name = self._clark_name
+
+        def set_rel_ref_value(obj: BaseOxmlElement, value: Any) -> None:
+            old_rId = obj.get(clark_name)
+            setter(obj, value)
+            _recount_rel_ref(obj, old_rId, obj.get(clark_name))
+
+        return set_rel_ref_value
+
     @property
     def _setter(self) -> Callable[[BaseOxmlElement, Any], None]:
         """Callable suitable for the "set" side of the attribute property descriptor."""
@@ -216,6 +473,7 @@ class OptionalAttribute(BaseAttribute):
         """Callable suitable for the "set" side of the attribute property descriptor."""
 
         def set_attr_value(obj: BaseOxmlElement, value: Any) -> None:
+            check_writable(obj)
             # -- when an XML attribute has a default value, setting it to that default removes the
             # -- attribute from the element (when it is present)
             if value == self._default:
@@ -268,6 +526,7 @@ class RequiredAttribute(BaseAttribute):
         """Callable suitable for the "set" side of the attribute property descriptor."""
 
         def set_attr_value(obj: BaseOxmlElement, value: Any) -> None:
+            check_writable(obj)
             str_value = self._simple_type.to_xml(value)
             obj.set(self._clark_name, str_value)
 
@@ -674,6 +933,27 @@ class BaseOxmlElement(etree.ElementBase, metaclass=MetaOxmlElement):
             id(self),
         )
 
+    def addnext(self, element: _Element) -> None:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """Override of `lxml` _Element.addnext() keeping relationship-reference counts current."""
+        self._move_rel_refs(element, super().addnext)
+
+    def addprevious(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, element: _Element
+    ) -> None:
+        """Override of `lxml` _Element.addprevious() keeping reference counts current."""
+        self._move_rel_refs(element, super().addprevious)
+
+    def append(self, element: _Element) -> None:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """Override of `lxml` _Element.append() keeping relationship-reference counts current."""
+        self._move_rel_refs(element, super().append)
+
+    def extend(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, elements: Iterable[_Element]
+    ) -> None:
+        """Override of `lxml` _Element.extend() keeping relationship-reference counts current."""
+        for element in list(elements):
+            self.append(element)
+
     def first_child_found_in(self, *tagnames: str) -> _Element | None:
         """First child with tag in `tagnames`, or None if not found."""
         for tagname in tagnames:
@@ -690,6 +970,52 @@ class BaseOxmlElement(etree.ElementBase, metaclass=MetaOxmlElement):
             self.append(elm)
         return elm
 
+    def insert(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, index: int, element: _Element
+    ) -> None:
+        """Override of `lxml` _Element.insert() keeping relationship-reference counts current."""
+        self._move_rel_refs(element, lambda e: super(BaseOxmlElement, self).insert(index, e))
+
+    def move_children_from(self, source: BaseOxmlElement, *tagnames: str) -> None:
+        """Move all children of `source` into this element, in order, leaving `source` empty.
+
+        The children are inserted before the first child of this element having a tag in
+        `tagnames`, or appended when there is none, as by `insert_element_before()`. The
+        reference counts, shape names and ids of the moved elements are accounted for in one pass
+        over `source` rather than one per child, which makes this the fast way to add many
+        elements, for example shapes parsed together inside a wrapper element.
+        """
+        check_writable(self)
+        check_writable(source)
+        for registry, xpath in (
+            (_rel_ref_counts, _descendant_rel_refs_xpath),
+            (_shape_name_counts, _descendant_shape_names_xpath),
+        ):
+            source_counts = _tree_counts(registry, source)
+            counts = _tree_counts(registry, self)
+            if source_counts is None and counts is None:
+                continue
+            for value in xpath(source):
+                if source_counts is not None:
+                    source_counts[value] -= 1
+                if counts is not None:
+                    counts[value] += 1
+        _note_ids(source, self)
+        _note_child_change(self)
+        _note_child_change(source)
+
+        successor = self.first_child_found_in(*tagnames)
+        idx = len(self) if successor is None else self.index(successor)
+        self[idx:idx] = list(source)
+
+    def remove(self, element: _Element) -> None:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """Override of `lxml` _Element.remove() keeping relationship-reference counts current."""
+        check_writable(self)
+        _count_rel_refs(element, -1)
+        _count_shape_names(element, -1)
+        super().remove(element)
+        _note_child_change(self)
+
     def remove_all(self, *tagnames: str) -> None:
         """Remove child elements with tagname (e.g. "a:p") in `tagnames`."""
         for tagname in tagnames:
@@ -712,6 +1038,28 @@ class BaseOxmlElement(etree.ElementBase, metaclass=MetaOxmlElement):
         """
         return super().xpath(xpath_str, namespaces=_nsmap)
 
+    def _move_rel_refs(self, element: _Element, add: Callable[[_Element], None]) -> None:
+        """Add `element` to this tree using `add`, moving its reference counts along with it.
+
+        An element added when it is already in a tree is moved rather than copied by `lxml`. Its
+        shape names are moved the same way, and any ids in `element` are noted in the maximum id
+        kept for this tree, see `next_id()`. The change is counted for the parent `element` is
+        added to, and for the one it is moved out of, see `child_changes()`.
+        """
+        check_writable(self)
+        old_parent = element.getparent()
+        if old_parent is not None:
+            # -- moving `element` also changes the tree it is moved out of --
+            check_writable(element)
+            _count_rel_refs(element, -1)
+            _count_shape_names(element, -1)
+        add(element)
+        _count_rel_refs(element, 1)
+        _count_shape_names(element, 1)
+        _note_ids(element)
+        _note_child_change(old_parent)
+        _note_child_change(element.getparent())
+
     @property
     def _nsptag(self) -> str:
         return NamespacePrefixedTag.from_clark_name(self.tag)
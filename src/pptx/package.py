@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from typing import IO, Iterator
+import collections
+import os
+import threading
+from typing import IO, Iterator, NamedTuple
 
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
-from pptx.opc.package import OpcPackage
+from pptx.opc.package import OpcPackage, Part, XmlPart
 from pptx.opc.packuri import PackURI
 from pptx.parts.coreprops import CorePropertiesPart
 from pptx.parts.image import Image, ImagePart
@@ -51,25 +54,7 @@ class Package(OpcPackage):
         Partname uses the next available sequence number. *ext* is used as the extention on the
         returned partname.
         """
-
-        def first_available_image_idx():
-            image_idxs = sorted(
-                [
-                    part.partname.idx
-                    for part in self.iter_parts()
-                    if (
-                        part.partname.startswith("/ppt/media/image")
-                        and part.partname.idx is not None
-                    )
-                ]
-            )
-            for i, image_idx in enumerate(image_idxs):
-                idx = i + 1
-                if idx < image_idx:
-                    return idx
-            return len(image_idxs) + 1
-
-        idx = first_available_image_idx()
+        idx = self._partnames.first_available_idx("/ppt/media/image")
         return PackURI("/ppt/media/image%d.%s" % (idx, ext))
 
     def next_media_partname(self, ext):
@@ -79,22 +64,7 @@ class Package(OpcPackage):
         sequence numbers are reused. *ext* is used as the extension on the
         returned partname.
         """
-
-        def first_available_media_idx():
-            media_idxs = sorted(
-                [
-                    part.partname.idx
-                    for part in self.iter_parts()
-                    if part.partname.startswith("/ppt/media/media")
-                ]
-            )
-            for i, media_idx in enumerate(media_idxs):
-                idx = i + 1
-                if idx < media_idx:
-                    return idx
-            return len(media_idxs) + 1
-
-        idx = first_available_media_idx()
+        idx = self._partnames.first_available_idx("/ppt/media/media")
         return PackURI("/ppt/media/media%d.%s" % (idx, ext))
 
     @property
@@ -104,6 +74,16 @@ class Package(OpcPackage):
         """
         return self.main_document_part
 
+    def _drop_part(self, part: Part) -> None:
+        """Remove `part` from the part indexes, including the SHA1 indexes of image and media parts.
+
+        A part no longer related to should not be found by its SHA1 hash, since its partname may
+        be taken by a new part. Only the entry for `part` is removed, the indexes are not rebuilt.
+        """
+        super()._drop_part(part)
+        self._image_parts.remove(part)
+        self._media_parts.remove(part)
+
     @lazyproperty
     def _image_parts(self):
         """
@@ -123,25 +103,22 @@ class Package(OpcPackage):
 
 
 class _ImageParts(object):
-    """Provides access to the image parts in a package."""
+    """Provides access to the image parts in a package.
+
+    Image parts are indexed by the SHA1 hash of their image on first lookup, and the index is
+    kept current as image parts are added and dropped, so finding an existing image part is a
+    single lookup and the blob of each image part is hashed at most once.
+    """
 
     def __init__(self, package):
         super(_ImageParts, self).__init__()
         self._package = package
+        # -- built on first use, see `._parts_by_sha1` --
+        self._sha1_index: dict[str, dict[ImagePart, None]] | None = None
 
     def __iter__(self) -> Iterator[ImagePart]:
         """Generate a reference to each |ImagePart| object in the package."""
-        image_parts = []
-        for rel in self._package.iter_rels():
-            if rel.is_external:
-                continue
-            if rel.reltype != RT.IMAGE:
-                continue
-            image_part = rel.target_part
-            if image_part in image_parts:
-                continue
-            image_parts.append(image_part)
-            yield image_part
+        yield from self._package.iter_target_parts(RT.IMAGE)
 
     def get_or_add_image_part(self, image_file: str | IO[bytes]) -> ImagePart:
         """Return |ImagePart| object containing the image in `image_file`.
@@ -152,7 +129,24 @@ class _ImageParts(object):
         """
         image = Image.from_file(image_file)
         image_part = self._find_by_sha1(image.sha1)
-        return image_part if image_part else ImagePart.new(self._package, image)
+        if image_part is None:
+            image_part = ImagePart.new(self._package, image)
+            self._parts_by_sha1[image.sha1] = {image_part: None}
+        return image_part
+
+    def remove(self, part: Part) -> None:
+        """Remove `part` from the SHA1 index.
+
+        Called when `part` leaves the package. Another image part having the same image, if there
+        is one, is found for that image from then on. Any other part is ignored.
+        """
+        sha1_index = self._sha1_index
+        if sha1_index is None or not isinstance(part, ImagePart) or part.sha1 not in sha1_index:
+            return
+        image_parts = sha1_index[part.sha1]
+        image_parts.pop(part, None)
+        if not image_parts:
+            del sha1_index[part.sha1]
 
     def _find_by_sha1(self, sha1: str) -> ImagePart | None:
         """
@@ -160,42 +154,46 @@ class _ImageParts(object):
         no matching image part is found. The image part is identified by the
         SHA1 hash digest of the image binary it contains.
         """
-        for image_part in self:
-            # ---skip unknown/unsupported image types, like SVG---
-            if not hasattr(image_part, "sha1"):
-                continue
-            if image_part.sha1 == sha1:
-                return image_part
-        return None
+        image_parts = self._parts_by_sha1.get(sha1)
+        return next(iter(image_parts)) if image_parts else None
+
+    @property
+    def _parts_by_sha1(self) -> dict[str, dict[ImagePart, None]]:
+        """dict {sha1: {image_part: None}} of the image parts in the package.
+
+        Where more than one image part has the same image, each is indexed, the first being the
+        one found.
+        """
+        sha1_index = self._sha1_index
+        if sha1_index is None:
+            sha1_index = self._sha1_index = {}
+            for image_part in self:
+                # ---skip unknown/unsupported image types, like SVG---
+                if not hasattr(image_part, "sha1"):
+                    continue
+                sha1_index.setdefault(image_part.sha1, {})[image_part] = None
+        return sha1_index
 
 
 class _MediaParts(object):
     """Provides access to the media parts in a package.
 
     Supports iteration and :meth:`get()` using the media object SHA1 hash as
-    its key.
+    its key. Like image parts, media parts are indexed by that hash on first
+    lookup and the index kept current as media parts are added and dropped.
     """
 
     def __init__(self, package):
         super(_MediaParts, self).__init__()
         self._package = package
+        # -- built on first use, see `._parts_by_sha1` --
+        self._sha1_index = None
 
     def __iter__(self):
         """Generate a reference to each |MediaPart| object in the package."""
         # A media part can appear in more than one relationship (and commonly
-        # does in the case of video). Use media_parts to keep track of those
-        # that have been "yielded"; they can be skipped if they occur again.
-        media_parts = []
-        for rel in self._package.iter_rels():
-            if rel.is_external:
-                continue
-            if rel.reltype not in (RT.MEDIA, RT.VIDEO):
-                continue
-            media_part = rel.target_part
-            if media_part in media_parts:
-                continue
-            media_parts.append(media_part)
-            yield media_part
+        # does in the case of video), but is generated only once.
+        yield from self._package.iter_target_parts(RT.MEDIA, RT.VIDEO)
 
     def get_or_add_media_part(self, media):
         """Return a |MediaPart| object containing the media in *media*.
@@ -207,8 +205,23 @@ class _MediaParts(object):
         media_part = self._find_by_sha1(media.sha1)
         if media_part is None:
             media_part = MediaPart.new(self._package, media)
+            self._parts_by_sha1[media.sha1] = {media_part: None}
         return media_part
 
+    def remove(self, part):
+        """Remove `part` from the SHA1 index.
+
+        Called when `part` leaves the package. Another media part having the same media, if there
+        is one, is found for that media from then on. Any other part is ignored.
+        """
+        sha1_index = self._sha1_index
+        if sha1_index is None or not isinstance(part, MediaPart) or part.sha1 not in sha1_index:
+            return
+        media_parts = sha1_index[part.sha1]
+        media_parts.pop(part, None)
+        if not media_parts:
+            del sha1_index[part.sha1]
+
     def _find_by_sha1(self, sha1):
         """Return |MediaPart| object having *sha1* hash or None if not found.
 
@@ -216,7 +229,96 @@ class _MediaParts(object):
         part is identified by the SHA1 hash digest of its bytestream
         ("file").
         """
-        for media_part in self:
-            if media_part.sha1 == sha1:
-                return media_part
-        return None
+        media_parts = self._parts_by_sha1.get(sha1)
+        return next(iter(media_parts)) if media_parts else None
+
+    @property
+    def _parts_by_sha1(self):
+        """dict {sha1: {media_part: None}} of the media parts in the package.
+
+        Where more than one media part has the same media, each is indexed, the first being the
+        one found.
+        """
+        sha1_index = self._sha1_index
+        if sha1_index is None:
+            sha1_index = self._sha1_index = {}
+            for media_part in self:
+                sha1_index.setdefault(media_part.sha1, {})[media_part] = None
+        return sha1_index
+
+
+class PackageCache(object):
+    """Cache of packages loaded from template files, handing out an independent copy of each.
+
+    A template is loaded, and all its XML parsed, the first time it is opened. From then on each
+    :meth:`open` returns a clone of that package, copied in memory, until the template file
+    changes on disk. At most `maxsize` templates are kept, the least recently opened is discarded
+    to make room for another. A cache can be shared between threads.
+
+    When `share` is True, each clone shares the parsed XML of the cached template, part by part,
+    until that part is first accessed in the clone, see :meth:`OpcPackage.clone`. The masters,
+    layouts, theme and other parts a presentation never uses are then held in memory only once
+    however many presentations are made from the template.
+    """
+
+    def __init__(self, maxsize: int = 8, share: bool = False):
+        super(PackageCache, self).__init__()
+        self._maxsize = maxsize
+        self._share = share
+        self._entries: collections.OrderedDict[str, _CacheEntry] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        """Discard all cached templates."""
+        with self._lock:
+            self._entries.clear()
+
+    def open(self, path: str) -> Package:
+        """Return a new |Package| having the contents of the template file at `path`.
+
+        The template is only loaded from `path` when it is not cached or its file has been
+        modified since it was cached.
+        """
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.stamp == stamp:
+                self._entries.move_to_end(key)
+                package = entry.package
+            else:
+                package = None
+
+        if package is None:
+            # -- load outside the lock so other templates can be opened meanwhile --
+            package = self._load(key)
+            with self._lock:
+                self._entries[key] = _CacheEntry(stamp, package)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+
+        # -- a cached package never changes, so it is cloned outside the lock, concurrently --
+        return package.clone(self._share)
+
+    @staticmethod
+    def _load(path: str) -> Package:
+        """Return package loaded from `path` with the XML of each of its parts parsed.
+
+        The cached package itself is never handed out, only clones of it, so it never changes
+        once loaded and its XML is parsed only this once.
+        """
+        package = Package.open(path)
+        for part in package.iter_parts():
+            if isinstance(part, XmlPart):
+                part.parse()
+        return package
+
+
+class _CacheEntry(NamedTuple):
+    """A template package cached by |PackageCache| and the file stamp it was loaded with."""
+
+    stamp: tuple[int, int]
+    package: Package
@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
-from typing import IO, TYPE_CHECKING, Iterable
+from contextlib import suppress
+from typing import IO, TYPE_CHECKING, Iterable, Iterator, cast
 
+from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.package import XmlPart
 from pptx.opc.packuri import PackURI
+from pptx.oxml.xmlchemy import child_changes
 from pptx.parts.slide import NotesMasterPart, SlidePart
 from pptx.presentation import Presentation
 from pptx.util import lazyproperty
 
 if TYPE_CHECKING:
+    from pptx.opc.package import Part
+    from pptx.oxml.presentation import CT_SlideId, CT_SlideIdList
     from pptx.parts.coreprops import CorePropertiesPart
+    from pptx.parts.slide import SlideLayoutPart
     from pptx.slide import NotesMaster, Slide, SlideLayout, SlideMaster
 
 
@@ -46,10 +52,18 @@ class PresentationPart(XmlPart):
 
         Returns |None| if no slide with `slide_id` is related to this presentation.
         """
-        for sldId in self._element.sldIdLst:
-            if sldId.id == slide_id:
-                return self.related_part(sldId.rId).slide
-        return None
+        sldId = self._slide_index.sldId_for_id(slide_id)
+        if sldId is None:
+            return None
+        return self.related_part(sldId.rId).slide
+
+    def index_slide(self, sldId: CT_SlideId):
+        """Add the slide referenced by newly added `sldId` to the slide index.
+
+        Called after a `p:sldId` element is appended to `p:sldIdLst`, so the new slide is found
+        by id and part without the index being rebuilt.
+        """
+        self._slide_index.add(sldId)
 
     @lazyproperty
     def notes_master(self) -> NotesMaster:
@@ -83,6 +97,12 @@ class PresentationPart(XmlPart):
         """
         return Presentation(self._element, self)
 
+    def iter_save(
+        self, workers: int | None = None, compression: int | None = None
+    ) -> Iterator[bytes]:
+        """Generate the bytes of this presentation package, in chunks as it is serialized."""
+        return self.package.iter_save(workers, compression)
+
     def related_slide(self, rId: str) -> Slide:
         """Return |Slide| object for related |SlidePart| related by `rId`."""
         return self.related_part(rId).slide
@@ -103,20 +123,57 @@ class PresentationPart(XmlPart):
             slide_part = self.related_part(rId)
             slide_part.partname = PackURI("/ppt/slides/slide%d.xml" % (idx + 1))
 
-    def save(self, path_or_stream: str | IO[bytes]):
+    def save(
+        self,
+        path_or_stream: str | IO[bytes],
+        workers: int | None = None,
+        compression: int | None = None,
+        incremental: bool = False,
+    ):
         """Save this presentation package to `path_or_stream`.
 
         `path_or_stream` can be either a path to a filesystem location (a string) or a
-        file-like object.
+        file-like object. `workers` is the number of threads to compress package items on and
+        `compression` the optional deflate level for package items that are not already compressed.
+        `incremental` causes an existing package file to be updated in place.
+        """
+        self.package.save(path_or_stream, workers, compression, incremental)
+
+    def slide_parts_based_on(self, slide_layout_part: SlideLayoutPart) -> tuple[SlidePart, ...]:
+        """Slide parts of the slides inheriting from `slide_layout_part`, in slide order.
+
+        Found from the relationships to `slide_layout_part` rather than by resolving the layout
+        of each slide, so reporting on every layout takes time in proportion to the slide count.
+        A slide part no longer in the slide sequence is not included.
         """
-        self.package.save(path_or_stream)
+        slide_index = self._slide_index
+        positioned_slide_parts: list[tuple[int, SlidePart]] = []
+        for part in self.package.iter_source_parts(slide_layout_part, RT.SLIDE_LAYOUT):
+            # -- a slide master also relates to each of its layouts --
+            if part.content_type != CT.PML_SLIDE:
+                continue
+            sldId = slide_index.sldId_for_part(part)
+            if sldId is None:
+                continue
+            positioned_slide_parts.append((slide_index.position(sldId), cast(SlidePart, part)))
+        return tuple(slide_part for _, slide_part in sorted(positioned_slide_parts))
 
-    def slide_id(self, slide_part):
+    def slide_id(self, slide_part: SlidePart) -> int:
         """Return the slide-id associated with `slide_part`."""
-        for sldId in self._element.sldIdLst:
-            if self.related_part(sldId.rId) is slide_part:
-                return sldId.id
-        raise ValueError("matching slide_part not found")
+        sldId = self._slide_index.sldId_for_part(slide_part)
+        if sldId is None:
+            raise ValueError("matching slide_part not found")
+        return sldId.id
+
+    def slide_idx(self, slide_part: SlidePart) -> int:
+        """Return the zero-based position of `slide_part` in the slide sequence.
+
+        Raises |ValueError| when `slide_part` is not a slide of this presentation.
+        """
+        sldId = self._slide_index.sldId_for_part(slide_part)
+        if sldId is None:
+            raise ValueError("matching slide_part not found")
+        return self._slide_index.position(sldId)
 
     @property
     def _next_slide_partname(self):
@@ -124,3 +181,105 @@ class PresentationPart(XmlPart):
         sldIdLst = self._element.get_or_add_sldIdLst()
         partname_str = "/ppt/slides/slide%d.xml" % (len(sldIdLst) + 1)
         return PackURI(partname_str)
+
+    @lazyproperty
+    def _slide_index(self) -> _SlideIndex:
+        """|_SlideIndex| mapping slide-id and slide part to the `p:sldId` of each slide."""
+        return _SlideIndex(self)
+
+
+class _SlideIndex(object):
+    """Maps the slide-id and slide part of each slide to its `p:sldId` element and position.
+
+    The index is built from `p:sldIdLst` on first use, so each lookup is a dict access rather
+    than a scan of the slide list. An id or part entry is checked against the XML when it is
+    looked up, and the positions are kept only while `p:sldIdLst` has not changed since, see
+    `child_changes()`. The index is rebuilt when an entry is stale or a lookup misses, so slides
+    removed, reordered or added by editing `p:sldIdLst` are still located correctly.
+    """
+
+    def __init__(self, prs_part: PresentationPart):
+        super(_SlideIndex, self).__init__()
+        self._prs_part = prs_part
+        self._built = False
+        self._by_id: dict[int, CT_SlideId] = {}
+        self._by_part: dict[Part, CT_SlideId] = {}
+        self._positions: dict[CT_SlideId, int] = {}
+        # -- the `p:sldIdLst` the positions were taken from, and its change count then --
+        self._sldIdLst: CT_SlideIdList | None = None
+        self._changes = 0
+
+    def add(self, sldId: CT_SlideId):
+        """Index `sldId`, just appended to `p:sldIdLst`."""
+        if not self._built:
+            return
+        self._index(sldId)
+        # -- the positions stay current when appending `sldId` is the only change since --
+        sldIdLst = self._sldIdLst
+        if (
+            sldIdLst is not None
+            and sldId.getparent() is sldIdLst
+            and child_changes(sldIdLst) == self._changes + 1
+        ):
+            self._positions[sldId] = len(self._positions)
+            self._changes += 1
+
+    def position(self, sldId: CT_SlideId) -> int:
+        """Zero-based position of `sldId` in `p:sldIdLst`, which must contain it."""
+        if not self._positions_are_current():
+            self._build()
+        return self._positions[sldId]
+
+    def sldId_for_id(self, slide_id: int) -> CT_SlideId | None:
+        """`p:sldId` element having `slide_id`, or |None| if no slide has that id."""
+        sldId = self._by_id.get(slide_id)
+        if sldId is not None and self._is_current(sldId) and sldId.id == slide_id:
+            return sldId
+        self._build()
+        return self._by_id.get(slide_id)
+
+    def sldId_for_part(self, slide_part: Part) -> CT_SlideId | None:
+        """`p:sldId` element referencing `slide_part`, or |None| if it is not a slide here."""
+        sldId = self._by_part.get(slide_part)
+        if sldId is not None and self._is_current(sldId):
+            try:
+                if self._prs_part.related_part(sldId.rId) is slide_part:
+                    return sldId
+            except KeyError:
+                pass
+        self._build()
+        return self._by_part.get(slide_part)
+
+    def _build(self):
+        """Rebuild each map from the current `p:sldIdLst`."""
+        sldIdLst = self._prs_part._element.sldIdLst
+        self._by_id, self._by_part, self._positions = {}, {}, {}
+        self._sldIdLst = sldIdLst
+        self._changes = 0 if sldIdLst is None else child_changes(sldIdLst)
+        self._built = True
+        if sldIdLst is None:
+            return
+        for idx, sldId in enumerate(sldIdLst.sldId_lst):
+            self._index(sldId)
+            self._positions[sldId] = idx
+
+    def _index(self, sldId: CT_SlideId):
+        """Add `sldId` to the id and part maps, unless an earlier slide has its id or part."""
+        self._by_id.setdefault(sldId.id, sldId)
+        with suppress(KeyError):
+            self._by_part.setdefault(self._prs_part.related_part(sldId.rId), sldId)
+
+    def _positions_are_current(self) -> bool:
+        """True when `p:sldIdLst` is unchanged since the positions were taken, in constant time."""
+        sldIdLst = self._prs_part._element.sldIdLst
+        return (
+            self._built
+            and sldIdLst is not None
+            and sldIdLst is self._sldIdLst
+            and child_changes(sldIdLst) == self._changes
+        )
+
+    def _is_current(self, sldId: CT_SlideId) -> bool:
+        """True when `sldId` is still in the `p:sldIdLst` of the presentation."""
+        sldIdLst = self._prs_part._element.sldIdLst
+        return sldIdLst is not None and sldId.getparent() is sldIdLst
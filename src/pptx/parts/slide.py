@@ -230,6 +230,17 @@ class SlidePart(BaseSlidePart):
             notes_slide_part = self._add_notes_slide_part()
         return notes_slide_part.notes_slide
 
+    def release(self) -> None:
+        """Discard the parsed XML of this slide of a read-only presentation, to save memory.
+
+        The |Slide| object of this part holds that XML, so it is discarded too and a new one
+        created if the slide is accessed again.
+        """
+        super(SlidePart, self).release()
+        if self._parsed_element is None:
+            # -- `.slide` is a lazyproperty, cached in the instance dict under its own name --
+            self.__dict__.pop("slide", None)
+
     @lazyproperty
     def slide(self):
         """
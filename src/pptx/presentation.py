@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from typing import IO, TYPE_CHECKING, cast
+from typing import IO, TYPE_CHECKING, Iterator, cast
 
+from pptx.oxml.xmlchemy import OxmlElement
 from pptx.shared import PartElementProxy
 from pptx.slide import SlideMasters, Slides
 from pptx.util import lazyproperty
@@ -25,6 +26,22 @@ class Presentation(PartElementProxy):
     _element: CT_Presentation
     part: PresentationPart  # pyright: ignore[reportIncompatibleMethodOverride]
 
+    def __enter__(self) -> Presentation:
+        """Enable use as a context-manager, closing the package file on exit."""
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        """Close the package file this presentation was loaded from."""
+        self.close()
+
+    def close(self) -> None:
+        """Release the package file this presentation was loaded from.
+
+        Only has effect for a presentation opened with `lazy=True`, which holds its package file
+        open. Images and other binary parts not yet read can no longer be loaded afterward.
+        """
+        self.part.package.close()
+
     @property
     def core_properties(self):
         """|CoreProperties| instance for this presentation.
@@ -33,6 +50,19 @@ class Presentation(PartElementProxy):
         """
         return self.part.core_properties
 
+    def iter_save(
+        self, workers: int | None = None, compression: int | None = None
+    ) -> Iterator[bytes]:
+        """Generate the bytes of this presentation as a .pptx file, in chunks.
+
+        A chunk is generated as soon as each part of the presentation is serialized, so the file
+        can be sent on, for example as the body of an HTTP response, while the rest of it is still
+        being produced and without the whole file being held in memory. Joining the chunks gives
+        the same file :meth:`save` would write. `workers` and `compression` are as for
+        :meth:`save`. The presentation should not be changed until the generator is exhausted.
+        """
+        return self.part.iter_save(workers, compression)
+
     @property
     def notes_master(self) -> NotesMaster:
         """Instance of |NotesMaster| for this presentation.
@@ -42,12 +72,46 @@ class Presentation(PartElementProxy):
         """
         return self.part.notes_master
 
-    def save(self, file: str | IO[bytes]):
+    def save(
+        self,
+        file: str | IO[bytes],
+        workers: int | None = None,
+        compression: int | None = None,
+        incremental: bool = False,
+    ):
         """Writes this presentation to `file`.
 
-        `file` can be either a file-path or a file-like object open for writing bytes.
+        `file` can be either a file-path or a file-like object open for writing bytes. The
+        file-like object need not be seekable, so a socket or `sys.stdout.buffer` can be written to
+        directly. Use :meth:`iter_save` to get the file as a sequence of chunks instead.
+
+        When `file` is the path of an existing directory, the presentation is saved as an expanded
+        package, one uncompressed file per part, like an unzipped .pptx file. Such a directory can
+        be opened again with :func:`pptx.Presentation`. Saving over a directory already holding a
+        presentation rewrites only the files that changed and removes those no longer used.
+
+        When `workers` is greater than 1, the parts of the presentation are compressed on that many
+        threads while the rest are still being serialized, which can shorten the save of a large
+        presentation on a multi-core machine. The saved file has the same content either way.
+
+        `compression` is an optional deflate level from 0 (no compression) to 9 (smallest file).
+        When it is specified, parts already stored in a compressed format, like JPEG and PNG
+        images, video, and embedded Excel workbooks, are stored without compression rather than
+        deflated again for little or no reduction in size. The default compresses every part at the
+        default level. Parts copied unchanged from a presentation opened with `lazy=True` keep the
+        compression they were loaded with.
+
+        When `incremental` is True and `file` is the path of an existing .pptx file, that file is
+        updated in place rather than rewritten. Parts the file already holds unchanged are left
+        where they are, so saving a small change to a large presentation opened with `lazy=True`
+        writes little more than that change. The space taken by replaced parts is not reclaimed
+        until the presentation is next saved without `incremental`, which rewrites the whole file.
+        Should the update fail part way, the file is restored to what it was. `workers` cannot be
+        used with `incremental`, |ValueError| is raised when it is greater than 1.
+        A presentation opened with `lazy=True` and saved in full over its own file is rewritten by
+        way of a temporary file beside it, without first reading all its parts into memory.
         """
-        self.part.save(file)
+        self.part.save(file, workers, compression, incremental)
 
     @property
     def slide_height(self) -> Length | None:
@@ -108,6 +172,10 @@ class Presentation(PartElementProxy):
     @lazyproperty
     def slides(self):
         """|Slides| object containing the slides in this presentation."""
+        if self.part.package.read_only:
+            # -- a read-only presentation is never saved, so its slide parts are left as named --
+            sldIdLst = self._element.sldIdLst
+            return Slides(sldIdLst if sldIdLst is not None else OxmlElement("p:sldIdLst"), self)
         sldIdLst = self._element.get_or_add_sldIdLst()
         self.part.rename_slide_parts([cast("CT_SlideId", sldId).rId for sldId in sldIdLst])
         return Slides(sldIdLst, self)
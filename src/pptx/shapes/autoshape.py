@@ -176,6 +176,10 @@ class AutoShapeType:
        Rectangle` becomes `Rounded Rectangle 99` when the distinguishing
        integer is added to the shape name.
 
+    .. attribute:: display_basename
+
+       The same base shape name, not XML-escaped.
+
     .. attribute:: prst
 
        String identifier for this auto shape type used in the `a:prstGeom`
@@ -229,6 +233,14 @@ class AutoShapeType:
         """
         return saxutils.escape(self._basename, {'"': "&quot;"})
 
+    @property
+    def display_basename(self) -> str:
+        """Base of shape name for this auto shape type, as it appears in PowerPoint.
+
+        Unlike `.basename`, this value is not XML-escaped, so '"No" Symbol' is returned as is.
+        """
+        return self._basename
+
     @classmethod
     def default_adjustment_values(cls, prst: MSO_AUTO_SHAPE_TYPE) -> tuple[AdjustmentValue, ...]:
         """Sequence of (name, value) pair adjustment value defaults for `prst` autoshape-type."""
@@ -4,16 +4,26 @@ from __future__ import annotations
 
 import io
 import os
-from typing import IO, TYPE_CHECKING, Callable, Iterable, Iterator, cast
-
-from pptx.enum.shapes import PP_PLACEHOLDER, PROG_ID
+import re
+import warnings
+from typing import IO, TYPE_CHECKING, Any, Callable, Iterable, Iterator, NamedTuple, cast
+
+from pptx.enum.shapes import (
+    MSO_AUTO_SHAPE_TYPE,
+    MSO_CONNECTOR_TYPE,
+    MSO_SHAPE_TYPE,
+    PP_PLACEHOLDER,
+    PROG_ID,
+)
 from pptx.media import SPEAKER_IMAGE_BYTES, Video
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.oxml.ns import qn
 from pptx.oxml.shapes.autoshape import CT_Shape
+from pptx.oxml.shapes.connector import CT_Connector
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from pptx.oxml.shapes.picture import CT_Picture
 from pptx.oxml.simpletypes import ST_Direction
+from pptx.oxml.xmlchemy import shape_name_counts
 from pptx.shapes.autoshape import AutoShapeType, Shape
 from pptx.shapes.base import BaseShape
 from pptx.shapes.connector import Connector
@@ -38,10 +48,10 @@ from pptx.util import Emu, lazyproperty
 if TYPE_CHECKING:
     from pptx.chart.chart import Chart
     from pptx.chart.data import ChartData
+    from pptx.dml.color import RGBColor
     from pptx.enum.chart import XL_CHART_TYPE
-    from pptx.enum.shapes import MSO_CONNECTOR_TYPE, MSO_SHAPE
+    from pptx.enum.shapes import MSO_SHAPE
     from pptx.oxml.shapes import ShapeElement
-    from pptx.oxml.shapes.connector import CT_Connector
     from pptx.oxml.shapes.groupshape import CT_GroupShape
     from pptx.parts.image import ImagePart
     from pptx.parts.slide import SlidePart
@@ -83,7 +93,6 @@ class _BaseShapes(ParentedElementProxy):
     def __init__(self, spTree: CT_GroupShape, parent: ProvidesPart):
         super(_BaseShapes, self).__init__(spTree, parent)
         self._spTree = spTree
-        self._cached_max_shape_id = None
 
     def __getitem__(self, idx: int) -> BaseShape:
         """Return shape at `idx` in sequence, e.g. `shapes[2]`."""
@@ -112,7 +121,7 @@ class _BaseShapes(ParentedElementProxy):
         """Add a new placeholder shape based on `placeholder`."""
         sp = placeholder.element
         ph_type, orient, sz, idx = (sp.ph_type, sp.ph_orient, sp.ph_sz, sp.ph_idx)
-        id_ = self._next_shape_id
+        id_ = self._allocate_shape_id()
         name = self._next_ph_name(ph_type, id_, orient)
         self._spTree.add_placeholder(id_, name, ph_type, orient, sz, idx)
 
@@ -142,28 +151,28 @@ class _BaseShapes(ParentedElementProxy):
 
     @property
     def turbo_add_enabled(self) -> bool:
-        """True if "turbo-add" mode is enabled. Read/Write.
-
-        EXPERIMENTAL: This feature can radically improve performance when adding large numbers
-        (hundreds of shapes) to a slide. It works by caching the last shape ID used and
-        incrementing that value to assign the next shape id. This avoids repeatedly searching all
-        shape ids in the slide each time a new ID is required.
+        """Deprecated, always True; "turbo-add" mode no longer exists.
 
-        Performance is not noticeably improved for a slide with a relatively small number of
-        shapes, but because the search time rises with the square of the shape count, this option
-        can be useful for optimizing generation of a slide composed of many shapes.
-
-        Shape-id collisions can occur (causing a repair error on load) if more than one |Slide|
-        object is used to interact with the same slide in the presentation. Note that the |Slides|
-        collection creates a new |Slide| object each time a slide is accessed (e.g. `slide =
-        prs.slides[0]`, so you must be careful to limit use to a single |Slide| object.
+        Shape ids are now always allocated in constant time, from a maximum shape id kept once for
+        the slide and shared by every |Slide| object for it, so adding large numbers of shapes is
+        fast without risk of a shape-id collision. Assigning this property has no effect.
         """
-        return self._cached_max_shape_id is not None
+        warnings.warn(
+            "turbo_add_enabled is deprecated and has no effect; shape ids are always allocated"
+            " in constant time",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return True
 
     @turbo_add_enabled.setter
     def turbo_add_enabled(self, value: bool):
-        enable = bool(value)
-        self._cached_max_shape_id = self._spTree.max_shape_id if enable else None
+        warnings.warn(
+            "turbo_add_enabled is deprecated and has no effect; shape ids are always allocated"
+            " in constant time",
+            DeprecationWarning,
+            stacklevel=2,
+        )
 
     @staticmethod
     def _is_member_elm(shape_elm: ShapeElement) -> bool:
@@ -195,28 +204,23 @@ class _BaseShapes(ParentedElementProxy):
 
         # increment numpart as necessary to make name unique
         numpart = id - 1
-        names = self._spTree.xpath("//p:cNvPr/@name")
+        name_counts = shape_name_counts(self._spTree.getroottree().getroot())
         while True:
             name = "%s %d" % (basename, numpart)
-            if name not in names:
+            if not name_counts[name]:
                 break
             numpart += 1
 
         return name
 
-    @property
-    def _next_shape_id(self) -> int:
+    def _allocate_shape_id(self) -> int:
         """Return a unique shape id suitable for use with a new shape.
 
-        The returned id is 1 greater than the maximum shape id used so far. In practice, the
-        minimum id is 2 because the spTree element is always assigned id="1".
+        The returned id is 1 greater than the maximum shape id used so far, including ids
+        returned earlier but not yet assigned. In practice, the minimum id is 2 because the spTree
+        element is always assigned id="1".
         """
-        # ---presence of cached-max-shape-id indicates turbo mode is on---
-        if self._cached_max_shape_id is not None:
-            self._cached_max_shape_id += 1
-            return self._cached_max_shape_id
-
-        return self._spTree.max_shape_id + 1
+        return self._spTree.allocate_shape_id()
 
     def _shape_factory(self, shape_elm: ShapeElement) -> BaseShape:
         """Return an instance of the appropriate shape proxy class for `shape_elm`."""
@@ -335,7 +339,7 @@ class _BaseGroupShapes(_BaseShapes):
         """
         graphicFrame = _OleObjectElementCreator.graphicFrame(
             self,
-            self._next_shape_id,
+            self._allocate_shape_id(),
             object_file,
             prog_id,
             left,
@@ -386,6 +390,30 @@ class _BaseGroupShapes(_BaseShapes):
         self._recalculate_extents()
         return cast(Shape, self._shape_factory(sp))
 
+    def add_shapes(self, specs: Iterable[ShapeSpec | tuple[Any, ...]]) -> None:
+        """Add a shape to the end of this shape tree for each of `specs`, in order.
+
+        Each spec is a |ShapeSpec| or a tuple of its fields, `(shape_type, x, y, cx, cy, fill,
+        text)`, where `fill` and `text` can be omitted. `shape_type` is a member of
+        :ref:`MsoAutoShapeType` for an auto shape like that added by :meth:`add_shape`, a member
+        of :ref:`MsoConnectorType` for a connector like that added by :meth:`add_connector`, or
+        `MSO_SHAPE_TYPE.TEXT_BOX` for a text box like that added by :meth:`add_textbox`. Data held
+        in columns can be passed as `zip(shape_types, xs, ys, cxs, cys)`.
+
+        The shapes are added in a single pass and no shape object is created for them, which is
+        much faster than adding thousands of shapes one at a time. They appear at the end of this
+        collection in the order given. |ValueError| is raised, before any shape is added, when a
+        spec has an unsupported shape type, gives text for a connector, or has a fill that is not
+        an RGB color.
+        """
+        specs = [ShapeSpec(*spec) for spec in specs]
+        for spec in specs:
+            self._validate_shape_spec(spec)
+        shape_ids = self._grpSp.next_shape_ids(len(specs))
+        shape_xmls = [self._shape_xml(id_, spec) for id_, spec in zip(shape_ids, specs)]
+        self._grpSp.add_shapes(shape_xmls)
+        self._recalculate_extents()
+
     def add_textbox(self, left: Length, top: Length, width: Length, height: Length) -> Shape:
         """Return newly added text box shape appended to this shape tree.
 
@@ -434,7 +462,7 @@ class _BaseGroupShapes(_BaseShapes):
         The `p:graphicFrame` element has the specified position and size and refers to the chart
         part identified by `rId`.
         """
-        shape_id = self._next_shape_id
+        shape_id = self._allocate_shape_id()
         name = "Chart %d" % (shape_id - 1)
         graphicFrame = CT_GraphicalObjectFrame.new_chart_graphicFrame(
             shape_id, name, rId, x, y, cx, cy
@@ -455,7 +483,7 @@ class _BaseGroupShapes(_BaseShapes):
         The `p:cxnSp` element is for a connector of `connector_type` beginning at (`begin_x`,
         `begin_y`) and extending to (`end_x`, `end_y`).
         """
-        id_ = self._next_shape_id
+        id_ = self._allocate_shape_id()
         name = "Connector %d" % (id_ - 1)
 
         flipH, flipV = begin_x > end_x, begin_y > end_y
@@ -479,7 +507,7 @@ class _BaseGroupShapes(_BaseShapes):
         `x`, `y`, `cx`, and `cy`. The element is appended to the shape tree, causing it to be
         displayed first in z-order on the slide.
         """
-        id_ = self._next_shape_id
+        id_ = self._allocate_shape_id()
         scaled_cx, scaled_cy = image_part.scale(cx, cy)
         name = "Picture %d" % (id_ - 1)
         desc = image_part.desc
@@ -493,8 +521,8 @@ class _BaseGroupShapes(_BaseShapes):
 
         `p:sp` element is of `autoshape_type` at position (`x`, `y`) and of size (`cx`, `cy`).
         """
-        id_ = self._next_shape_id
-        name = "%s %d" % (autoshape_type.basename, id_ - 1)
+        id_ = self._allocate_shape_id()
+        name = "%s %d" % (autoshape_type.display_basename, id_ - 1)
         sp = self._grpSp.add_autoshape(id_, name, autoshape_type.prst, x, y, cx, cy)
         return sp
 
@@ -503,7 +531,7 @@ class _BaseGroupShapes(_BaseShapes):
 
         Element has position (`x`, `y`) and size (`cx`, `cy`).
         """
-        id_ = self._next_shape_id
+        id_ = self._allocate_shape_id()
         name = "TextBox %d" % (id_ - 1)
         sp = self._spTree.add_textbox(id_, name, x, y, cx, cy)
         return sp
@@ -518,6 +546,49 @@ class _BaseGroupShapes(_BaseShapes):
         #    produce the distinctive behavior of groups and subgroups.---
         pass
 
+    @staticmethod
+    def _shape_xml(id_: int, spec: ShapeSpec) -> str:
+        """Return XML of the shape element described by `spec`, having shape id `id_`.
+
+        `spec` must already have passed `._validate_shape_spec()`.
+        """
+        shape_type, x, y, cx, cy, fill, text = spec
+        rgb = None if fill is None else str(fill).upper()
+
+        if isinstance(shape_type, MSO_AUTO_SHAPE_TYPE):
+            autoshape_type = AutoShapeType(shape_type)
+            name = "%s %d" % (autoshape_type.basename, id_ - 1)
+            return CT_Shape.autoshape_sp_xml(
+                id_, name, autoshape_type.prst, x, y, cx, cy, rgb, text
+            )
+
+        if isinstance(shape_type, MSO_CONNECTOR_TYPE):
+            name = "Connector %d" % (id_ - 1)
+            prst = MSO_CONNECTOR_TYPE.to_xml(shape_type)
+            # ---a negative width or height runs the connector back from its begin point---
+            x, flipH = (x + cx, True) if cx < 0 else (x, False)
+            y, flipV = (y + cy, True) if cy < 0 else (y, False)
+            return CT_Connector.cxnSp_xml(
+                id_, name, prst, x, y, abs(cx), abs(cy), flipH, flipV, rgb
+            )
+
+        name = "TextBox %d" % (id_ - 1)
+        return CT_Shape.textbox_sp_xml(id_, name, x, y, cx, cy, rgb, text)
+
+    @staticmethod
+    def _validate_shape_spec(spec: ShapeSpec) -> None:
+        """Raise |ValueError| when `spec` describes a shape `add_shapes()` cannot add."""
+        shape_type, fill, text = spec.shape_type, spec.fill, spec.text
+
+        if not isinstance(shape_type, (MSO_AUTO_SHAPE_TYPE, MSO_CONNECTOR_TYPE)) and (
+            shape_type is not MSO_SHAPE_TYPE.TEXT_BOX
+        ):
+            raise ValueError("shape type %r cannot be added by add_shapes()" % (shape_type,))
+        if isinstance(shape_type, MSO_CONNECTOR_TYPE) and text is not None:
+            raise ValueError("a connector cannot have text")
+        if fill is not None and not re.fullmatch(r"[0-9A-Fa-f]{6}", str(fill)):
+            raise ValueError("fill must be an RGB color, got %r" % (fill,))
+
 
 class GroupShapes(_BaseGroupShapes):
     """The sequence of child shapes belonging to a group shape.
@@ -573,7 +644,7 @@ class SlideShapes(_BaseGroupShapes):
         """
         movie_pic = _MoviePicElementCreator.new_movie_pic(
             self,
-            self._next_shape_id,
+            self._allocate_shape_id(),
             movie_file,
             left,
             top,
@@ -628,7 +699,7 @@ class SlideShapes(_BaseGroupShapes):
         self, rows: int, cols: int, x: Length, y: Length, cx: Length, cy: Length
     ) -> CT_GraphicalObjectFrame:
         """Return a newly added `p:graphicFrame` element containing a table as specified."""
-        _id = self._next_shape_id
+        _id = self._allocate_shape_id()
         name = "Table %d" % (_id - 1)
         graphicFrame = self._spTree.add_table(_id, name, rows, cols, x, y, cx, cy)
         return graphicFrame
@@ -1188,3 +1259,37 @@ class _OleObjectElementCreator(object):
     def _slide_part(self) -> SlidePart:
         """SlidePart object for this slide."""
         return self._shapes.part
+
+
+class ShapeSpec(NamedTuple):
+    """A shape to be added by :meth:`SlideShapes.add_shapes`."""
+
+    shape_type: MSO_SHAPE | MSO_CONNECTOR_TYPE | MSO_SHAPE_TYPE
+    """Type of the shape, see :meth:`SlideShapes.add_shapes`."""
+
+    x: Length
+    """Distance of the left edge of the shape from the left edge of the slide."""
+
+    y: Length
+    """Distance of the top edge of the shape from the top edge of the slide."""
+
+    cx: Length
+    """Width of the shape.
+
+    For a connector, the end point is at (`x + cx`, `y + cy`), so either can be negative.
+    """
+
+    cy: Length
+    """Height of the shape."""
+
+    fill: RGBColor | None = None
+    """Color of a solid fill of the shape, or the line color of a connector.
+
+    The shape is styled as when added one at a time when |None|.
+    """
+
+    text: str | None = None
+    """Text of the shape, as assigned to the `.text` property of its text frame.
+
+    Must be |None| for a connector.
+    """
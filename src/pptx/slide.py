@@ -257,9 +257,17 @@ class Slides(ParentedElementProxy):
         return self.part.related_slide(sldId.rId)
 
     def __iter__(self) -> Iterator[Slide]:
-        """Support iteration, e.g. `for slide in slides:`."""
+        """Support iteration, e.g. `for slide in slides:`.
+
+        In a presentation opened read-only, the XML of each slide is released as iteration moves
+        on to the next slide, so only the slides still referenced are held in memory.
+        """
+        release = self.part.package.read_only
         for sldId in self._sldIdLst.sldId_lst:
-            yield self.part.related_slide(sldId.rId)
+            slide = self.part.related_slide(sldId.rId)
+            yield slide
+            if release:
+                slide.part.release()
 
     def __len__(self) -> int:
         """Support len() built-in function, e.g. `len(slides) == 4`."""
@@ -269,7 +277,7 @@ class Slides(ParentedElementProxy):
         """Return a newly added slide that inherits layout from `slide_layout`."""
         rId, slide = self.part.add_slide(slide_layout)
         slide.shapes.clone_layout_placeholders(slide_layout)
-        self._sldIdLst.add_sldId(rId)
+        self.part.index_slide(self._sldIdLst.add_sldId(rId))
         return slide
 
     def get(self, slide_id: int, default: Slide | None = None) -> Slide | None:
@@ -287,10 +295,10 @@ class Slides(ParentedElementProxy):
 
         Raises |ValueError| on *slide* not present.
         """
-        for idx, this_slide in enumerate(self):
-            if this_slide == slide:
-                return idx
-        raise ValueError("%s is not in slide collection" % slide)
+        try:
+            return self.part.slide_idx(slide.part)
+        except ValueError:
+            raise ValueError("%s is not in slide collection" % slide)
 
 
 class SlideLayout(_BaseSlide):
@@ -336,9 +344,8 @@ class SlideLayout(_BaseSlide):
     @property
     def used_by_slides(self):
         """Tuple of slide objects based on this slide layout."""
-        # ---getting Slides collection requires going around the horn a bit---
-        slides = self.part.package.presentation_part.presentation.slides
-        return tuple(s for s in slides if s.slide_layout == self)
+        prs_part = self.part.package.presentation_part
+        return tuple(slide_part.slide for slide_part in prs_part.slide_parts_based_on(self.part))
 
 
 class SlideLayouts(ParentedElementProxy):
@@ -7,10 +7,14 @@ from __future__ import annotations
 import collections
 import io
 import itertools
-from typing import Any
+import os
+import shutil
+import zipfile
+from typing import Any, cast
 
 import pytest
 
+from pptx.exc import ReadOnlyError
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
@@ -22,11 +26,14 @@ from pptx.opc.package import (
     XmlPart,
     _ContentTypeMap,
     _PackageLoader,
+    _PartnameIndex,
+    _PartReferences,
     _RelatableMixin,
     _Relationship,
     _Relationships,
 )
 from pptx.opc.packuri import PACKAGE_URI, PackURI
+from pptx.opc.serialized import MemberBlob, PackageReader
 from pptx.oxml import parse_xml
 from pptx.parts.presentation import PresentationPart
 
@@ -140,14 +147,101 @@ class DescribeOpcPackage:
 
         package = OpcPackage.open("package.pptx")
 
-        _init_.assert_called_once_with(ANY, "package.pptx")
-        _load_.assert_called_once_with(ANY)
+        _init_.assert_called_once_with(ANY, "package.pptx", False)
+        _load_.assert_called_once_with(ANY, False, None)
         assert package is package_
 
+    def and_it_loads_a_read_only_package_lazily(self, request):
+        _init_ = initializer_mock(request, OpcPackage)
+        _load_ = method_mock(request, OpcPackage, "_load")
+
+        OpcPackage.open("package.pptx", read_only=True)
+
+        _init_.assert_called_once_with(ANY, "package.pptx", True)
+        _load_.assert_called_once_with(ANY, True, None)
+
+    def it_can_parse_its_xml_parts_on_worker_threads_while_opening(self):
+        package = OpcPackage.open(absjoin(test_file_dir, "test.pptx"), workers=4)
+
+        xml_parts = [p for p in package.iter_parts() if isinstance(p, XmlPart)]
+        assert xml_parts
+        assert all(p._preparsed_element is not None for p in xml_parts)
+
+    def it_can_open_a_package_that_cannot_be_changed(self):
+        package = OpcPackage.open(absjoin(test_file_dir, "test.pptx"), read_only=True)
+        prs_part = cast(XmlPart, package.main_document_part)
+        rId = next(iter(prs_part.rels))
+
+        assert package.read_only is True
+        with pytest.raises(ReadOnlyError):
+            package.save(io.BytesIO())
+        with pytest.raises(ReadOnlyError):
+            prs_part.partname = PackURI("/ppt/foobar.xml")
+        with pytest.raises(ReadOnlyError):
+            prs_part.rels.pop(rId)
+        with pytest.raises(ReadOnlyError):
+            prs_part._element.remove(prs_part._element[0])
+        package.close()
+
+    def it_can_clone_itself(self):
+        package = OpcPackage.open(absjoin(test_file_dir, "test.pptx"))
+        prs_part = cast(XmlPart, package.main_document_part)
+        prs_part.parse()
+
+        clone = OpcPackage.clone(package)
+
+        parts = list(package.iter_parts())
+        clones = list(clone.iter_parts())
+        assert [p.partname for p in clones] == [p.partname for p in parts]
+        assert [type(p) for p in clones] == [type(p) for p in parts]
+        assert all(c is not p and c.package is clone for c, p in zip(clones, parts))
+        assert [p.blob for p in clones] == [p.blob for p in parts]
+        assert [(r.rId, r.reltype, r.target_ref) for r in clone.iter_rels()] == [
+            (r.rId, r.reltype, r.target_ref) for r in package.iter_rels()
+        ]
+        clone_prs_part = cast(XmlPart, clone.main_document_part)
+        assert clone_prs_part._preparsed_element is not None
+        assert clone_prs_part._preparsed_element is not prs_part._preparsed_element
+
+    def and_a_copy_of_a_read_only_package_is_read_only(self):
+        package = OpcPackage.open(absjoin(test_file_dir, "test.pptx"), read_only=True)
+        prs_part = cast(XmlPart, package.main_document_part)
+        prs_elm = prs_part._element
+
+        clone = OpcPackage.clone(package)
+        package.close()
+
+        clone_prs_part = cast(XmlPart, clone.main_document_part)
+        assert clone.read_only is True
+        assert clone_prs_part._element is prs_elm
+        assert [p.blob for p in clone.iter_parts()]
+        with pytest.raises(ReadOnlyError):
+            clone.save(io.BytesIO())
+        with pytest.raises(ReadOnlyError):
+            clone_prs_part.rels.pop(next(iter(clone_prs_part.rels)))
+        with pytest.raises(ReadOnlyError):
+            clone_prs_part._element.remove(clone_prs_part._element[0])
+
+    def it_can_close_its_package_file(self, request):
+        package_reader_ = instance_mock(request, PackageReader)
+        package = OpcPackage(None)
+        package._package_reader = package_reader_
+
+        package.close()
+
+        package_reader_.close.assert_called_once_with()
+        assert package._package_reader is None
+
+    def but_closing_does_nothing_when_it_holds_no_package_file(self):
+        package = OpcPackage(None)
+        package.close()
+        assert package._package_reader is None
+
     def it_can_drop_a_relationship(self, _rels_prop_, relationships_):
         _rels_prop_.return_value = relationships_
+        package = OpcPackage(None)
 
-        OpcPackage(None).drop_rel("rId42")
+        package.drop_rel("rId42")
 
         relationships_.pop.assert_called_once_with("rId42")
 
@@ -164,11 +258,85 @@ class DescribeOpcPackage:
                 (False, part_2_),
             )
         )
-        method_mock(request, OpcPackage, "iter_rels", return_value=rels_iter)
+        method_mock(request, OpcPackage, "_walk_rels", return_value=rels_iter)
         package = OpcPackage(None)
 
         assert list(package.iter_parts()) == [part_, part_2_]
 
+    def it_can_iterate_over_the_parts_targeted_by_relationships_of_a_reltype(self, request):
+        part_, part_2_, part_3_ = [
+            instance_mock(request, Part, name="part_%d" % i) for i in range(3)
+        ]
+        rels_iter = (
+            instance_mock(
+                request, _Relationship, reltype=reltype, is_external=is_external, target_part=target
+            )
+            for reltype, is_external, target in (
+                (RT.MEDIA, True, "http://some/url/"),
+                (RT.VIDEO, False, part_),
+                (RT.SLIDE, False, part_2_),
+                (RT.MEDIA, False, part_3_),
+                (RT.MEDIA, False, part_),
+            )
+        )
+        method_mock(request, OpcPackage, "_walk_rels", return_value=rels_iter)
+        package = OpcPackage(None)
+
+        assert list(package.iter_target_parts(RT.MEDIA, RT.VIDEO)) == [part_3_, part_]
+        assert list(package.iter_target_parts(RT.SLIDE)) == [part_2_]
+        assert list(package.iter_target_parts(RT.IMAGE)) == []
+
+    def it_can_iterate_over_the_parts_relating_to_a_part(self, request):
+        _walk_rels_ = method_mock(request, OpcPackage, "_walk_rels")
+        package = OpcPackage(None)
+        master, layout, slide, slide_2 = (
+            XmlPart(PackURI("/ppt/x%d.xml" % n), None, package, element("p:sld"))
+            for n in range(4)
+        )
+        package.relate_to(master, RT.SLIDE_MASTER)
+        master.relate_to(layout, RT.SLIDE_LAYOUT)
+        layout.relate_to(master, RT.SLIDE_MASTER)
+        slide.relate_to(layout, RT.SLIDE_LAYOUT)
+        slide_2.relate_to("http://url", RT.HYPERLINK, is_external=True)
+        slide_2.relate_to(layout, RT.SLIDE_LAYOUT)
+
+        assert list(package.iter_source_parts(layout, RT.SLIDE_LAYOUT)) == [
+            master,
+            slide,
+            slide_2,
+        ]
+        assert list(package.iter_source_parts(master, RT.SLIDE_MASTER)) == [layout]
+        assert list(package.iter_source_parts(master, RT.SLIDE_LAYOUT)) == []
+        assert list(package.iter_source_parts(slide, RT.SLIDE_LAYOUT)) == []
+
+        slide.drop_rel("rId1")
+
+        assert list(package.iter_source_parts(layout, RT.SLIDE_LAYOUT)) == [master, slide_2]
+        _walk_rels_.assert_not_called()
+
+    def it_walks_the_relationship_graph_again_only_after_one_of_its_relationships_changes(
+        self, request
+    ):
+        rel_ = instance_mock(request, _Relationship, is_external=True)
+        _walk_rels_ = method_mock(
+            request, OpcPackage, "_walk_rels", side_effect=lambda _: iter((rel_,))
+        )
+        package = OpcPackage(None)
+
+        assert list(package.iter_rels()) == [rel_]
+        assert list(package.iter_rels()) == [rel_]
+        assert list(package.iter_parts()) == []
+        assert _walk_rels_.call_count == 1
+
+        OpcPackage(None).relate_to("http://url", RT.HYPERLINK, is_external=True)
+        Part(PackURI("/ppt/slides/slide1.xml"), None, package).relate_to(
+            "http://url", RT.HYPERLINK, is_external=True
+        )
+
+        assert list(package.iter_rels()) == [rel_]
+        assert list(package.iter_rels()) == [rel_]
+        assert _walk_rels_.call_count == 2
+
     def it_can_iterate_over_its_relationships(self, request, _rels_prop_):
         """
         +----------+          +--------+
@@ -211,6 +379,20 @@ class DescribeOpcPackage:
         # -- sequence is not guaranteed, but count (len) and uniqueness are --
         assert rels == set(all_rels)
 
+    def and_it_does_not_recurse_to_walk_a_long_chain_of_parts(self, _rels_prop_):
+        parts = [
+            Part(PackURI("/ppt/slides/slide%d.xml" % n), CT.PML_SLIDE, None) for n in range(3000)
+        ]
+        pkg_rels = _rels_prop_.return_value = _Relationships("/")
+        pkg_rels.get_or_add(RT.SLIDE, parts[0])
+        for part, next_part in zip(parts, parts[1:]):
+            part.relate_to(next_part, RT.SLIDE)
+        package = OpcPackage(None)
+
+        rels = list(package._walk_rels())
+
+        assert rels == [pkg_rels["rId1"]] + [part.rels["rId1"] for part in parts[:-1]]
+
     def it_provides_access_to_the_main_document_part(self, request):
         presentation_part_ = instance_mock(request, PresentationPart)
         part_related_by_ = method_mock(
@@ -226,24 +408,65 @@ class DescribeOpcPackage:
     @pytest.mark.parametrize(
         "ns, expected_n", (((), 1), ((1,), 2), ((1, 2), 3), ((2, 4), 3), ((1, 4), 3))
     )
-    def it_can_find_the_next_available_partname(self, request, ns, expected_n):
+    def it_can_find_the_next_available_partname(self, ns, expected_n):
         tmpl = "/x%d.xml"
-        method_mock(
-            request,
-            OpcPackage,
-            "iter_parts",
-            return_value=(instance_mock(request, Part, partname=tmpl % n) for n in ns),
-        )
-        next_partname = tmpl % expected_n
-        PackURI_ = class_mock(
-            request, "pptx.opc.package.PackURI", return_value=PackURI(next_partname)
-        )
         package = OpcPackage(None)
+        for n in ns:
+            package.relate_to(Part(PackURI(tmpl % n), None, package), RT.SLIDE)
+
+        assert package.next_partname(tmpl) == tmpl % expected_n
+
+    def it_keeps_its_partname_index_current_as_parts_are_related_to_and_renamed(self):
+        package = OpcPackage(None)
+        package.relate_to(Part(PackURI("/x1.xml"), None, package), RT.SLIDE)
+        assert package.next_partname("/x%d.xml") == "/x2.xml"
+
+        part = Part(PackURI("/x2.xml"), None, package)
+        assert package.next_partname("/x%d.xml") == "/x2.xml"
+
+        package.relate_to(part, RT.SLIDE)
+        assert package.next_partname("/x%d.xml") == "/x3.xml"
 
-        partname = package.next_partname(tmpl)
+        part.partname = PackURI("/y1.xml")
+        assert package.next_partname("/x%d.xml") == "/x2.xml"
+        assert package.next_partname("/y%d.xml") == "/y2.xml"
 
-        PackURI_.assert_called_once_with(next_partname)
-        assert partname == next_partname
+    def and_it_frees_the_partname_of_a_part_when_its_last_relationship_is_dropped(self):
+        package = OpcPackage(None)
+        slide = Part(PackURI("/x1.xml"), None, package)
+        rId = package.relate_to(slide, RT.SLIDE)
+        slide_2 = XmlPart(PackURI("/x2.xml"), None, package, element("p:sld"))
+        rId_2 = package.relate_to(slide_2, RT.SLIDE)
+        slide_2.relate_to(slide, RT.SLIDE)
+        assert package.next_partname("/x%d.xml") == "/x3.xml"
+
+        package.drop_rel(rId)
+        assert package.next_partname("/x%d.xml") == "/x3.xml"
+
+        package.drop_rel(rId_2)
+        assert package.next_partname("/x%d.xml") == "/x2.xml"
+
+        slide_2.drop_rel("rId1")
+        assert package.next_partname("/x%d.xml") == "/x1.xml"
+
+    def and_it_frees_the_partnames_of_parts_related_to_only_from_outside_the_package(self):
+        package = OpcPackage(None)
+        package.relate_to(XmlPart(PackURI("/x1.xml"), None, package, element("p:sld")), RT.SLIDE)
+        slide = XmlPart(PackURI("/x2.xml"), None, package, element("p:sld"))
+        rId = package.relate_to(slide, RT.SLIDE)
+        notes_slide = XmlPart(PackURI("/y1.xml"), None, package, element("p:notes"))
+        slide.relate_to(notes_slide, RT.NOTES_SLIDE)
+        notes_slide.relate_to(slide, RT.SLIDE)
+        assert package.next_partname("/x%d.xml") == "/x3.xml"
+
+        # -- the slide and its notes slide still relate to each other once the slide is dropped --
+        package.drop_rel(rId)
+        assert package.next_partname("/x%d.xml") == "/x2.xml"
+        assert package.next_partname("/y%d.xml") == "/y1.xml"
+
+        package.relate_to(slide, RT.SLIDE)
+        assert package.next_partname("/x%d.xml") == "/x3.xml"
+        assert package.next_partname("/y%d.xml") == "/y2.xml"
 
     def it_can_save_to_a_pkg_file(self, request, _rels_prop_, relationships_):
         _rels_prop_.return_value = relationships_
@@ -252,22 +475,131 @@ class DescribeOpcPackage:
         PackageWriter_ = class_mock(request, "pptx.opc.package.PackageWriter")
         package = OpcPackage(None)
 
-        package.save("prs.pptx")
+        package.save("prs.pptx", 4, 6)
 
-        PackageWriter_.write.assert_called_once_with("prs.pptx", relationships_, parts_)
+        PackageWriter_.write.assert_called_once_with("prs.pptx", relationships_, parts_, 4, 6)
+        for part_ in parts_:
+            part_.load_blob.assert_not_called()
 
-    def it_loads_the_pkg_file_to_help(self, request, _rels_prop_, relationships_):
+    def but_it_reads_in_part_blobs_before_saving_over_its_own_pkg_file(
+        self, request, _rels_prop_, relationships_
+    ):
+        _rels_prop_.return_value = relationships_
+        parts_ = tuple(instance_mock(request, Part) for _ in range(2))
+        method_mock(request, OpcPackage, "iter_parts", return_value=iter(parts_))
+        PackageWriter_ = class_mock(request, "pptx.opc.package.PackageWriter")
+        pkg_file = io.BytesIO()
+        package = OpcPackage(pkg_file)
+
+        package.save(pkg_file)
+
+        for part_ in parts_:
+            part_.load_blob.assert_called_once_with()
+        PackageWriter_.write.assert_called_once_with(pkg_file, relationships_, parts_, None, None)
+
+    def it_can_generate_its_serialized_bytes_in_chunks(self, request, _rels_prop_, relationships_):
+        _rels_prop_.return_value = relationships_
+        parts_ = tuple(instance_mock(request, Part) for _ in range(2))
+        method_mock(request, OpcPackage, "iter_parts", return_value=iter(parts_))
+        PackageWriter_ = class_mock(request, "pptx.opc.package.PackageWriter")
+        PackageWriter_.iter_write.return_value = iter((b"foo", b"bar"))
+        package = OpcPackage(None)
+
+        chunks = package.iter_save(4, 6)
+
+        PackageWriter_.iter_write.assert_called_once_with(relationships_, parts_, 4, 6)
+        assert list(chunks) == [b"foo", b"bar"]
+
+    def it_can_save_in_place_incrementally(self, request, _rels_prop_, relationships_):
+        _rels_prop_.return_value = relationships_
+        parts_ = tuple(instance_mock(request, Part) for _ in range(2))
+        method_mock(request, OpcPackage, "iter_parts", return_value=iter(parts_))
+        PackageWriter_ = class_mock(request, "pptx.opc.package.PackageWriter")
+        pkg_path = absjoin(test_file_dir, "test.pptx")
+
+        OpcPackage(pkg_path).save(pkg_path, compression=6, incremental=True)
+
+        PackageWriter_.update.assert_called_once_with(pkg_path, relationships_, parts_, 6)
+        PackageWriter_.write.assert_not_called()
+
+    def but_it_raises_when_asked_for_workers_with_an_incremental_save(self, request):
+        PackageWriter_ = class_mock(request, "pptx.opc.package.PackageWriter")
+
+        with pytest.raises(ValueError, match="workers cannot be used with an incremental save"):
+            OpcPackage(None).save("prs.pptx", workers=4, incremental=True)
+
+        PackageWriter_.update.assert_not_called()
+        PackageWriter_.write.assert_not_called()
+
+    def but_it_saves_in_full_when_there_is_no_package_file_to_update(
+        self, request, _rels_prop_, relationships_
+    ):
+        _rels_prop_.return_value = relationships_
+        parts_ = tuple(instance_mock(request, Part) for _ in range(2))
+        method_mock(request, OpcPackage, "iter_parts", return_value=iter(parts_))
+        PackageWriter_ = class_mock(request, "pptx.opc.package.PackageWriter")
+
+        OpcPackage(None).save("no/such/prs.pptx", incremental=True)
+
+        PackageWriter_.update.assert_not_called()
+        PackageWriter_.write.assert_called_once_with(
+            "no/such/prs.pptx", relationships_, parts_, None, None
+        )
+
+    def it_replaces_its_own_pkg_file_when_lazily_loaded(self, request, _rels_prop_):
+        parts_ = tuple(instance_mock(request, Part) for _ in range(2))
+        method_mock(request, OpcPackage, "iter_parts", return_value=iter(parts_))
+        _replace_pkg_file_ = method_mock(request, OpcPackage, "_replace_pkg_file")
+        pkg_path = absjoin(test_file_dir, "test.pptx")
+        package = OpcPackage(pkg_path)
+        package._package_reader = instance_mock(request, PackageReader)
+
+        package.save(pkg_path, 4)
+
+        _replace_pkg_file_.assert_called_once_with(package, pkg_path, parts_, 4, None)
+        for part_ in parts_:
+            part_.load_blob.assert_not_called()
+
+    def it_can_replace_its_own_pkg_file_to_help(self, tmp_path):
+        pkg_path = str(tmp_path / "prs.pptx")
+        shutil.copy(absjoin(test_file_dir, "test.pptx"), pkg_path)
+        package = OpcPackage.open(pkg_path, lazy=True)
+        parts = tuple(package.iter_parts())
+        blobs = {part.partname: part.blob for part in parts}
+
+        package._replace_pkg_file(pkg_path, parts, None, None)
+
+        assert os.listdir(str(tmp_path)) == ["prs.pptx"]
+        assert zipfile.ZipFile(pkg_path).testzip() is None
+        assert package._package_reader is not None
+        for part in parts:
+            member_blob = part.member_blob
+            assert member_blob is not None
+            assert member_blob.load() == blobs[part.partname]
+        package.close()
+
+    @pytest.mark.parametrize(("lazy", "close_calls"), [(False, [call()]), (True, [])])
+    def it_loads_the_pkg_file_to_help(
+        self, request, _rels_prop_, relationships_, lazy, close_calls
+    ):
+        package_reader_ = instance_mock(request, PackageReader)
+        PackageReader_ = class_mock(
+            request, "pptx.opc.package.PackageReader", return_value=package_reader_
+        )
         _PackageLoader_ = class_mock(request, "pptx.opc.package._PackageLoader")
         _PackageLoader_.load.return_value = "pkg-rels-xml", {"partname": "part"}
         _rels_prop_.return_value = relationships_
         package = OpcPackage("prs.pptx")
 
-        return_value = package._load()
+        return_value = package._load(lazy)
 
-        _PackageLoader_.load.assert_called_once_with("prs.pptx", package)
+        PackageReader_.assert_called_once_with("prs.pptx")
+        _PackageLoader_.load.assert_called_once_with(package_reader_, package, lazy, None)
         relationships_.load_from_xml.assert_called_once_with(
             PACKAGE_URI, "pkg-rels-xml", {"partname": "part"}
         )
+        assert package_reader_.close.call_args_list == close_calls
+        assert package._package_reader is (package_reader_ if lazy else None)
         assert return_value is package
 
     def it_constructs_its_relationships_object_to_help(self, request, relationships_):
@@ -278,7 +610,7 @@ class DescribeOpcPackage:
 
         rels = package._rels
 
-        _Relationships_.assert_called_once_with(PACKAGE_URI.baseURI)
+        _Relationships_.assert_called_once_with(PACKAGE_URI.baseURI, package)
         assert rels is relationships_
 
     # fixture components -----------------------------------
@@ -292,6 +624,82 @@ class DescribeOpcPackage:
         return property_mock(request, OpcPackage, "_rels")
 
 
+class Describe_PartReferences:
+    """Unit-test suite for `pptx.opc.package._PartReferences` objects."""
+
+    def it_knows_when_a_relationship_is_the_first_or_last_to_its_part(self):
+        part, slide, slide_2 = (Part(PackURI("/x%d.xml" % n), None, None) for n in range(3))
+        rel, rel_2 = (
+            _Relationship("/", "rId1", RT.SLIDE_LAYOUT, RTM.INTERNAL, part) for _ in range(2)
+        )
+        part_references = _PartReferences()
+
+        assert part_references.add(rel, slide) is True
+        assert part_references.add(rel, slide) is False
+        assert part_references.add(rel_2, slide_2) is False
+        assert part in part_references
+        assert list(part_references.iter_parts()) == [part]
+
+        assert part_references.remove(rel) is False
+        assert part_references.remove(rel) is False
+        assert part_references.remove(rel_2) is True
+        assert part not in part_references
+        assert list(part_references.iter_parts()) == []
+
+
+class Describe_PartnameIndex:
+    """Unit-test suite for `pptx.opc.package._PartnameIndex` objects."""
+
+    @pytest.mark.parametrize(
+        ("partnames", "expected_value"),
+        [
+            ((), "/ppt/slides/slide1.xml"),
+            (("/ppt/slides/slide1.xml",), "/ppt/slides/slide2.xml"),
+            (("/ppt/slides/slide2.xml", "/ppt/slides/slide4.xml"), "/ppt/slides/slide3.xml"),
+            (("/ppt/slides/slide1.xml", "/ppt/slides/slide3.xml"), "/ppt/slides/slide2.xml"),
+            (("/ppt/slides/slide1.xml", "/ppt/slides/x/slide2.xml"), "/ppt/slides/slide2.xml"),
+            (("/ppt/slides/slide1.xml", "/ppt/slides/slide1.bin"), "/ppt/slides/slide3.xml"),
+        ],
+    )
+    def it_can_find_the_next_available_partname(self, partnames, expected_value):
+        partname_index = _PartnameIndex(partnames)
+        assert partname_index.next_partname("/ppt/slides/slide%d.xml") == expected_value
+
+    @pytest.mark.parametrize(
+        ("partnames", "expected_value"),
+        [
+            ((), 1),
+            (("/ppt/media/image1.png", "/ppt/media/image2.jpg"), 3),
+            (("/ppt/media/image1.png", "/ppt/media/image3.jpg"), 2),
+            (("/ppt/media/image2.png", "/ppt/media/media1.mp4"), 1),
+            (("/ppt/media/image1.png", "/ppt/media/image1.jpg", "/ppt/media/image.png"), 2),
+        ],
+    )
+    def it_can_find_the_first_available_idx_for_a_prefix(self, partnames, expected_value):
+        partname_index = _PartnameIndex(partnames)
+        assert partname_index.first_available_idx("/ppt/media/image") == expected_value
+
+    def it_keeps_track_of_partnames_as_they_are_added_and_removed(self):
+        partname_index = _PartnameIndex(("/ppt/media/image1.png", "/ppt/media/image2.png"))
+        assert partname_index.first_available_idx("/ppt/media/image") == 3
+
+        partname_index.add("/ppt/media/image3.png")
+        assert partname_index.first_available_idx("/ppt/media/image") == 4
+
+        partname_index.remove("/ppt/media/image2.png")
+        assert partname_index.first_available_idx("/ppt/media/image") == 2
+        assert partname_index.next_partname("/ppt/media/image%d.png") == "/ppt/media/image2.png"
+
+    def it_counts_a_partname_held_by_more_than_one_part(self):
+        partname_index = _PartnameIndex(("/ppt/slides/slide1.xml", "/ppt/slides/slide2.xml"))
+        # -- slide2 renamed to slide1 before slide1 is itself renamed --
+        partname_index.remove("/ppt/slides/slide2.xml")
+        partname_index.add("/ppt/slides/slide1.xml")
+        partname_index.remove("/ppt/slides/slide1.xml")
+
+        assert partname_index.next_partname("/ppt/slides/slide%d.xml") == "/ppt/slides/slide2.xml"
+
+
 class Describe_PackageLoader:
     """Unit-test suite for `pptx.opc.package._PackageLoader` objects."""
 
@@ -307,7 +715,7 @@ class Describe_PackageLoader:
 
         pkg_xml_rels, parts = _PackageLoader.load("prs.pptx", package_)
 
-        _init_.assert_called_once_with(ANY, "prs.pptx", package_)
+        _init_.assert_called_once_with(ANY, "prs.pptx", package_, False, None)
         _load_.assert_called_once_with(ANY)
         assert pkg_xml_rels is pkg_xml_rels_
         assert parts == {"partname": "part"}
@@ -334,6 +742,56 @@ class Describe_PackageLoader:
         assert pkg_xml_rels is rels_["/"]
         assert parts is parts_
 
+    @pytest.mark.parametrize(("workers", "parsed"), [(None, False), (1, False), (2, True)])
+    def it_parses_the_xml_parts_on_worker_threads_when_asked(
+        self, request, _xml_rels_prop_, workers, parsed
+    ):
+        xml_part = XmlPart(PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, None, blob=b"<foo/>")
+        part = Part(PackURI("/ppt/media/image1.png"), CT.PNG, None, b"blob")
+        parts = {xml_part.partname: xml_part, part.partname: part}
+        property_mock(request, _PackageLoader, "_parts", return_value=parts)
+        _xml_rels_prop_.return_value = {
+            "/": CT_Relationships.new(),
+            xml_part.partname: CT_Relationships.new(),
+            part.partname: CT_Relationships.new(),
+        }
+        package_loader = _PackageLoader(None, None, workers=workers)
+
+        package_loader._load()
+
+        assert (xml_part._preparsed_element is not None) is parsed
+        assert part.blob == b"blob"
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def it_loads_the_parts_of_the_package_to_help(self, request, lazy):
+        package_reader_ = instance_mock(request, PackageReader)
+        package_reader_.__contains__.return_value = True
+        package_reader_.__getitem__.return_value = b"blob"
+        package_reader_.member_blob.return_value = member_blob_ = instance_mock(request, MemberBlob)
+        property_mock(
+            request,
+            _PackageLoader,
+            "_content_types",
+            return_value={PackURI("/ppt/media/image1.png"): CT.PNG},
+        )
+        property_mock(
+            request,
+            _PackageLoader,
+            "_xml_rels",
+            return_value={PACKAGE_URI: None, PackURI("/ppt/media/image1.png"): None},
+        )
+        PartFactory_ = class_mock(request, "pptx.opc.package.PartFactory")
+        package_ = instance_mock(request, OpcPackage)
+        package_loader = _PackageLoader(package_reader_, package_, lazy)
+
+        parts = package_loader._parts
+
+        partname = PackURI("/ppt/media/image1.png")
+        PartFactory_.assert_called_once_with(
+            partname, CT.PNG, package_, blob=member_blob_ if lazy else b"blob"
+        )
+        assert parts == {partname: PartFactory_.return_value}
+
     def it_loads_the_xml_relationships_from_the_package_to_help(self, request):
         pkg_xml_rels = parse_xml(snippet_bytes("package-rels-xml"))
         prs_xml_rels = parse_xml(snippet_bytes("presentation-rels-xml"))
@@ -348,9 +806,9 @@ class Describe_PackageLoader:
                 (
                     pkg_xml_rels,
                     prs_xml_rels,
-                    slide_xml_rels,
-                    thumbnail_xml_rels,
                     core_xml_rels,
+                    thumbnail_xml_rels,
+                    slide_xml_rels,
                 )
             ),
         )
@@ -358,13 +816,13 @@ class Describe_PackageLoader:
 
         xml_rels = package_loader._xml_rels
 
-        # print(f"{_xml_rels_for_.call_args_list=}")
+        # -- relationships are discovered breadth-first --
         assert _xml_rels_for_.call_args_list == [
             call(package_loader, "/"),
             call(package_loader, "/ppt/presentation.xml"),
-            call(package_loader, "/ppt/slides/slide1.xml"),
-            call(package_loader, "/docProps/thumbnail.jpeg"),
             call(package_loader, "/docProps/core.xml"),
+            call(package_loader, "/docProps/thumbnail.jpeg"),
+            call(package_loader, "/ppt/slides/slide1.xml"),
         ]
         assert xml_rels == {
             "/": pkg_xml_rels,
@@ -400,6 +858,44 @@ class DescribePart:
     def it_uses_the_load_blob_as_its_blob(self):
         assert Part(None, None, None, b"blob").blob == b"blob"
 
+    def it_loads_a_deferred_blob_on_first_access(self, request):
+        member_blob_ = instance_mock(request, MemberBlob)
+        member_blob_.load.return_value = b"blob"
+        part = Part(None, None, None, member_blob_)
+
+        assert part.blob == b"blob"
+        assert part.blob == b"blob"
+        member_blob_.load.assert_called_once_with()
+
+    def it_keeps_its_member_blob_until_its_blob_is_changed(self, request):
+        member_blob_ = instance_mock(request, MemberBlob)
+        member_blob_.load.return_value = b"blob"
+        part = Part(None, None, None, member_blob_)
+
+        assert part.blob == b"blob"
+        assert part.member_blob is member_blob_
+        part.blob = b"new-blob"
+        assert part.member_blob is None
+
+    def it_can_read_in_its_blob_ahead_of_need(self, request):
+        member_blob_ = instance_mock(request, MemberBlob)
+        member_blob_.load.return_value = b"blob"
+        part = Part(None, None, None, member_blob_)
+
+        part.load_blob()
+
+        member_blob_.load.assert_called_once_with()
+        assert part.member_blob is None
+        assert part.blob == b"blob"
+
+    def it_can_relocate_its_blob(self, request):
+        member_blob_ = instance_mock(request, MemberBlob)
+        part = Part(None, None, None, b"blob")
+
+        part.relocate_blob(member_blob_)
+
+        assert part.member_blob is member_blob_
+
     def it_can_change_its_blob(self):
         part = Part(None, None, None, b"old-blob")
         part.blob = b"new-blob"
@@ -419,6 +915,13 @@ class DescribePart:
         part.partname = PackURI("/new/part/name")
         assert part.partname == PackURI("/new/part/name")
 
+    def it_tells_its_package_when_it_is_renamed(self, package_):
+        part = Part(PackURI("/old/part/name"), None, package_)
+
+        part.partname = PackURI("/new/part/name")
+
+        package_.rename_partname.assert_called_once_with(part, PackURI("/new/part/name"))
+
     def it_provides_access_to_its_relationships_for_traversal(self, request, relationships_):
         property_mock(request, Part, "_rels", return_value=relationships_)
         assert Part(None, None, None).rels is relationships_
@@ -435,15 +938,15 @@ class DescribePart:
         part = Part(None, None, None, None)
         assert part._blob_from_file(io.BytesIO(b"012345")) == b"012345"
 
-    def it_constructs_its_relationships_object_to_help(self, request, relationships_):
+    def it_constructs_its_relationships_object_to_help(self, request, relationships_, package_):
         _Relationships_ = class_mock(
             request, "pptx.opc.package._Relationships", return_value=relationships_
         )
-        part = Part(PackURI("/ppt/slides/slide1.xml"), None, None)
+        part = Part(PackURI("/ppt/slides/slide1.xml"), None, package_)
 
         rels = part._rels
 
-        _Relationships_.assert_called_once_with("/ppt/slides")
+        _Relationships_.assert_called_once_with("/ppt/slides", package_, part)
         assert rels is relationships_
 
     # fixture components ---------------------------------------------
@@ -462,17 +965,119 @@ class DescribeXmlPart:
 
     def it_can_be_constructed_by_PartFactory(self, request):
         partname = PackURI("/ppt/slides/slide1.xml")
-        element_ = element("p:sld")
         package_ = instance_mock(request, OpcPackage)
-        parse_xml_ = function_mock(request, "pptx.opc.package.parse_xml", return_value=element_)
+        parse_xml_ = function_mock(request, "pptx.opc.package.parse_xml")
         _init_ = initializer_mock(request, XmlPart)
 
         part = XmlPart.load(partname, CT.PML_SLIDE, package_, b"blob")
 
-        parse_xml_.assert_called_once_with(b"blob")
-        _init_.assert_called_once_with(part, partname, CT.PML_SLIDE, package_, element_)
+        parse_xml_.assert_not_called()
+        _init_.assert_called_once_with(part, partname, CT.PML_SLIDE, package_, blob=b"blob")
         assert isinstance(part, XmlPart)
 
+    def but_it_provides_its_original_XML_when_it_has_never_been_parsed(self, request):
+        serialize_part_xml_ = function_mock(request, "pptx.opc.package.serialize_part_xml")
+        xml_part = XmlPart(None, None, None, blob=b"<p:sld/>")
+
+        assert xml_part.blob == b"<p:sld/>"
+        serialize_part_xml_.assert_not_called()
+
+    def it_parses_its_blob_on_first_access_to_its_element(self, request):
+        element_ = element("p:sld")
+        parse_xml_ = function_mock(request, "pptx.opc.package.parse_xml", return_value=element_)
+        xml_part = XmlPart(None, None, None, blob=b"blob")
+
+        assert xml_part._element is element_
+        assert xml_part._element is element_
+        parse_xml_.assert_called_once_with(b"blob")
+        assert xml_part._blob is None
+        assert xml_part.member_blob is None
+
+    def it_can_parse_its_blob_ahead_of_first_access_and_keep_its_original_XML(self, request):
+        element_ = element("p:sld")
+        parse_xml_ = function_mock(request, "pptx.opc.package.parse_xml", return_value=element_)
+        member_blob_ = instance_mock(request, MemberBlob)
+        member_blob_.load.return_value = b"blob"
+        xml_part = XmlPart(None, None, None, blob=member_blob_)
+
+        xml_part.parse()
+        xml_part.parse()
+
+        parse_xml_.assert_called_once_with(b"blob")
+        assert xml_part.member_blob is member_blob_
+        assert xml_part.blob == b"blob"
+
+        assert xml_part._element is element_
+
+        parse_xml_.assert_called_once_with(b"blob")
+        assert xml_part.member_blob is None
+
+    def it_parses_a_part_of_a_read_only_package_under_a_lock_of_its_own(self):
+        package = OpcPackage.open(absjoin(test_file_dir, "test.pptx"), read_only=True)
+        prs_part = cast(XmlPart, package.main_document_part)
+        slide_part = cast(XmlPart, prs_part.related_part("rId2"))
+
+        with prs_part._parse_lock:
+            assert slide_part._element is not None
+            assert prs_part._parsed_element is None
+
+        assert prs_part._element is not None
+        package.close()
+
+    def it_can_release_its_xml_when_its_package_is_read_only(self):
+        package = OpcPackage.open(absjoin(test_file_dir, "test.pptx"), read_only=True)
+        prs_part = cast(XmlPart, package.main_document_part)
+        prs_elm = prs_part._element
+
+        prs_part.release()
+
+        assert prs_part._parsed_element is None
+        assert prs_part.blob == cast(MemberBlob, prs_part.member_blob).load()
+        assert prs_part._element is not prs_elm
+        assert prs_part._element.tag == prs_elm.tag
+        package.close()
+
+    def but_it_keeps_its_xml_when_its_package_can_change(self):
+        sld = element("p:sld")
+        xml_part = XmlPart(None, None, None, sld)
+
+        xml_part.release()
+
+        assert xml_part._element is sld
+
+    @pytest.mark.parametrize("share", [False, True])
+    def it_can_clone_itself(self, request, share):
+        package_ = instance_mock(request, OpcPackage)
+        sld = element("p:sld/p:cSld")
+        xml_part = XmlPart(PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, None, sld)
+
+        clone = xml_part.clone(package_, share)
+
+        assert type(clone) is XmlPart
+        assert clone.partname == xml_part.partname
+        assert clone.content_type == CT.PML_SLIDE
+        assert clone.package is package_
+        assert (clone._parsed_element is None) is share
+        assert clone.blob == xml_part.blob
+        assert (clone._parsed_element is None) is share
+        assert clone._element is not sld
+        assert clone._element.xml == sld.xml
+        assert clone._shared_element is None
+
+    @pytest.mark.parametrize("share", [False, True])
+    def and_a_copy_of_a_part_parsed_ahead_of_time_keeps_its_original_XML(self, request, share):
+        package_ = instance_mock(request, OpcPackage, read_only=False)
+        blob = b'<p:sld xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"/>'
+        xml_part = XmlPart(PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, None, blob=blob)
+        xml_part.parse()
+
+        clone = xml_part.clone(package_, share)
+
+        assert clone.blob == blob
+        assert clone._element is not xml_part._preparsed_element
+        assert clone._element.tag == xml_part._preparsed_element.tag
+        assert clone._blob is None
+
     def it_can_serialize_to_xml(self, request):
         element_ = element("p:sld")
         serialize_part_xml_ = function_mock(request, "pptx.opc.package.serialize_part_xml")
@@ -496,6 +1101,20 @@ class DescribeXmlPart:
         _rel_ref_count_.assert_called_once_with(part, "rId42")
         assert relationships_.pop.call_args_list == calls
 
+    def it_counts_the_references_to_a_relationship_to_help(self):
+        sld = element(
+            "p:sld/p:cSld/p:spTree/(p:sp/p:nvSpPr/p:cNvPr{id=2,name=b}/a:hlinkClick{r:id=rId2}"
+            ",p:pic/p:blipFill/a:blip{r:embed=rId2})"
+        )
+        part = XmlPart(None, None, None, sld)
+        assert part._rel_ref_count("rId2") == 2
+
+        sld.xpath(".//a:hlinkClick")[0].rId = "rId3"
+
+        assert part._rel_ref_count("rId2") == 1
+        assert part._rel_ref_count("rId3") == 1
+        assert part._rel_ref_count("rId4") == 0
+
     def it_knows_it_is_the_part_for_its_child_objects(self):
         xml_part = XmlPart(None, None, None, None)
         assert xml_part.part is xml_part
@@ -510,11 +1129,13 @@ class DescribeXmlPart:
 class DescribePartFactory:
     """Unit-test suite for `pptx.opc.package.PartFactory` objects."""
 
-    def it_constructs_custom_part_type_for_registered_content_types(self, request, package_, part_):
+    def it_constructs_custom_part_type_for_registered_content_types(
+        self, request, monkeypatch, package_, part_
+    ):
         SlidePart_ = class_mock(request, "pptx.opc.package.XmlPart")
         SlidePart_.load.return_value = part_
         partname = PackURI("/ppt/slides/slide7.xml")
-        PartFactory.part_type_for[CT.PML_SLIDE] = SlidePart_
+        monkeypatch.setitem(PartFactory.part_type_for, CT.PML_SLIDE, SlidePart_)
 
         part = PartFactory(partname, CT.PML_SLIDE, package_, b"blob")
 
@@ -714,14 +1335,14 @@ class Describe_Relationships:
     def it_can_find_a_part_with_reltype(self, _rels_by_reltype_prop_, relationship_, part_):
         relationship_.target_part = part_
         _rels_by_reltype_prop_.return_value = collections.defaultdict(
-            list, ((RT.SLIDE_LAYOUT, [relationship_]),)
+            dict, ((RT.SLIDE_LAYOUT, {"rId1": relationship_}),)
         )
         relationships = _Relationships(None)
 
         assert relationships.part_with_reltype(RT.SLIDE_LAYOUT) is part_
 
     def but_it_raises_KeyError_when_there_is_no_such_part(self, _rels_by_reltype_prop_):
-        _rels_by_reltype_prop_.return_value = collections.defaultdict(list)
+        _rels_by_reltype_prop_.return_value = collections.defaultdict(dict)
         relationships = _Relationships(None)
 
         with pytest.raises(KeyError) as e:
@@ -736,7 +1357,7 @@ class Describe_Relationships:
     ):
         relationship_.target_part = part_
         _rels_by_reltype_prop_.return_value = collections.defaultdict(
-            list, ((RT.SLIDE_LAYOUT, [relationship_, relationship_]),)
+            dict, ((RT.SLIDE_LAYOUT, {"rId1": relationship_, "rId2": relationship_}),)
         )
         relationships = _Relationships(None)
 
@@ -837,26 +1458,25 @@ class Describe_Relationships:
         ),
     )
     def it_can_get_a_matching_relationship_to_help(
-        self, request, _rels_by_reltype_prop_, target_ref, is_external, expected_value
+        self, request, _rels_prop_, target_ref, is_external, expected_value
     ):
         part_1, part_2 = (instance_mock(request, Part) for _ in range(2))
-        _rels_by_reltype_prop_.return_value = {
-            RT.SLIDE: [
-                instance_mock(
-                    request,
-                    _Relationship,
-                    rId=rId,
-                    target_part=target_part,
-                    target_ref=ref,
-                    is_external=external,
-                )
-                for rId, target_part, ref, external in (
-                    ("rId1", None, "http://url", True),
-                    ("rId2", part_1, "/ppt/foo.bar", False),
-                    ("rId3", None, "http://foo", True),
-                    ("rId4", part_2, "/ppt/bar.foo", False),
-                )
-            ]
+        _rels_prop_.return_value = {
+            rId: instance_mock(
+                request,
+                _Relationship,
+                rId=rId,
+                reltype=RT.SLIDE,
+                target_part=target_part,
+                target_ref=ref,
+                is_external=external,
+            )
+            for rId, target_part, ref, external in (
+                ("rId1", None, "http://url", True),
+                ("rId2", part_1, "/ppt/foo.bar", False),
+                ("rId3", None, "http://foo", True),
+                ("rId4", part_2, "/ppt/bar.foo", False),
+            )
         }
         target = target_ref if is_external else part_1 if target_ref == "part_1" else part_2
         relationships = _Relationships(None)
@@ -865,8 +1485,8 @@ class Describe_Relationships:
 
         assert matching == expected_value
 
-    def but_it_returns_None_when_there_is_no_matching_relationship(self, _rels_by_reltype_prop_):
-        _rels_by_reltype_prop_.return_value = collections.defaultdict(list)
+    def but_it_returns_None_when_there_is_no_matching_relationship(self, _rels_prop_):
+        _rels_prop_.return_value = {}
         relationships = _Relationships(None)
 
         assert relationships._get_matching(RT.HYPERLINK, "http://url", True) is None
@@ -877,9 +1497,10 @@ class Describe_Relationships:
             ((), "rId1"),
             (("rId1",), "rId2"),
             (("rId1", "rId2"), "rId3"),
-            (("rId1", "rId4"), "rId3"),
-            (("rId1", "rId4", "rId6"), "rId3"),
-            (("rId1", "rId2", "rId6"), "rId4"),
+            (("rId1", "rId4"), "rId2"),
+            (("rId1", "rId4", "rId6"), "rId2"),
+            (("rId1", "rId2", "rId6"), "rId3"),
+            (("rId1", "rId2", "foo7W"), "rId3"),
         ),
     )
     def it_finds_the_next_rId_to_help(self, _rels_prop_, rIds, expected_value):
@@ -888,21 +1509,62 @@ class Describe_Relationships:
 
         assert relationships._next_rId == expected_value
 
+    def it_keeps_its_indexes_current_as_relationships_are_added_and_removed(self, request):
+        part_1, part_2 = (instance_mock(request, Part) for _ in range(2))
+        relationships = _Relationships("/ppt/slides")
+        rIds = [
+            relationships.get_or_add(RT.IMAGE, part_1),
+            relationships.get_or_add(RT.IMAGE, part_2),
+            relationships.get_or_add_ext_rel(RT.HYPERLINK, "http://url"),
+            relationships.get_or_add(RT.IMAGE, part_1),
+        ]
+        assert rIds == ["rId1", "rId2", "rId3", "rId1"]
+        assert relationships._rels_by_reltype[RT.IMAGE] == {
+            "rId1": relationships["rId1"],
+            "rId2": relationships["rId2"],
+        }
+
+        relationships.pop("rId2")
+
+        assert relationships._rels_by_reltype[RT.IMAGE] == {"rId1": relationships["rId1"]}
+        assert relationships._get_matching(RT.IMAGE, part_2) is None
+        assert relationships.get_or_add(RT.IMAGE, part_2) == "rId2"
+        assert relationships.get_or_add_ext_rel(RT.HYPERLINK, "http://foo") == "rId4"
+
+    def and_it_matches_another_relationship_to_the_same_target_when_the_first_is_removed(
+        self, request, _rels_prop_
+    ):
+        part_ = instance_mock(request, Part)
+        _rels_prop_.return_value = {
+            rId: _Relationship("/ppt/slides", rId, RT.IMAGE, RTM.INTERNAL, part_)
+            for rId in ("rId1", "rId2")
+        }
+        relationships = _Relationships("/ppt/slides")
+        assert relationships._get_matching(RT.IMAGE, part_) == "rId1"
+
+        relationships.pop("rId1")
+
+        assert relationships._get_matching(RT.IMAGE, part_) == "rId2"
+
     def it_collects_relationships_by_reltype_to_help(self, request, _rels_prop_):
         rels = {
-            "rId%d" % (i + 1): instance_mock(request, _Relationship, reltype=reltype)
-            for i, reltype in enumerate((RT.SLIDE, RT.IMAGE, RT.SLIDE, RT.HYPERLINK))
+            rId: instance_mock(request, _Relationship, rId=rId, reltype=reltype)
+            for rId, reltype in (
+                ("rId1", RT.SLIDE),
+                ("rId2", RT.IMAGE),
+                ("rId3", RT.SLIDE),
+                ("rId4", RT.HYPERLINK),
+            )
         }
         _rels_prop_.return_value = rels
         relationships = _Relationships(None)
 
         rels_by_reltype = relationships._rels_by_reltype
 
-        assert rels["rId1"] in rels_by_reltype[RT.SLIDE]
-        assert rels["rId2"] in rels_by_reltype[RT.IMAGE]
-        assert rels["rId3"] in rels_by_reltype[RT.SLIDE]
-        assert rels["rId4"] in rels_by_reltype[RT.HYPERLINK]
-        assert rels_by_reltype[RT.CHART] == []
+        assert rels_by_reltype[RT.SLIDE] == {"rId1": rels["rId1"], "rId3": rels["rId3"]}
+        assert rels_by_reltype[RT.IMAGE] == {"rId2": rels["rId2"]}
+        assert rels_by_reltype[RT.HYPERLINK] == {"rId4": rels["rId4"]}
+        assert rels_by_reltype[RT.CHART] == {}
 
     # fixture components -----------------------------------
 
@@ -6,7 +6,9 @@ from __future__ import annotations
 
 import hashlib
 import io
+import os
 import zipfile
+import zlib
 
 import pytest
 
@@ -15,13 +17,19 @@ from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.opc.package import Part, _Relationships
 from pptx.opc.packuri import CONTENT_TYPES_URI, PackURI
 from pptx.opc.serialized import (
+    MemberBlob,
     PackageReader,
     PackageWriter,
+    _ChunkStream,
+    _CompressionPolicy,
     _ContentTypesItem,
     _DirPkgReader,
+    _DirPkgWriter,
+    _ParallelZipPkgWriter,
     _PhysPkgReader,
     _PhysPkgWriter,
     _ZipPkgReader,
+    _ZipPkgUpdater,
     _ZipPkgWriter,
 )
 
@@ -30,6 +38,7 @@ from ..unitutil.mock import (
     ANY,
     FixtureRequest,
     Mock,
+    PropertyMock,
     call,
     class_mock,
     function_mock,
@@ -72,6 +81,23 @@ class DescribePackageReader:
 
         assert package_reader.rels_xml_for(PackURI("/ppt/slides.slide1.xml")) is None
 
+    def it_can_close_the_physical_package(self, request: FixtureRequest):
+        phys_pkg_reader_ = instance_mock(request, _PhysPkgReader)
+        property_mock(request, PackageReader, "_blob_reader", return_value=phys_pkg_reader_)
+
+        PackageReader("prs.pptx").close()
+
+        phys_pkg_reader_.close.assert_called_once_with()
+
+    def it_can_defer_reading_a_member_blob(self, _blob_reader_prop_: Mock):
+        _blob_reader_prop_.return_value = {"/ppt/media/image1.png": b"blob"}
+        package_reader = PackageReader("")
+
+        member_blob = package_reader.member_blob(PackURI("/ppt/media/image1.png"))
+
+        assert isinstance(member_blob, MemberBlob)
+        assert member_blob.load() == b"blob"
+
     def it_constructs_its_blob_reader_to_help(self, request: FixtureRequest):
         phys_pkg_reader_ = instance_mock(request, _PhysPkgReader)
         _PhysPkgReader_ = class_mock(request, "pptx.opc.serialized._PhysPkgReader")
@@ -101,7 +127,7 @@ class DescribePackageWriter:
 
         PackageWriter.write("prs.pptx", relationships_, (part_, part_))
 
-        _init_.assert_called_once_with(ANY, "prs.pptx", relationships_, (part_, part_))
+        _init_.assert_called_once_with(ANY, "prs.pptx", relationships_, (part_, part_), None, None)
         _write_.assert_called_once_with(ANY)
 
     def it_can_write_a_package(
@@ -115,15 +141,97 @@ class DescribePackageWriter:
         )
         _write_pkg_rels_ = method_mock(request, PackageWriter, "_write_pkg_rels")
         _write_parts_ = method_mock(request, PackageWriter, "_write_parts")
-        package_writer = PackageWriter("prs.pptx", relationships_, [])
+        package_writer = PackageWriter("prs.pptx", relationships_, [], 4, 6)
 
         package_writer._write()
 
-        _PhysPkgWriter_.factory.assert_called_once_with("prs.pptx")
+        _PhysPkgWriter_.factory.assert_called_once_with("prs.pptx", 4, 6)
         _write_content_types_stream_.assert_called_once_with(package_writer, phys_writer_)
         _write_pkg_rels_.assert_called_once_with(package_writer, phys_writer_)
         _write_parts_.assert_called_once_with(package_writer, phys_writer_)
 
+    def it_provides_an_update_interface_classmethod(
+        self, request: FixtureRequest, relationships_: Mock, part_: Mock
+    ):
+        _init_ = initializer_mock(request, PackageWriter)
+        _update_ = method_mock(request, PackageWriter, "_update")
+
+        PackageWriter.update("prs.pptx", relationships_, (part_,), 6)
+
+        _init_.assert_called_once_with(ANY, "prs.pptx", relationships_, (part_,), compression=6)
+        _update_.assert_called_once_with(ANY)
+
+    def it_can_update_a_package_in_place(
+        self, request: FixtureRequest, phys_writer_: Mock, relationships_: Mock
+    ):
+        phys_writer_.__enter__.return_value = phys_writer_
+        _ZipPkgUpdater_ = class_mock(
+            request, "pptx.opc.serialized._ZipPkgUpdater", return_value=phys_writer_
+        )
+        _CompressionPolicy_ = class_mock(request, "pptx.opc.serialized._CompressionPolicy")
+        _write_content_types_stream_ = method_mock(
+            request, PackageWriter, "_write_content_types_stream"
+        )
+        _write_pkg_rels_ = method_mock(request, PackageWriter, "_write_pkg_rels")
+        _write_parts_ = method_mock(request, PackageWriter, "_write_parts")
+        package_writer = PackageWriter("prs.pptx", relationships_, [], compression=6)
+
+        package_writer._update()
+
+        _CompressionPolicy_.assert_called_once_with(6)
+        _ZipPkgUpdater_.assert_called_once_with("prs.pptx", _CompressionPolicy_.return_value)
+        _write_content_types_stream_.assert_called_once_with(package_writer, phys_writer_)
+        _write_pkg_rels_.assert_called_once_with(package_writer, phys_writer_)
+        _write_parts_.assert_called_once_with(package_writer, phys_writer_)
+
+    def it_provides_an_iter_write_interface_classmethod(
+        self, request: FixtureRequest, relationships_: Mock, part_: Mock
+    ):
+        _init_ = initializer_mock(request, PackageWriter)
+        method_mock(request, PackageWriter, "_iter_write", return_value=iter((b"foo", b"bar")))
+
+        chunks = PackageWriter.iter_write(relationships_, (part_,), 4, 6)
+
+        _init_.assert_called_once_with(ANY, ANY, relationships_, (part_,), 4, 6)
+        assert isinstance(_init_.call_args.args[1], _ChunkStream)
+        assert list(chunks) == [b"foo", b"bar"]
+
+    def it_generates_the_package_in_chunks_as_each_part_is_written(
+        self, request: FixtureRequest, relationships_: Mock
+    ):
+        relationships_.xml = b"pkg-rels-xml"
+        parts_ = [
+            instance_mock(
+                request,
+                Part,
+                partname=PackURI("/ppt/slides/slide%d.xml" % n),
+                content_type=CT.PML_SLIDE,
+                blob=b"blob_%d" % n,
+                member_blob=None,
+                _rels={},
+            )
+            for n in (1, 2)
+        ]
+        blob_2_prop_ = PropertyMock(return_value=b"blob_2")
+        type(parts_[1]).blob = blob_2_prop_
+        chunks = PackageWriter(_ChunkStream(), relationships_, parts_)._iter_write()
+
+        head = b""
+        while b"ppt/slides/slide1.xml" not in head:
+            head += next(chunks)
+        blob_2_prop_.assert_not_called()
+        tail = b"".join(chunks)
+
+        zipf = zipfile.ZipFile(io.BytesIO(head + tail))
+        assert zipf.testzip() is None
+        assert zipf.namelist() == [
+            "[Content_Types].xml",
+            "_rels/.rels",
+            "ppt/slides/slide1.xml",
+            "ppt/slides/slide2.xml",
+        ]
+        assert zipf.read("ppt/slides/slide2.xml") == b"blob_2"
+
     def it_can_write_a_content_types_stream(
         self, request: FixtureRequest, phys_writer_: Mock, relationships_: Mock, part_: Mock
     ):
@@ -148,7 +256,9 @@ class DescribePackageWriter:
                 request,
                 Part,
                 partname=PackURI("/ppt/%s.xml" % x),
+                content_type=CT.PML_SLIDE,
                 blob="blob_%s" % x,
+                member_blob=None,
                 rels=instance_mock(request, _Relationships, xml="rels_xml_%s" % x),
             )
             for x in ("a", "b", "c")
@@ -158,14 +268,32 @@ class DescribePackageWriter:
         package_writer._write_parts(phys_writer_)
 
         assert phys_writer_.write.call_args_list == [
-            call("/ppt/a.xml", "blob_a"),
+            call("/ppt/a.xml", "blob_a", CT.PML_SLIDE),
             call("/ppt/_rels/a.xml.rels", "rels_xml_a"),
-            call("/ppt/b.xml", "blob_b"),
+            call("/ppt/b.xml", "blob_b", CT.PML_SLIDE),
             call("/ppt/_rels/b.xml.rels", "rels_xml_b"),
-            call("/ppt/c.xml", "blob_c"),
+            call("/ppt/c.xml", "blob_c", CT.PML_SLIDE),
             call("/ppt/_rels/c.xml.rels", "rels_xml_c"),
         ]
 
+    def but_it_copies_the_package_member_of_an_unchanged_part(
+        self, request: FixtureRequest, relationships_: Mock, phys_writer_: Mock
+    ):
+        member_blob_ = instance_mock(request, MemberBlob)
+        part_ = instance_mock(
+            request,
+            Part,
+            partname=PackURI("/ppt/media/image1.png"),
+            member_blob=member_blob_,
+            _rels={},
+        )
+        package_writer = PackageWriter("", relationships_, [part_])
+
+        package_writer._write_parts(phys_writer_)
+
+        phys_writer_.write_member.assert_called_once_with("/ppt/media/image1.png", member_blob_)
+        phys_writer_.write.assert_not_called()
+
     def it_can_write_a_pkg_rels_item(self, phys_writer_: Mock, relationships_: Mock):
         relationships_.xml = b"pkg-rels-xml"
         package_writer = PackageWriter("", relationships_, [])
@@ -284,11 +412,50 @@ class Describe_ZipPkgReader:
             zip_pkg_reader[PackURI("/ppt/foobar.xml")]
         assert str(e.value) == "\"no member '/ppt/foobar.xml' in package\""
 
-    def it_loads_the_package_blobs_on_first_access_to_help(self, zip_pkg_reader: _ZipPkgReader):
-        blobs = zip_pkg_reader._blobs
-        assert len(blobs) == 38
-        assert "/ppt/presentation.xml" in blobs
-        assert "/ppt/_rels/presentation.xml.rels" in blobs
+    def it_indexes_the_archive_members_on_first_access_to_help(self, zip_pkg_reader: _ZipPkgReader):
+        members = zip_pkg_reader._members
+        assert len(members) == 38
+        assert members["/ppt/presentation.xml"].filename == "ppt/presentation.xml"
+        assert "/ppt/_rels/presentation.xml.rels" in members
+
+    def it_can_provide_a_member_still_compressed(self, zip_pkg_reader: _ZipPkgReader):
+        zip_info, data = zip_pkg_reader.zip_entry(PackURI("/ppt/presentation.xml"))
+
+        assert zip_info.filename == "ppt/presentation.xml"
+        assert len(data) == zip_info.compress_size
+        assert zlib.decompress(data, -15) == zip_pkg_reader[PackURI("/ppt/presentation.xml")]
+
+    def and_it_can_provide_a_member_of_a_stream_package_still_compressed(self):
+        with open(zip_pkg_path, "rb") as f:
+            zip_pkg_reader = _ZipPkgReader(io.BytesIO(f.read()))
+
+        zip_info, data = zip_pkg_reader.zip_entry(PackURI("/ppt/presentation.xml"))
+        blob = zip_pkg_reader[PackURI("/ppt/presentation.xml")]
+
+        assert len(data) == zip_info.compress_size
+        assert zlib.decompress(data, -15) == blob
+
+    def but_it_raises_when_a_member_has_no_local_header(self):
+        stream = io.BytesIO()
+        with zipfile.ZipFile(stream, "w") as zipf:
+            zipf.writestr("ppt/a.xml", b"blob")
+        zip_pkg_reader = _ZipPkgReader(stream)
+        zip_pkg_reader.zip_info(PackURI("/ppt/a.xml")).header_offset += 1
+
+        with pytest.raises(zipfile.BadZipFile):
+            zip_pkg_reader.zip_entry(PackURI("/ppt/a.xml"))
+
+    def it_can_describe_a_member_without_reading_it(self, zip_pkg_reader: _ZipPkgReader):
+        zip_info = zip_pkg_reader.zip_info(PackURI("/ppt/presentation.xml"))
+        assert zip_info is zip_pkg_reader._members[PackURI("/ppt/presentation.xml")]
+
+    def it_can_close_the_zip_archive(self):
+        zip_pkg_reader = _ZipPkgReader(zip_pkg_path)
+        assert PackURI("/ppt/presentation.xml") in zip_pkg_reader
+
+        zip_pkg_reader.close()
+
+        assert zip_pkg_reader._zipf.fp is None
 
     # --- fixture components -------------------------------
 
@@ -300,17 +467,167 @@ class Describe_ZipPkgReader:
 class Describe_PhysPkgWriter:
     """Unit-test suite for `pptx.opc.serialized._PhysPkgWriter` objects."""
 
-    def it_constructs_ZipPkgWriter_unconditionally(self, request: FixtureRequest):
+    @pytest.mark.parametrize("workers", [None, 1])
+    def it_constructs_ZipPkgWriter_by_default(
+        self, request: FixtureRequest, workers: int | None, _CompressionPolicy_: Mock
+    ):
         zip_pkg_writer_ = instance_mock(request, _ZipPkgWriter)
         _ZipPkgWriter_ = class_mock(
             request, "pptx.opc.serialized._ZipPkgWriter", return_value=zip_pkg_writer_
         )
 
-        phys_writer = _PhysPkgWriter.factory("prs.pptx")
+        phys_writer = _PhysPkgWriter.factory("prs.pptx", workers, 6)
 
-        _ZipPkgWriter_.assert_called_once_with("prs.pptx")
+        _CompressionPolicy_.assert_called_once_with(6)
+        _ZipPkgWriter_.assert_called_once_with("prs.pptx", _CompressionPolicy_.return_value)
         assert phys_writer is zip_pkg_writer_
 
+    def but_it_constructs_ParallelZipPkgWriter_when_there_are_workers(
+        self, request: FixtureRequest, _CompressionPolicy_: Mock
+    ):
+        parallel_zip_pkg_writer_ = instance_mock(request, _ParallelZipPkgWriter)
+        _ParallelZipPkgWriter_ = class_mock(
+            request,
+            "pptx.opc.serialized._ParallelZipPkgWriter",
+            return_value=parallel_zip_pkg_writer_,
+        )
+
+        phys_writer = _PhysPkgWriter.factory("prs.pptx", 4)
+
+        _CompressionPolicy_.assert_called_once_with(None)
+        _ParallelZipPkgWriter_.assert_called_once_with(
+            "prs.pptx", _CompressionPolicy_.return_value, 4
+        )
+        assert phys_writer is parallel_zip_pkg_writer_
+
+    def and_it_constructs_DirPkgWriter_when_pkg_file_is_a_dir(self, request: FixtureRequest):
+        dir_pkg_writer_ = instance_mock(request, _DirPkgWriter)
+        _DirPkgWriter_ = class_mock(
+            request, "pptx.opc.serialized._DirPkgWriter", return_value=dir_pkg_writer_
+        )
+
+        phys_writer = _PhysPkgWriter.factory(dir_pkg_path, 4, 6)
+
+        _DirPkgWriter_.assert_called_once_with(dir_pkg_path)
+        assert phys_writer is dir_pkg_writer_
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture
+    def _CompressionPolicy_(self, request: FixtureRequest):
+        return class_mock(request, "pptx.opc.serialized._CompressionPolicy")
+
+
+class Describe_DirPkgWriter:
+    """Unit-test suite for `pptx.opc.serialized._DirPkgWriter` objects."""
+
+    def it_writes_a_blob_to_a_file_in_the_package_dir(self, tmp_path):
+        with _DirPkgWriter(str(tmp_path)) as pkg_writer:
+            pkg_writer.write(PackURI("/ppt/media/image1.png"), b"blob", CT.PNG)
+
+        assert (tmp_path / "ppt" / "media" / "image1.png").read_bytes() == b"blob"
+
+    def but_it_leaves_a_file_already_holding_the_blob_untouched(self, tmp_path):
+        path = tmp_path / "ppt" / "presentation.xml"
+        path.parent.mkdir()
+        path.write_bytes(b"blob")
+        os.utime(path, (0, 0))
+
+        with _DirPkgWriter(str(tmp_path)) as pkg_writer:
+            pkg_writer.write(PackURI("/ppt/presentation.xml"), b"blob")
+
+        assert os.stat(path).st_mtime == 0
+
+    def it_removes_the_stale_files_of_a_package_it_replaces(self, tmp_path):
+        self._write_old_package(tmp_path)
+
+        with _DirPkgWriter(str(tmp_path)) as pkg_writer:
+            pkg_writer.write(CONTENT_TYPES_URI, b"new")
+            pkg_writer.write(PackURI("/ppt/presentation.xml"), b"new")
+            pkg_writer.write(PackURI("/ppt/slides/slide1.xml"), b"new")
+
+        assert sorted(
+            p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*") if p.is_file()
+        ) == ["[Content_Types].xml", "ppt/presentation.xml", "ppt/slides/slide1.xml"]
+        assert not (tmp_path / "ppt" / "media").exists()
+
+    def but_not_a_file_the_replaced_package_does_not_list(self, tmp_path):
+        self._write_old_package(tmp_path)
+        for membername in ("README.md", ".git/config", "ppt/notes.txt", "ppt/media/keep.txt"):
+            path = tmp_path.joinpath(*membername.split("/"))
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"mine")
+
+        with _DirPkgWriter(str(tmp_path)) as pkg_writer:
+            pkg_writer.write(CONTENT_TYPES_URI, b"new")
+
+        for membername in ("README.md", ".git/config", "ppt/notes.txt", "ppt/media/keep.txt"):
+            assert tmp_path.joinpath(*membername.split("/")).read_bytes() == b"mine"
+        assert not (tmp_path / "ppt" / "media" / "image1.png").exists()
+
+    def and_not_a_file_outside_the_folders_of_a_package(self, tmp_path):
+        self._write_old_package(tmp_path, image_ref="../../README.md")
+        (tmp_path / "README.md").write_bytes(b"mine")
+
+        with _DirPkgWriter(str(tmp_path)) as pkg_writer:
+            pkg_writer.write(CONTENT_TYPES_URI, b"new")
+
+        assert (tmp_path / "README.md").read_bytes() == b"mine"
+
+    def but_not_the_files_of_a_dir_that_held_no_package(self, tmp_path):
+        (tmp_path / "notes.txt").write_bytes(b"notes")
+
+        with _DirPkgWriter(str(tmp_path)) as pkg_writer:
+            pkg_writer.write(CONTENT_TYPES_URI, b"new")
+
+        assert (tmp_path / "notes.txt").read_bytes() == b"notes"
+
+    def and_not_when_the_package_was_not_written_completely(self, tmp_path):
+        (tmp_path / "[Content_Types].xml").write_bytes(b"old")
+        (tmp_path / "notes.txt").write_bytes(b"notes")
+
+        pkg_writer = _DirPkgWriter(str(tmp_path))
+        pkg_writer.write(CONTENT_TYPES_URI, b"new")
+
+        pkg_writer.__exit__(ZeroDivisionError, ZeroDivisionError(), None)
+
+        assert (tmp_path / "notes.txt").exists()
+
+    def it_writes_a_package_the_dir_reader_can_read(self, tmp_path):
+        with _DirPkgWriter(str(tmp_path)) as pkg_writer:
+            pkg_writer.write(PackURI("/ppt/slides/slide1.xml"), b"<p:sld/>")
+
+        assert _DirPkgReader(str(tmp_path))[PackURI("/ppt/slides/slide1.xml")] == b"<p:sld/>"
+
+    # fixtures ---------------------------------------------
+
+    @staticmethod
+    def _write_old_package(tmp_path, image_ref: str = "../media/image1.png") -> None:
+        """Expand a package having a slide with an image into the directory at `tmp_path`."""
+        rels_xml = (
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://foo/%s" Target="%s"/>'
+            "</Relationships>"
+        )
+        members = {
+            "[Content_Types].xml": (
+                '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                '<Override PartName="/ppt/presentation.xml" ContentType="application/xml"/>'
+                '<Override PartName="/ppt/slides/slide1.xml" ContentType="application/xml"/>'
+                "</Types>"
+            ),
+            "_rels/.rels": rels_xml % ("officeDocument", "ppt/presentation.xml"),
+            "ppt/presentation.xml": "old",
+            "ppt/_rels/presentation.xml.rels": rels_xml % ("slide", "slides/slide1.xml"),
+            "ppt/slides/slide1.xml": "old",
+            "ppt/slides/_rels/slide1.xml.rels": rels_xml % ("image", image_ref),
+            "ppt/media/image1.png": "old",
+        }
+        for membername, text in members.items():
+            path = tmp_path.joinpath(*membername.split("/"))
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text)
+
 
 class Describe_ZipPkgWriter:
     """Unit-test suite for `pptx.opc.serialized._ZipPkgWriter` objects."""
@@ -319,38 +636,294 @@ class Describe_ZipPkgWriter:
         pkg_writer = _ZipPkgWriter("")
         assert pkg_writer.__enter__() is pkg_writer
 
-    def and_it_closes_the_zip_archive_on_context__exit__(self, _zipf_prop_: Mock):
-        _ZipPkgWriter("").__exit__()
-        _zipf_prop_.return_value.close.assert_called_once_with()
+    def and_it_writes_the_central_directory_and_closes_the_file_on__exit__(self, tmp_path):
+        pkg_path = str(tmp_path / "prs.pptx")
+
+        with _ZipPkgWriter(pkg_path) as pkg_writer:
+            pkg_writer.write(PackURI("/part/name.xml"), b"blob")
+
+        assert pkg_writer._fp.closed
+        with zipfile.ZipFile(pkg_path) as zipf:
+            assert zipf.namelist() == ["part/name.xml"]
+
+    def but_it_leaves_a_stream_open_on__exit__(self):
+        stream = io.BytesIO()
 
-    def it_can_write_a_blob(self, _zipf_prop_: Mock):
-        """Integrates with zipfile.ZipFile."""
+        with _ZipPkgWriter(stream):
+            pass
+
+        assert not stream.closed
+        assert zipfile.ZipFile(stream).namelist() == []
+
+    def it_can_write_a_blob(self):
         pack_uri = PackURI("/part/name.xml")
-        _zipf_prop_.return_value = zipf = zipfile.ZipFile(io.BytesIO(), "w")
-        pkg_writer = _ZipPkgWriter("")
+        stream = io.BytesIO()
 
-        pkg_writer.write(pack_uri, b"blob")
+        with _ZipPkgWriter(stream) as pkg_writer:
+            pkg_writer.write(pack_uri, b"blob")
 
+        zipf = zipfile.ZipFile(stream)
         members = {PackURI("/%s" % name): zipf.read(name) for name in zipf.namelist()}
         assert len(members) == 1
         assert members[pack_uri] == b"blob"
 
-    def it_provides_access_to_the_open_zip_file_to_help(self, request: FixtureRequest):
-        ZipFile_ = class_mock(request, "pptx.opc.serialized.zipfile.ZipFile")
-        pkg_writer = _ZipPkgWriter("prs.pptx")
+    @pytest.mark.parametrize(
+        ("compression", "content_type", "expected_compress_type"),
+        [
+            (None, CT.MP4, zipfile.ZIP_DEFLATED),
+            (6, CT.MP4, zipfile.ZIP_STORED),
+            (6, CT.PML_SLIDE, zipfile.ZIP_DEFLATED),
+        ],
+    )
+    def it_compresses_a_blob_according_to_the_compression_policy(
+        self, compression: int | None, content_type: str, expected_compress_type: int
+    ):
+        stream = io.BytesIO()
+
+        with _ZipPkgWriter(stream, _CompressionPolicy(compression)) as pkg_writer:
+            pkg_writer.write(PackURI("/part/name"), b"blob" * 100, content_type)
+
+        zipf = zipfile.ZipFile(stream)
+        assert zipf.getinfo("part/name").compress_type == expected_compress_type
+        assert zipf.read("part/name") == b"blob" * 100
+
+    def it_can_copy_a_member_of_a_zip_package_without_recompressing_it(self):
+        member_blob = MemberBlob(_ZipPkgReader(zip_pkg_path), PackURI("/ppt/presentation.xml"))
+        stream = io.BytesIO()
+
+        with _ZipPkgWriter(stream) as pkg_writer:
+            pkg_writer.write_member(PackURI("/ppt/presentation.xml"), member_blob)
+            pkg_writer.write(PackURI("/part/name.xml"), b"blob")
+
+        src_info, data = member_blob.zip_entry()
+        zipf = zipfile.ZipFile(stream)
+        zip_info = zipf.getinfo("ppt/presentation.xml")
+        assert (zip_info.compress_type, zip_info.CRC) == (src_info.compress_type, src_info.CRC)
+        assert zip_info.compress_size == len(data)
+        assert zipf.read("ppt/presentation.xml") == member_blob.load()
+        assert zipf.read("part/name.xml") == b"blob"
+
+    def it_can_write_to_a_stream_that_cannot_seek(self):
+        member_blob = MemberBlob(_ZipPkgReader(zip_pkg_path), PackURI("/ppt/presentation.xml"))
+        chunk_stream = _ChunkStream()
+
+        with _ZipPkgWriter(chunk_stream) as pkg_writer:
+            pkg_writer.write(PackURI("/part/name.xml"), b"blob")
+            pkg_writer.write_member(PackURI("/ppt/presentation.xml"), member_blob)
+
+        zipf = zipfile.ZipFile(io.BytesIO(b"".join(chunk_stream.drain())))
+        assert zipf.testzip() is None
+        assert zipf.read("part/name.xml") == b"blob"
+        assert zipf.read("ppt/presentation.xml") == member_blob.load()
+
+    def and_it_can_write_after_what_a_stream_already_holds(self):
+        stream = io.BytesIO(b"prefix")
+        stream.seek(0, io.SEEK_END)
+
+        with _ZipPkgWriter(stream) as pkg_writer:
+            pkg_writer.write(PackURI("/part/name.xml"), b"blob")
+
+        zipf = zipfile.ZipFile(stream)
+        assert zipf.getinfo("part/name.xml").header_offset == 6
+        assert zipf.read("part/name.xml") == b"blob"
+
+    def it_names_a_non_ASCII_member_in_UTF_8(self):
+        stream = io.BytesIO()
+
+        with _ZipPkgWriter(stream) as pkg_writer:
+            pkg_writer.write(PackURI("/media/été.xml"), b"blob")
+
+        assert zipfile.ZipFile(stream).read("media/été.xml") == b"blob"
+
+    def but_it_writes_the_member_bytes_when_the_member_is_not_zipped(self, request: FixtureRequest):
+        member_blob_ = instance_mock(request, MemberBlob)
+        member_blob_.zip_entry.return_value = None
+        member_blob_.load.return_value = b"blob"
+        write_ = method_mock(request, _ZipPkgWriter, "write")
+        pkg_writer = _ZipPkgWriter("")
+
+        pkg_writer.write_member(PackURI("/part/name.xml"), member_blob_)
 
-        zipf = pkg_writer._zipf
+        write_.assert_called_once_with(pkg_writer, PackURI("/part/name.xml"), b"blob")
 
-        ZipFile_.assert_called_once_with(
-            "prs.pptx", "w", compression=zipfile.ZIP_DEFLATED, strict_timestamps=False
+    def it_deflates_a_blob_as_writestr_would_to_help(self):
+        zip_info, data = _ZipPkgWriter._compress(
+            "ppt/a.xml", b"blob" * 100, zipfile.ZIP_DEFLATED, None
         )
-        assert zipf is ZipFile_.return_value
+
+        assert zip_info.filename == "ppt/a.xml"
+        assert zip_info.compress_type == zipfile.ZIP_DEFLATED
+        assert zlib.crc32(b"blob" * 100) == zip_info.CRC
+        assert (zip_info.file_size, zip_info.compress_size) == (400, len(data))
+        assert zlib.decompress(data, -15) == b"blob" * 100
+
+    def and_it_stores_a_blob_without_compression_when_so_directed(self):
+        zip_info, data = _ZipPkgWriter._compress("ppt/a.jpg", b"blob", zipfile.ZIP_STORED, None)
+
+        assert zip_info.compress_type == zipfile.ZIP_STORED
+        assert data == b"blob"
+        assert (zip_info.file_size, zip_info.compress_size) == (4, 4)
+
+
+class Describe_ZipPkgUpdater:
+    """Unit-test suite for `pptx.opc.serialized._ZipPkgUpdater` objects."""
+
+    def it_keeps_members_in_place_and_appends_the_rest(self, pkg_path: str):
+        with zipfile.ZipFile(pkg_path) as zipf:
+            kept_offset = zipf.getinfo("ppt/a.xml").header_offset
+
+        with _ZipPkgUpdater(pkg_path, _CompressionPolicy(None)) as pkg_updater:
+            pkg_updater.write(PackURI("/ppt/a.xml"), b"a" * 100)
+            pkg_updater.write(PackURI("/ppt/b.xml"), b"changed")
+            pkg_updater.write(PackURI("/ppt/d.xml"), b"new")
+
+        with zipfile.ZipFile(pkg_path) as zipf:
+            assert zipf.testzip() is None
+            assert zipf.namelist() == ["ppt/a.xml", "ppt/b.xml", "ppt/d.xml"]
+            assert zipf.getinfo("ppt/a.xml").header_offset == kept_offset
+            assert zipf.read("ppt/b.xml") == b"changed"
+            assert zipf.read("ppt/d.xml") == b"new"
+
+    def and_it_keeps_an_unchanged_member_without_reading_it(
+        self, request: FixtureRequest, pkg_path: str
+    ):
+        with zipfile.ZipFile(pkg_path) as zipf:
+            zip_info = zipf.getinfo("ppt/c.xml")
+        member_blob_ = instance_mock(request, MemberBlob)
+        member_blob_.zip_info.return_value = zip_info
+
+        with _ZipPkgUpdater(pkg_path, _CompressionPolicy(None)) as pkg_updater:
+            pkg_updater.write_member(PackURI("/ppt/c.xml"), member_blob_)
+
+        member_blob_.load.assert_not_called()
+        member_blob_.zip_entry.assert_not_called()
+        with zipfile.ZipFile(pkg_path) as zipf:
+            assert zipf.namelist() == ["ppt/c.xml"]
+            assert zipf.read("ppt/c.xml") == b"c" * 100
+
+    def but_it_copies_a_member_the_archive_does_not_hold(self, pkg_path: str):
+        member_blob = MemberBlob(_ZipPkgReader(zip_pkg_path), PackURI("/ppt/presentation.xml"))
+
+        with _ZipPkgUpdater(pkg_path, _CompressionPolicy(None)) as pkg_updater:
+            pkg_updater.write_member(PackURI("/ppt/presentation.xml"), member_blob)
+
+        with zipfile.ZipFile(pkg_path) as zipf:
+            assert zipf.namelist() == ["ppt/presentation.xml"]
+            assert zipf.read("ppt/presentation.xml") == member_blob.load()
+
+    def and_it_leaves_the_package_as_it_was_when_the_update_fails(self, pkg_path: str):
+        with open(pkg_path, "rb") as f:
+            pkg_bytes = f.read()
+
+        with pytest.raises(RuntimeError), _ZipPkgUpdater(
+            pkg_path, _CompressionPolicy(None)
+        ) as pkg_updater:
+            pkg_updater.write(PackURI("/ppt/a.xml"), b"a" * 100)
+            pkg_updater.write(PackURI("/ppt/b.xml"), b"changed")
+            raise RuntimeError("part failed to serialize")
+
+        with open(pkg_path, "rb") as f:
+            assert f.read() == pkg_bytes
+
+    def and_also_when_writing_its_central_directory_fails(
+        self, request: FixtureRequest, pkg_path: str
+    ):
+        with open(pkg_path, "rb") as f:
+            pkg_bytes = f.read()
+        method_mock(
+            request, _ZipPkgUpdater, "_write_central_directory", side_effect=OSError("disk full")
+        )
+
+        with pytest.raises(OSError, match="disk full"), _ZipPkgUpdater(
+            pkg_path, _CompressionPolicy(None)
+        ) as pkg_updater:
+            pkg_updater.write(PackURI("/ppt/b.xml"), b"changed")
+
+        with open(pkg_path, "rb") as f:
+            assert f.read() == pkg_bytes
 
     # fixtures ---------------------------------------------
 
     @pytest.fixture
-    def _zipf_prop_(self, request: FixtureRequest):
-        return property_mock(request, _ZipPkgWriter, "_zipf")
+    def pkg_path(self, tmp_path) -> str:
+        pkg_path = str(tmp_path / "prs.pptx")
+        with zipfile.ZipFile(pkg_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            for name in ("a", "b", "c"):
+                zipf.writestr("ppt/%s.xml" % name, name.encode() * 100)
+        return pkg_path
+
+
+class Describe_ParallelZipPkgWriter:
+    """Unit-test suite for `pptx.opc.serialized._ParallelZipPkgWriter` objects."""
+
+    def it_writes_the_same_members_in_the_same_order_as_the_serial_writer(self):
+        blobs = [(PackURI("/ppt/slides/slide%d.xml" % n), b"<p:sld/>" * n * 100) for n in range(40)]
+        member_blob = MemberBlob(_ZipPkgReader(zip_pkg_path), PackURI("/ppt/presentation.xml"))
+        stream = io.BytesIO()
+
+        with _ParallelZipPkgWriter(stream, _CompressionPolicy(None), 3) as pkg_writer:
+            for pack_uri, blob in blobs[:20]:
+                pkg_writer.write(pack_uri, blob)
+            pkg_writer.write_member(PackURI("/ppt/presentation.xml"), member_blob)
+            for pack_uri, blob in blobs[20:]:
+                pkg_writer.write(pack_uri, blob)
+
+        zipf = zipfile.ZipFile(stream)
+        assert zipf.testzip() is None
+        assert zipf.namelist() == (
+            [pack_uri.membername for pack_uri, _ in blobs[:20]]
+            + ["ppt/presentation.xml"]
+            + [pack_uri.membername for pack_uri, _ in blobs[20:]]
+        )
+        for pack_uri, blob in blobs:
+            assert zipf.read(pack_uri.membername) == blob
+        assert zipf.read("ppt/presentation.xml") == member_blob.load()
+
+
+class Describe_ChunkStream:
+    """Unit-test suite for `pptx.opc.serialized._ChunkStream` objects."""
+
+    def it_accumulates_the_bytes_written_to_it_until_drained(self):
+        chunk_stream = _ChunkStream()
+
+        chunk_stream.write(b"foo")
+        chunk_stream.write(memoryview(b"bar"))
+
+        assert list(chunk_stream.drain()) == [b"foo", b"bar"]
+        assert list(chunk_stream.drain()) == []
+
+    def it_cannot_seek(self):
+        with pytest.raises(io.UnsupportedOperation):
+            _ChunkStream().tell()
+
+
+class Describe_CompressionPolicy:
+    """Unit-test suite for `pptx.opc.serialized._CompressionPolicy` objects."""
+
+    @pytest.mark.parametrize(
+        ("level", "content_type", "expected_value"),
+        [
+            (None, CT.PML_SLIDE, (zipfile.ZIP_DEFLATED, None)),
+            (None, CT.JPEG, (zipfile.ZIP_DEFLATED, None)),
+            (9, CT.PML_SLIDE, (zipfile.ZIP_DEFLATED, 9)),
+            (9, CT.X_EMF, (zipfile.ZIP_DEFLATED, 9)),
+            (9, CT.JPEG, (zipfile.ZIP_STORED, None)),
+            (9, CT.MP4, (zipfile.ZIP_STORED, None)),
+            (9, CT.SML_SHEET, (zipfile.ZIP_STORED, None)),
+            (9, "video/webm", (zipfile.ZIP_STORED, None)),
+            (9, "audio/mpeg", (zipfile.ZIP_STORED, None)),
+            (0, CT.PML_SLIDE, (zipfile.ZIP_STORED, None)),
+        ],
+    )
+    def it_chooses_how_to_compress_a_member_by_its_content_type(
+        self, level: int | None, content_type: str, expected_value: tuple[int, int | None]
+    ):
+        assert _CompressionPolicy(level)(content_type) == expected_value
+
+    @pytest.mark.parametrize("level", [-1, 10])
+    def but_it_raises_on_a_level_out_of_range(self, level: int):
+        with pytest.raises(ValueError, match="compression level must be between 0 and 9"):
+            _CompressionPolicy(level)
 
 
 class Describe_ContentTypesItem:
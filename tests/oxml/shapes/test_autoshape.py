@@ -104,6 +104,15 @@ class DescribeCT_Shape(object):
         # verify -----------------------
         assert sp.xml == xml
 
+    def and_it_sets_the_name_of_a_new_autoshape_sp_as_given(self):
+        sp = CT_Shape.new_autoshape_sp(2, '"No" Symbol 1', "noSmoking", 1, 2, 3, 4)
+        sp_2 = CT_Shape.new_autoshape_sp(3, "Oval 2", "ellipse", 5, 6, 7, 8)
+
+        assert sp.shape_name == '"No" Symbol 1'
+        assert (sp.prstGeom.get("prst"), sp.x, sp.cy) == ("noSmoking", 1, 4)
+        assert (sp_2.shape_name, sp_2.prstGeom.get("prst")) == ("Oval 2", "ellipse")
+        assert (sp_2.x, sp_2.cy) == (5, 8)
+
     def it_knows_how_to_create_a_new_placeholder_sp(self, new_ph_sp_fixture):
         id_, name, ph_type, orient, sz, idx, expected_xml = new_ph_sp_fixture
         sp = CT_Shape.new_placeholder_sp(id_, name, ph_type, orient, sz, idx)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import pytest
 
+from pptx.oxml.ns import qn
 from pptx.oxml.shapes.autoshape import CT_Shape
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from pptx.oxml.shapes.groupshape import CT_GroupShape
@@ -45,6 +46,23 @@ class DescribeCT_GroupShape(object):
         insert_element_before_.assert_called_once_with(spTree, pic_, "p:extLst")
         assert pic is pic_
 
+    def it_can_add_shape_elements_in_bulk(self):
+        spTree = element("p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1,name=t},p:extLst)")
+        first_id = spTree.next_shape_ids(2)[0]
+        shape_xmls = [
+            CT_Shape.autoshape_sp_xml(first_id, "Oval 1", "ellipse", 1, 2, 3, 4),
+            CT_Shape.textbox_sp_xml(first_id + 1, "TextBox 2", 5, 6, 7, 8),
+        ]
+
+        spTree.add_shapes(shape_xmls)
+
+        assert [sp.shape_id for sp in spTree.iter_shape_elms()] == [2, 3]
+        assert spTree[-1].tag == qn("p:extLst")
+        assert spTree[1].xml == CT_Shape.new_autoshape_sp(2, "Oval 1", "ellipse", 1, 2, 3, 4).xml
+        assert spTree.next_shape_id == 4
+        assert spTree.allocate_shape_id() == 4
+        assert spTree.next_shape_id == 5
+
     def it_can_add_an_sp_element_for_a_placeholder(self, add_placeholder_fixt):
         spTree, id_, name, ph_type, orient, sz, idx = add_placeholder_fixt[:7]
         CT_Shape_, insert_element_before_, sp_ = add_placeholder_fixt[7:]
@@ -18,6 +18,7 @@ class DescribeCT_Picture(object):
             ("bits&bobs.png", "bits&amp;bobs.png"),
             ("img&.png", "img&amp;.png"),
             ("im<ag>e.png", "im&lt;ag&gt;e.png"),
+            ('say "cheese".png', "say &quot;cheese&quot;.png"),
         ),
     )
     def it_can_create_a_new_pic_element(self, desc, xml_desc):
@@ -2,14 +2,39 @@
 
 from __future__ import annotations
 
+import threading
+
 import pytest
 from lxml import etree
 
-from pptx.oxml import oxml_parser, parse_xml, register_element_cls
+from pptx.oxml import (
+    _thread_parser,
+    clone_prototype,
+    oxml_parser,
+    parse_xml,
+    register_element_cls,
+)
 from pptx.oxml.ns import qn
 from pptx.oxml.xmlchemy import BaseOxmlElement
 
-from ..unitutil.mock import function_mock, loose_mock, var_mock
+from ..unitutil.mock import function_mock, loose_mock
+
+
+class DescribeCloneProtoype(object):
+    def it_parses_a_prototype_once_and_returns_a_copy_of_it(self, request):
+        parse_xml_ = function_mock(
+            request, "pptx.oxml.parse_xml", side_effect=lambda xml: etree.fromstring(xml)
+        )
+        xml = '<foo bar="0"><baz/></foo>'
+
+        foo = clone_prototype("test:foo", lambda: xml)
+        foo.set("bar", "42")
+        foo[0].text = "x"
+        foo_2 = clone_prototype("test:foo", lambda: xml)
+
+        parse_xml_.assert_called_once_with(xml)
+        assert etree.tostring(foo) == b'<foo bar="42"><baz>x</baz></foo>'
+        assert etree.tostring(foo_2) == xml.encode()
 
 
 class DescribeOxmlParser(object):
@@ -19,13 +44,31 @@ class DescribeOxmlParser(object):
 
 
 class DescribeParseXml(object):
-    def it_uses_oxml_configured_parser_to_parse_xml(
-        self, mock_xml_bytes, fromstring, mock_oxml_parser
-    ):
+    def it_uses_oxml_configured_parser_to_parse_xml(self, request, mock_xml_bytes, fromstring):
+        parser_ = loose_mock(request, "parser")
+        function_mock(request, "pptx.oxml._thread_parser", return_value=parser_)
+
         element = parse_xml(mock_xml_bytes)
-        fromstring.assert_called_once_with(mock_xml_bytes, mock_oxml_parser)
+
+        fromstring.assert_called_once_with(mock_xml_bytes, parser_)
         assert element is fromstring.return_value
 
+    def it_parses_with_a_parser_of_its_own_on_each_other_thread(self, xml_bytes):
+        register_element_cls("a:foo", CustElmCls)
+        results = {}
+
+        def parse():
+            results["parser"] = _thread_parser()
+            results["element"] = parse_xml(xml_bytes)
+
+        thread = threading.Thread(target=parse)
+        thread.start()
+        thread.join()
+
+        assert _thread_parser() is oxml_parser
+        assert results["parser"] is not oxml_parser
+        assert type(results["element"]) is CustElmCls
+
     def it_prefers_to_parse_bytes(self, xml_bytes):
         parse_xml(xml_bytes)
 
@@ -71,11 +114,6 @@ def fromstring(request):
     return function_mock(request, "pptx.oxml.etree.fromstring")
 
 
-@pytest.fixture
-def mock_oxml_parser(request):
-    return var_mock(request, "pptx.oxml.oxml_parser")
-
-
 @pytest.fixture
 def mock_xml_bytes(request):
     return loose_mock(request, "xml_bytes")
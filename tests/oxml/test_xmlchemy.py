@@ -8,8 +8,8 @@ from __future__ import annotations
 
 import pytest
 
-from pptx.exc import InvalidXmlError
-from pptx.oxml import register_element_cls
+from pptx.exc import InvalidXmlError, ReadOnlyError
+from pptx.oxml import parse_xml, register_element_cls
 from pptx.oxml.ns import qn
 from pptx.oxml.simpletypes import BaseIntType
 from pptx.oxml.xmlchemy import (
@@ -22,9 +22,15 @@ from pptx.oxml.xmlchemy import (
     ZeroOrMore,
     ZeroOrOne,
     ZeroOrOneChoice,
+    child_changes,
+    mark_read_only,
+    next_id,
+    rel_ref_counts,
+    shape_name_counts,
 )
 
 from ..unitdata import BaseBuilder
+from ..unitutil.cxml import element
 
 
 class DescribeCustomElementClass(object):
@@ -32,6 +38,217 @@ class DescribeCustomElementClass(object):
         assert type(CT_Parent).__name__ == "MetaOxmlElement"
 
 
+class DescribeRelRefCounts(object):
+    """Unit-test suite for `pptx.oxml.xmlchemy.rel_ref_counts()`."""
+
+    def it_counts_the_relationship_references_in_a_tree(self):
+        spTree = element(
+            "p:spTree/(p:pic/p:blipFill/a:blip{r:embed=rId1},p:sp/p:nvSpPr/p:cNvPr{id=2,name=b}"
+            "/(a:hlinkClick{r:id=rId2},a:hlinkHover{r:id=rId1}))"
+        )
+
+        counts = rel_ref_counts(spTree)
+
+        assert counts == {"rId1": 2, "rId2": 1}
+        assert rel_ref_counts(spTree) is counts
+
+    def it_keeps_the_counts_current_as_references_are_assigned(self):
+        spTree = element("p:spTree/p:sp/p:nvSpPr/p:cNvPr{id=2,name=b}/a:hlinkClick{r:id=rId2}")
+        counts = rel_ref_counts(spTree)
+        hlinkClick = spTree.xpath(".//a:hlinkClick")[0]
+
+        hlinkClick.rId = "rId3"
+        assert counts["rId2"] == 0
+        assert counts["rId3"] == 1
+
+        hlinkClick.rId = None
+        assert counts["rId3"] == 0
+
+    def and_as_elements_are_added_and_removed(self):
+        spTree = element("p:spTree/p:sp/p:nvSpPr/p:cNvPr{id=2,name=b}/a:hlinkClick{r:id=rId2}")
+        counts = rel_ref_counts(spTree)
+        pic = element("p:pic/p:blipFill/a:blip{r:embed=rId2}")
+        sp = spTree[0]
+
+        spTree.append(pic)
+        assert counts["rId2"] == 2
+
+        sp.addnext(sp.xpath("./p:nvSpPr")[0])
+        assert counts["rId2"] == 2
+
+        spTree.remove(pic)
+        assert counts["rId2"] == 1
+
+    def but_it_counts_the_references_afresh_for_a_plain_lxml_element(self):
+        root = parse_xml(
+            '<foo xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            '<bar r:id="rId1"/><baz r:link="rId1"/></foo>'
+        )
+        assert rel_ref_counts(root) == {"rId1": 2}
+
+
+class DescribeShapeNameCounts(object):
+    """Unit-test suite for `pptx.oxml.xmlchemy.shape_name_counts()`."""
+
+    def it_counts_the_shape_names_in_a_tree(self):
+        spTree = element(
+            "p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1,name=t},p:sp/p:nvSpPr/p:cNvPr{id=2,name=a}"
+            ",p:sp/p:nvSpPr/p:cNvPr{id=3,name=a})"
+        )
+
+        counts = shape_name_counts(spTree)
+
+        assert counts == {"t": 1, "a": 2}
+        assert shape_name_counts(spTree) is counts
+
+    def it_keeps_the_counts_current_as_shapes_are_renamed(self):
+        spTree = element("p:spTree/p:sp/p:nvSpPr/p:cNvPr{id=2,name=a}")
+        counts = shape_name_counts(spTree)
+
+        spTree.xpath(".//p:cNvPr")[0].name = "b"
+
+        assert counts["a"] == 0
+        assert counts["b"] == 1
+
+    def and_as_shapes_are_added_and_removed(self):
+        spTree = element("p:spTree/p:sp/p:nvSpPr/p:cNvPr{id=2,name=a}")
+        counts = shape_name_counts(spTree)
+        sp = element("p:sp/p:nvSpPr/p:cNvPr{id=3,name=a}")
+
+        spTree.append(sp)
+        assert counts["a"] == 2
+
+        spTree.remove(sp)
+        assert counts["a"] == 1
+
+
+class DescribeNextId(object):
+    """Unit-test suite for `pptx.oxml.xmlchemy.next_id()`."""
+
+    def it_allocates_ids_greater_than_any_in_the_tree(self):
+        spTree = element(
+            "p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1,name=t},p:sp/p:nvSpPr/p:cNvPr{id=7,name=a}"
+            ",p:sp/p:nvSpPr/p:cNvPr{id=foo,name=b})"
+        )
+        assert next_id(spTree) == 8
+        assert next_id(spTree) == 9
+
+    def and_it_keeps_clear_of_ids_added_to_the_tree(self):
+        spTree = element("p:spTree/p:nvGrpSpPr/p:cNvPr{id=1,name=t}")
+        assert next_id(spTree) == 2
+
+        spTree.append(element("p:sp/p:nvSpPr/p:cNvPr{id=5,name=a}"))
+        assert next_id(spTree) == 6
+
+        spTree.xpath(".//p:cNvPr")[0].id = 9
+        assert next_id(spTree) == 10
+
+    def and_it_can_allocate_a_block_of_ids(self):
+        spTree = element("p:spTree/p:nvGrpSpPr/p:cNvPr{id=1,name=t}")
+        assert next_id(spTree, 3) == 2
+        assert next_id(spTree) == 5
+
+    def but_it_searches_a_plain_lxml_element_afresh(self):
+        root = parse_xml('<foo id="1"><bar id="4"/></foo>')
+        assert next_id(root) == 5
+        assert next_id(root) == 5
+
+
+class DescribeChildChanges(object):
+    """Unit-test suite for `pptx.oxml.xmlchemy.child_changes()`."""
+
+    def it_counts_the_children_added_to_or_removed_from_an_element(self):
+        sldIdLst = element("p:sldIdLst/(p:sldId{id=256},p:sldId{id=257})")
+        assert child_changes(sldIdLst) == 0
+
+        sldIdLst.append(element("p:sldId{id=258}"))
+        assert child_changes(sldIdLst) == 1
+        sldIdLst.remove(sldIdLst[0])
+        assert child_changes(sldIdLst) == 2
+        sldIdLst[1].addprevious(sldIdLst[0])
+        assert child_changes(sldIdLst) == 4
+
+    def and_it_counts_the_children_moved_out_of_an_element(self):
+        sldIdLst = element("p:sldIdLst/(p:sldId{id=256},p:sldId{id=257})")
+        other = element("p:sldIdLst")
+        assert child_changes(sldIdLst) == 0
+
+        other.append(sldIdLst[0])
+        assert child_changes(sldIdLst) == 1
+
+    def but_not_changes_to_its_descendants(self):
+        sldIdLst = element("p:sldIdLst/p:sldId{id=256}")
+        assert child_changes(sldIdLst) == 0
+
+        sldIdLst[0].append(element("p:extLst"))
+        sldIdLst[0].id = 300
+        assert child_changes(sldIdLst) == 0
+
+
+class DescribeBaseOxmlElement(object):
+    """Unit-test suite for `pptx.oxml.xmlchemy.BaseOxmlElement` objects."""
+
+    def it_can_move_the_children_of_another_element_into_itself(self):
+        spTree = element("p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1,name=t},p:extLst)")
+        root = spTree.getroottree().getroot()
+        ref_counts, name_counts = rel_ref_counts(root), shape_name_counts(root)
+        next_id(root)
+        source = element(
+            "p:spTree/(p:sp/p:nvSpPr/p:cNvPr{id=7,name=a}/a:hlinkClick{r:id=rId1}"
+            ",p:sp/p:nvSpPr/p:cNvPr{id=3,name=b})"
+        )
+
+        spTree.move_children_from(source, "p:extLst")
+
+        assert [e.tag for e in spTree] == [
+            qn("p:nvGrpSpPr"),
+            qn("p:sp"),
+            qn("p:sp"),
+            qn("p:extLst"),
+        ]
+        assert len(source) == 0
+        assert ref_counts == {"rId1": 1}
+        assert name_counts == {"t": 1, "a": 1, "b": 1}
+        assert next_id(root) == 8
+
+
+class DescribeMarkReadOnly(object):
+    """Unit-test suite for `pptx.oxml.xmlchemy.mark_read_only()`."""
+
+    def it_causes_changes_to_the_tree_to_raise(self):
+        spTree = element("p:spTree/(p:sp/p:nvSpPr/p:cNvPr{id=2,name=b},p:pic)")
+        sp, pic = spTree[0], spTree[1]
+        cNvPr = sp.xpath(".//p:cNvPr")[0]
+        mark_read_only(spTree)
+
+        with pytest.raises(ReadOnlyError):
+            cNvPr.name = "foo"
+        with pytest.raises(ReadOnlyError):
+            cNvPr.id = 42
+        with pytest.raises(ReadOnlyError):
+            spTree.append(element("p:sp"))
+        with pytest.raises(ReadOnlyError):
+            sp.addnext(pic)
+        with pytest.raises(ReadOnlyError):
+            spTree.remove(pic)
+        with pytest.raises(ReadOnlyError):
+            element("p:spTree").append(pic)
+
+        assert cNvPr.name == "b"
+        assert [child.tag for child in spTree] == [qn("p:sp"), qn("p:pic")]
+
+    def but_other_trees_can_still_change(self):
+        mark_read_only(element("p:spTree"))
+        spTree = element("p:spTree/p:sp/p:nvSpPr/p:cNvPr{id=2,name=b}")
+        cNvPr = spTree.xpath(".//p:cNvPr")[0]
+
+        cNvPr.name = "foo"
+        spTree.append(element("p:pic"))
+
+        assert cNvPr.name == "foo"
+        assert len(spTree) == 2
+
+
 class DescribeChoice(object):
     def it_adds_a_getter_property_for_the_choice_element(self, getter_fixture):
         parent, expected_choice = getter_fixture
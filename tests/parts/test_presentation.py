@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import pytest
 
+from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.packuri import PackURI
 from pptx.package import Package
 from pptx.parts.coreprops import CorePropertiesPart
-from pptx.parts.presentation import PresentationPart
-from pptx.parts.slide import NotesMasterPart, SlideMasterPart, SlidePart
+from pptx.parts.presentation import PresentationPart, _SlideIndex
+from pptx.parts.slide import NotesMasterPart, SlideLayoutPart, SlideMasterPart, SlidePart
 from pptx.presentation import Presentation
 from pptx.slide import NotesMaster, Slide, SlideLayout, SlideMaster
 
@@ -120,8 +121,16 @@ class DescribePresentationPart(object):
         ]
 
     def it_can_save_the_package_to_a_file(self, package_):
-        PresentationPart(None, None, package_, None).save("prs.pptx")
-        package_.save.assert_called_once_with("prs.pptx")
+        PresentationPart(None, None, package_, None).save("prs.pptx", compression=6)
+        package_.save.assert_called_once_with("prs.pptx", None, 6, False)
+
+    def it_can_generate_the_package_bytes_in_chunks(self, package_):
+        package_.iter_save.return_value = iter((b"foo", b"bar"))
+
+        chunks = PresentationPart(None, None, package_, None).iter_save(4)
+
+        package_.iter_save.assert_called_once_with(4, None)
+        assert list(chunks) == [b"foo", b"bar"]
 
     def it_can_add_a_new_slide(self, request, package_, slide_part_, slide_, relate_to_):
         slide_layout_ = instance_mock(request, SlideLayout)
@@ -141,28 +150,26 @@ class DescribePresentationPart(object):
         assert rId == "rId42"
         assert slide is slide_
 
-    def it_finds_the_slide_id_of_a_slide_part(self, slide_part_, related_part_):
+    def it_finds_the_slide_id_of_a_slide_part(self, request, slide_part_, related_part_):
         prs_elm = element(
             "p:presentation/p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id="
             "b,id=257},p:sldId{r:id=c,id=258})"
         )
-        related_part_.side_effect = iter((None, slide_part_, None))
+        other_parts = [instance_mock(request, SlidePart) for _ in range(2)]
+        parts = {"a": other_parts[0], "b": slide_part_, "c": other_parts[1]}
+        related_part_.side_effect = lambda _, rId: parts[rId]
         prs_part = PresentationPart(None, None, None, prs_elm)
 
         _slide_id = prs_part.slide_id(slide_part_)
 
-        assert related_part_.call_args_list == [
-            call(prs_part, "a"),
-            call(prs_part, "b"),
-        ]
         assert _slide_id == 257
 
-    def it_raises_on_slide_id_not_found(self, slide_part_, related_part_):
+    def it_raises_on_slide_id_not_found(self, request, slide_part_, related_part_):
         prs_elm = element(
             "p:presentation/p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id="
             "b,id=257},p:sldId{r:id=c,id=258})"
         )
-        related_part_.return_value = "not the slide you're looking for"
+        related_part_.return_value = instance_mock(request, SlidePart)
         prs_part = PresentationPart(None, None, None, prs_elm)
 
         with pytest.raises(ValueError):
@@ -184,6 +191,83 @@ class DescribePresentationPart(object):
 
         assert slide == expected_value
 
+    def it_finds_the_position_of_a_slide_part(self, request, related_part_):
+        prs_elm = element(
+            "p:presentation/p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id=b,id=257})"
+        )
+        parts = {rId: instance_mock(request, SlidePart) for rId in "abc"}
+        related_part_.side_effect = lambda _, rId: parts[rId]
+        prs_part = PresentationPart(None, None, None, prs_elm)
+
+        assert prs_part.slide_idx(parts["b"]) == 1
+        with pytest.raises(ValueError):
+            prs_part.slide_idx(parts["c"])
+
+    def it_keeps_its_slide_index_current_as_slides_change(self, request, related_part_):
+        prs_elm = element(
+            "p:presentation/p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id=b,id=257})"
+        )
+        sldIdLst = prs_elm.sldIdLst
+        parts = {rId: instance_mock(request, SlidePart) for rId in "abc"}
+        related_part_.side_effect = lambda _, rId: parts[rId]
+        prs_part = PresentationPart(None, None, None, prs_elm)
+        assert prs_part.slide_idx(parts["b"]) == 1
+
+        prs_part.index_slide(sldIdLst.add_sldId("c"))
+        assert prs_part.slide_id(parts["c"]) == 258
+        assert prs_part.slide_idx(parts["c"]) == 2
+
+        sldIdLst.remove(sldIdLst[0])
+        assert prs_part.slide_idx(parts["b"]) == 0
+        assert prs_part.get_slide(256) is None
+        with pytest.raises(ValueError):
+            prs_part.slide_id(parts["a"])
+
+        sldIdLst.insert(0, sldIdLst[1])
+        assert prs_part.slide_idx(parts["c"]) == 0
+        assert prs_part.slide_idx(parts["b"]) == 1
+
+    def it_keeps_slide_positions_without_rescanning_the_slide_list(self, request, related_part_):
+        prs_elm = element(
+            "p:presentation/p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id=b,id=257})"
+        )
+        sldIdLst = prs_elm.sldIdLst
+        parts = {rId: instance_mock(request, SlidePart) for rId in "abc"}
+        related_part_.side_effect = lambda _, rId: parts[rId]
+        prs_part = PresentationPart(None, None, None, prs_elm)
+        assert prs_part.slide_idx(parts["b"]) == 1
+        _build_ = method_mock(request, _SlideIndex, "_build", autospec=True)
+
+        prs_part.index_slide(sldIdLst.add_sldId("c"))
+        assert prs_part.slide_idx(parts["a"]) == 0
+        assert prs_part.slide_idx(parts["c"]) == 2
+        _build_.assert_not_called()
+
+        sldIdLst.insert(0, sldIdLst[2])
+        prs_part.slide_idx(parts["c"])
+        _build_.assert_called_once_with(prs_part._slide_index)
+
+    def it_finds_the_slide_parts_based_on_a_slide_layout(self, request, package_, related_part_):
+        prs_elm = element(
+            "p:presentation/p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id=b,id=257},"
+            "p:sldId{r:id=c,id=258})"
+        )
+        slide_layout_part_ = instance_mock(request, SlideLayoutPart)
+        master_part_ = instance_mock(request, SlideMasterPart, content_type=CT.PML_SLIDE_MASTER)
+        parts = {
+            rId: instance_mock(request, SlidePart, content_type=CT.PML_SLIDE) for rId in "abcd"
+        }
+        related_part_.side_effect = lambda _, rId: parts[rId]
+        package_.iter_source_parts.return_value = iter(
+            (parts["c"], master_part_, parts["d"], parts["a"])
+        )
+        prs_part = PresentationPart(None, None, package_, prs_elm)
+
+        slide_parts = prs_part.slide_parts_based_on(slide_layout_part_)
+
+        package_.iter_source_parts.assert_called_once_with(slide_layout_part_, RT.SLIDE_LAYOUT)
+        assert slide_parts == (parts["a"], parts["c"])
+
     def it_knows_the_next_slide_partname_to_help(self):
         prs_elm = element("p:presentation/p:sldIdLst/(p:sldId,p:sldId)")
         prs_part = PresentationPart(None, None, None, prs_elm)
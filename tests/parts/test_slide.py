@@ -12,6 +12,8 @@ from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.package import Part
 from pptx.opc.packuri import PackURI
+from pptx.opc.serialized import MemberBlob
+from pptx.oxml.ns import nsdecls
 from pptx.oxml.slide import CT_NotesMaster, CT_NotesSlide, CT_Slide
 from pptx.oxml.theme import CT_OfficeStyleSheet
 from pptx.package import Package
@@ -381,6 +383,21 @@ class DescribeSlidePart(object):
         Slide_.assert_called_once_with(sld, slide_part)
         assert slide is slide_
 
+    @pytest.mark.parametrize("read_only", (True, False))
+    def it_can_release_its_slide(self, request, read_only):
+        package_ = instance_mock(request, Package, read_only=read_only)
+        member_blob_ = instance_mock(request, MemberBlob)
+        member_blob_.load.return_value = ("<p:sld %s/>" % nsdecls("p")).encode()
+        slide_part = SlidePart.load(
+            PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, package_, member_blob_
+        )
+        slide = slide_part.slide
+
+        slide_part.release()
+
+        assert (slide_part.slide is slide) is not read_only
+        assert slide_part.slide.element.tag == slide.element.tag
+
     def it_provides_access_to_the_slide_layout(self, layout_fixture):
         slide_part, slide_layout_ = layout_fixture
         slide_layout = slide_part.slide_layout
@@ -258,6 +258,7 @@ class DescribeAutoShapeType(object):
         assert autoshape_type.autoshape_type_id == MSO_SHAPE.NO_SYMBOL
         assert autoshape_type.prst == "noSmoking"
         assert autoshape_type.basename == "&quot;No&quot; Symbol"
+        assert autoshape_type.display_basename == '"No" Symbol'
 
     @pytest.mark.parametrize(
         ("prst", "default_adj_vals"),
@@ -9,8 +9,15 @@ import io
 import pytest
 
 from pptx.chart.data import ChartData
+from pptx.dml.color import RGBColor
 from pptx.enum.chart import XL_CHART_TYPE
-from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE, MSO_CONNECTOR, PP_PLACEHOLDER, PROG_ID
+from pptx.enum.shapes import (
+    MSO_AUTO_SHAPE_TYPE,
+    MSO_CONNECTOR,
+    MSO_SHAPE_TYPE,
+    PP_PLACEHOLDER,
+    PROG_ID,
+)
 from pptx.media import SPEAKER_IMAGE_BYTES, Video
 from pptx.oxml import parse_xml
 from pptx.oxml.shapes.groupshape import CT_GroupShape
@@ -41,6 +48,7 @@ from pptx.shapes.shapetree import (
     MasterShapes,
     NotesSlidePlaceholders,
     NotesSlideShapes,
+    ShapeSpec,
     SlidePlaceholders,
     SlideShapeFactory,
     SlideShapes,
@@ -141,24 +149,40 @@ class Describe_BaseShapes(object):
         shapes.clone_placeholder(placeholder_)
         assert shapes._element.xml == expected_xml
 
-    def it_knows_if_turbo_add_is_enabled(self, turbo_fixture):
-        shapes, expected_value = turbo_fixture
-        turbo_add_enabled = shapes.turbo_add_enabled
-        assert turbo_add_enabled == expected_value
-
-    def it_can_change_turbo_add_enabled(self, turbo_set_fixture):
-        shapes, value, expected_value = turbo_set_fixture
-        shapes.turbo_add_enabled = value
-        assert shapes.turbo_add_enabled == expected_value
+    @pytest.mark.parametrize("value", [True, False])
+    def it_ignores_the_deprecated_turbo_add_setting(self, value: bool):
+        shapes = _BaseShapes(element("p:spTree/p:nvSpPr/p:cNvPr{id=2}"), None)
+        with pytest.warns(DeprecationWarning, match="turbo_add_enabled is deprecated"):
+            shapes.turbo_add_enabled = value
+        with pytest.warns(DeprecationWarning, match="turbo_add_enabled is deprecated"):
+            assert shapes.turbo_add_enabled is True
 
-    def it_finds_the_next_shape_id_to_help(self, next_id_fixture):
+    def it_allocates_the_next_shape_id_to_help(self, next_id_fixture):
         shapes, expected_value = next_id_fixture
-        assert shapes._next_shape_id == expected_value
+        assert shapes._allocate_shape_id() == expected_value
+
+    def and_it_never_reuses_an_id_across_shape_collections_for_the_same_slide(self):
+        spTree = element("p:spTree/p:nvGrpSpPr/p:cNvPr{id=1,name=t}")
+        shapes, other_shapes = _BaseShapes(spTree, None), _BaseShapes(spTree, None)
+
+        assert shapes._allocate_shape_id() == 2
+        assert other_shapes._allocate_shape_id() == 3
+        spTree.append(element("p:sp/p:nvSpPr/p:cNvPr{id=42,name=foo}"))
+        assert shapes._allocate_shape_id() == 43
 
     def it_finds_the_next_placeholder_name_to_help(self, ph_name_fixture):
         shapes, ph_type, sp_id, orient, expected_value = ph_name_fixture
         assert shapes._next_ph_name(ph_type, sp_id, orient) == expected_value
 
+    def and_it_sees_shapes_renamed_after_names_were_first_checked(self):
+        spTree = element("p:spTree/p:sp/p:nvSpPr/p:cNvPr{id=2,name=Title 1}")
+        shapes = SlideShapes(spTree, None)
+        assert shapes._next_ph_name(PP_PLACEHOLDER.TITLE, 2, ST_Direction.HORZ) == "Title 2"
+
+        spTree.xpath(".//p:cNvPr")[0].name = "Foo"
+
+        assert shapes._next_ph_name(PP_PLACEHOLDER.TITLE, 2, ST_Direction.HORZ) == "Title 1"
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -250,31 +274,6 @@ class Describe_BaseShapes(object):
         shapes = SlideShapes(spTree, None)
         return shapes, ph_type, sp_id, orient, expected_name
 
-    @pytest.fixture(params=[(None, False), (42, True)])
-    def turbo_fixture(self, request):
-        cached_max_shape_id, expected_value = request.param
-        shapes = _BaseShapes(None, None)
-        if cached_max_shape_id:
-            shapes._cached_max_shape_id = cached_max_shape_id
-        return shapes, expected_value
-
-    @pytest.fixture(
-        params=[
-            ("p:spTree/p:nvSpPr", True),
-            ("p:spTree/p:nvSpPr/p:cNvPr{id=2}", True),
-            ("p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=3})", False),
-            (
-                "p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=1},p:" "cNvPr{id=1},p:cNvPr{id=4})",
-                True,
-            ),
-        ]
-    )
-    def turbo_set_fixture(self, request):
-        spTree_cxml, value = request.param
-        shapes = _BaseShapes(element(spTree_cxml), None)
-        expected_value = value
-        return shapes, value, expected_value
-
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -337,6 +336,55 @@ class Describe_BaseGroupShapes(object):
         shapes._shape_factory.assert_called_once_with(shapes, cxnSp_)
         assert connector is connector_
 
+    def it_can_add_shapes_in_bulk(self):
+        spTree_cxml = "p:spTree/p:nvGrpSpPr/p:cNvPr{id=1,name=t}"
+        shapes = SlideShapes(element(spTree_cxml), None)
+        expected_shapes = SlideShapes(element(spTree_cxml), None)
+        rectangle = expected_shapes.add_shape(MSO_AUTO_SHAPE_TYPE.RECTANGLE, 1, 2, 3, 4)
+        rectangle.fill.solid()
+        rectangle.fill.fore_color.rgb = RGBColor(0x12, 0x34, 0x56)
+        rectangle.text = "foo\nbar\vbaz"
+        expected_shapes.add_textbox(5, 6, 7, 8).text = "<&>"
+        connector = expected_shapes.add_connector(MSO_CONNECTOR.STRAIGHT, 9, 10, 1, 12)
+        connector.line.color.rgb = RGBColor(0xAB, 0xCD, 0xEF)
+
+        shapes.add_shapes(
+            [
+                ShapeSpec(
+                    MSO_AUTO_SHAPE_TYPE.RECTANGLE,
+                    1,
+                    2,
+                    3,
+                    4,
+                    RGBColor(0x12, 0x34, 0x56),
+                    "foo\nbar\vbaz",
+                ),
+                (MSO_SHAPE_TYPE.TEXT_BOX, 5, 6, 7, 8, None, "<&>"),
+                (MSO_CONNECTOR.STRAIGHT, 9, 10, -8, 2, RGBColor(0xAB, 0xCD, 0xEF)),
+            ]
+        )
+
+        assert shapes._spTree.xml == expected_shapes._spTree.xml
+
+    @pytest.mark.parametrize(
+        "spec",
+        [
+            (MSO_CONNECTOR.STRAIGHT, 1, 2, 3, 4, None, "foo"),
+            (MSO_SHAPE_TYPE.PICTURE, 1, 2, 3, 4),
+            (MSO_SHAPE_TYPE.TEXT_BOX, 1, 2, 3, 4, '123456"/><a:foo x="'),
+            (MSO_SHAPE_TYPE.TEXT_BOX, 1, 2, 3, 4, "12345G"),
+        ],
+    )
+    def but_it_raises_on_a_shape_it_cannot_add_in_bulk(self, spec: tuple[object, ...]):
+        spTree = element("p:spTree/p:nvGrpSpPr/p:cNvPr{id=1,name=t}")
+        shapes = SlideShapes(spTree, None)
+
+        with pytest.raises(ValueError):
+            shapes.add_shapes([(MSO_SHAPE_TYPE.TEXT_BOX, 1, 2, 3, 4), spec])
+
+        assert len(shapes) == 0
+        assert spTree.next_shape_id == 2
+
     def it_can_provide_a_freeform_builder(self, freeform_fixture):
         shapes, start_x, start_y, scale = freeform_fixture[:4]
         FreeformBuilder_new_, x_scale, y_scale = freeform_fixture[4:7]
@@ -357,9 +405,9 @@ class Describe_BaseGroupShapes(object):
         assert group_shape is group_shape_
 
     def it_can_add_an_ole_object(
-        self, request, _next_shape_id_prop_, _recalculate_extents_, _shape_factory_
+        self, request, _allocate_shape_id_, _recalculate_extents_, _shape_factory_
     ):
-        _next_shape_id_prop_.return_value = 42
+        _allocate_shape_id_.return_value = 42
         graphicFrame = element("p:graphicFrame")
         _OleObjectElementCreator_ = class_mock(
             request, "pptx.shapes.shapetree._OleObjectElementCreator"
@@ -540,11 +588,11 @@ class Describe_BaseGroupShapes(object):
         return (shapes, connector_type, begin_x, begin_y, end_x, end_y, expected_xml)
 
     @pytest.fixture
-    def add_pic_fixture(self, image_part_, _next_shape_id_prop_):
+    def add_pic_fixture(self, image_part_, _allocate_shape_id_):
         shapes = _BaseGroupShapes(element("p:spTree"), None)
         rId, x, y, cx, cy = "rId24", 10, 11, 12, 13
 
-        _next_shape_id_prop_.return_value = 42
+        _allocate_shape_id_.return_value = 42
         image_part_.scale.return_value = (101, 102)
         image_part_.desc = "sprocket.jpg"
         expected_xml = (
@@ -565,12 +613,12 @@ class Describe_BaseGroupShapes(object):
         return shapes, image_part_, rId, x, y, cx, cy, expected_xml
 
     @pytest.fixture
-    def add_sp_fixture(self, autoshape_type_, _next_shape_id_prop_):
+    def add_sp_fixture(self, autoshape_type_, _allocate_shape_id_):
         shapes = _BaseGroupShapes(element("p:spTree"), None)
         x, y, cx, cy = 8, 7, 6, 5
 
-        _next_shape_id_prop_.return_value = 7
-        autoshape_type_.basename = "Rounded Rectangle"
+        _allocate_shape_id_.return_value = 7
+        autoshape_type_.display_basename = "Rounded Rectangle"
         autoshape_type_.prst = "roundRect"
 
         expected_xml = (
@@ -595,11 +643,11 @@ class Describe_BaseGroupShapes(object):
         return shapes, autoshape_type_, x, y, cx, cy, expected_xml
 
     @pytest.fixture
-    def add_textbox_sp_fixture(self, _next_shape_id_prop_):
+    def add_textbox_sp_fixture(self, _allocate_shape_id_):
         shapes = _BaseGroupShapes(element("p:spTree"), None)
         x, y, cx, cy = 1, 2, 3, 4
 
-        _next_shape_id_prop_.return_value = 6
+        _allocate_shape_id_.return_value = 6
 
         expected_xml = (
             '<p:spTree xmlns:p="http://schemas.openxmlformats.org/presentati'
@@ -702,8 +750,8 @@ class Describe_BaseGroupShapes(object):
         return shapes, shape_
 
     @pytest.fixture
-    def _next_shape_id_prop_(self, request):
-        return property_mock(request, _BaseGroupShapes, "_next_shape_id")
+    def _allocate_shape_id_(self, request):
+        return method_mock(request, _BaseGroupShapes, "_allocate_shape_id", autospec=True)
 
     @pytest.fixture
     def picture_fixture(
@@ -1314,7 +1362,7 @@ class DescribeSlideShapes(object):
         _add_video_timing_,
         _shape_factory_,
         movie_,
-        _next_shape_id_prop_,
+        _allocate_shape_id_,
     ):
         shapes = SlideShapes(element("p:spTree"), None)
         movie_file, x, y, cx, cy = "foobar.mp4", 1, 2, 3, 4
@@ -1322,7 +1370,7 @@ class DescribeSlideShapes(object):
         movie_pic = element("p:pic")
         _MoviePicElementCreator_.new_movie_pic.return_value = movie_pic
         _shape_factory_.return_value = movie_
-        shape_id_ = _next_shape_id_prop_.return_value
+        shape_id_ = _allocate_shape_id_.return_value
         return (
             shapes,
             movie_file,
@@ -1405,8 +1453,10 @@ class DescribeSlideShapes(object):
         return class_mock(request, "pptx.shapes.shapetree._MoviePicElementCreator", autospec=True)
 
     @pytest.fixture
-    def _next_shape_id_prop_(self, request, shape_id_):
-        return property_mock(request, SlideShapes, "_next_shape_id", return_value=shape_id_)
+    def _allocate_shape_id_(self, request, shape_id_):
+        return method_mock(
+            request, SlideShapes, "_allocate_shape_id", autospec=True, return_value=shape_id_
+        )
 
     @pytest.fixture
     def placeholder_(self, request):
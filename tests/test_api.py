@@ -2,25 +2,136 @@
 
 from __future__ import annotations
 
+import io
 import os
 
 import pytest
 
 import pptx
 from pptx.api import Presentation
+from pptx.exc import ReadOnlyError
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.parts.presentation import PresentationPart
 
-from .unitutil.mock import class_mock, instance_mock
+from .unitutil.file import testfile
+from .unitutil.mock import class_mock, instance_mock, var_mock
 
 
 class DescribePresentation(object):
-    def it_opens_default_template_on_no_path_provided(self, call_fixture):
+    def it_opens_default_template_on_no_path_provided(self, request, call_fixture):
         Package_, path, prs_ = call_fixture
+        _package_cache_ = var_mock(request, "pptx.api._package_cache")
+
         prs = Presentation()
-        Package_.open.assert_called_once_with(path)
+
+        Package_.open.assert_called_once_with(path, lazy=False, workers=None, read_only=False)
+        _package_cache_.open.assert_not_called()
+        assert prs is prs_
+
+    def and_it_copies_the_default_template_from_the_cache_when_asked(self, request, call_fixture):
+        Package_, path, prs_ = call_fixture
+        _package_cache_ = var_mock(request, "pptx.api._package_cache")
+        _package_cache_.open.return_value = Package_.open.return_value
+
+        prs = Presentation(cached=True)
+
+        _package_cache_.open.assert_called_once_with(path)
+        Package_.open.assert_not_called()
+        assert prs is prs_
+
+    def and_it_can_copy_a_template_sharing_its_unused_parts(self, request, call_fixture):
+        Package_, path, prs_ = call_fixture
+        _package_cache_ = var_mock(request, "pptx.api._package_cache")
+        _shared_package_cache_ = var_mock(request, "pptx.api._shared_package_cache")
+        _shared_package_cache_.open.return_value = Package_.open.return_value
+
+        prs = Presentation(path, cached=True, share=True)
+
+        _shared_package_cache_.open.assert_called_once_with(path)
+        _package_cache_.open.assert_not_called()
+        Package_.open.assert_not_called()
+        assert prs is prs_
+
+    def but_it_refuses_to_cache_a_presentation_opened_from_a_stream(self, request):
+        _package_cache_ = var_mock(request, "pptx.api._package_cache")
+
+        with pytest.raises(ValueError, match="cached=True requires a filesystem path"):
+            Presentation(io.BytesIO(), cached=True)
+
+        _package_cache_.open.assert_not_called()
+
+    def it_opens_a_pptx_file_uncached_by_default(self, call_fixture):
+        Package_, path, prs_ = call_fixture
+
+        prs = Presentation(path, workers=4)
+
+        Package_.open.assert_called_once_with(path, lazy=False, workers=4, read_only=False)
+        assert prs is prs_
+
+    def it_can_open_a_presentation_read_only(self, request, call_fixture):
+        Package_, path, prs_ = call_fixture
+        _package_cache_ = var_mock(request, "pptx.api._package_cache")
+
+        prs = Presentation(path, cached=True, read_only=True)
+
+        Package_.open.assert_called_once_with(path, lazy=False, workers=None, read_only=True)
+        _package_cache_.open.assert_not_called()
         assert prs is prs_
 
+    def and_a_read_only_presentation_cannot_be_changed_or_saved(self):
+        with Presentation(testfile("test_slides.pptx"), read_only=True) as prs:
+            slide = prs.slides[0]
+            shape = slide.shapes[0]
+            assert shape.name == "Title 1"
+
+            with pytest.raises(ReadOnlyError):
+                shape.name = "Foobar"
+            with pytest.raises(ReadOnlyError):
+                shape.left = 42
+            with pytest.raises(ReadOnlyError):
+                prs.slides.add_slide(prs.slide_layouts[0])
+            with pytest.raises(ReadOnlyError):
+                prs.save(io.BytesIO())
+            assert shape.name == "Title 1"
+
+    def and_its_text_cannot_be_changed_either(self):
+        with Presentation(testfile("test_slides.pptx"), read_only=True) as prs:
+            shape = next(s for s in prs.slides[0].shapes if s.name == "TextBox 6")
+            run = shape.text_frame.paragraphs[0].runs[0]
+
+            with pytest.raises(ReadOnlyError):
+                run.text = "Foobar"
+            with pytest.raises(ReadOnlyError):
+                prs.core_properties.title = "Foobar"
+            with pytest.raises(ReadOnlyError):
+                prs.core_properties.revision = 42
+            assert run.text == "Test text"
+            assert prs.core_properties.title == "python-pptx was here!"
+
+    def it_can_open_a_template_by_copying_it_from_the_cache(self):
+        path = os.path.abspath(
+            os.path.join(os.path.split(pptx.__file__)[0], "templates", "default.pptx")
+        )
+        prs = Presentation(path, cached=True)
+        prs_2 = Presentation(path, cached=True)
+
+        prs.slides.add_slide(prs.slide_layouts[0])
+
+        assert prs.part is not prs_2.part
+        assert len(prs.slides) == 1
+        assert len(prs_2.slides) == 0
+
+    def and_a_template_copied_from_the_sharing_cache_is_independent_too(self):
+        path = testfile("test_slides.pptx")
+        prs = Presentation(path, cached=True, share=True)
+        prs_2 = Presentation(path, cached=True, share=True)
+
+        prs.slides[0].shapes[0].name = "Foobar"
+        prs.slides.add_slide(prs.slide_layouts[0])
+
+        assert prs_2.slides[0].shapes[0].name == "Title 1"
+        assert len(prs_2.slides) == len(prs.slides) - 1
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -0,0 +1,69 @@
+"""Unit-test suite for `pptx.batch` module."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from pptx import Presentation
+from pptx.batch import RenderResult, render_many
+
+
+def build(prs, row):
+    """Add a title slide titled `row`, or fail when `row` is None."""
+    if row is None:
+        raise ValueError("no title")
+    slide = prs.slides.add_slide(prs.slide_layouts[0])
+    slide.shapes.title.text = row
+
+
+def build_or_crash(prs, row):
+    """Add a title slide titled `row`, or kill the worker process when `row` is "crash"."""
+    if row == "crash":
+        os._exit(1)
+    build(prs, row)
+
+
+class Describe_render_many(object):
+    """Unit-test suite for `pptx.batch.render_many()`."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def it_renders_a_presentation_for_each_row(self, tmp_path, workers):
+        out_dir = str(tmp_path)
+
+        results = sorted(render_many(None, ["a", None, "c"], build, out_dir, workers=workers))
+
+        assert [r.index for r in results] == [0, 1, 2]
+        assert [r.path for r in results] == [
+            os.path.join(out_dir, "0.pptx"),
+            None,
+            os.path.join(out_dir, "2.pptx"),
+        ]
+        assert all(r.seconds >= 0.0 for r in results)
+        assert results[0].error is None
+        assert "ValueError: no title" in results[1].error
+        assert sorted(os.listdir(out_dir)) == ["0.pptx", "2.pptx"]
+        prs = Presentation(results[2].path)
+        assert [s.shapes.title.text for s in prs.slides] == ["c"]
+
+    def and_it_carries_on_when_a_worker_process_dies(self, tmp_path):
+        out_dir = str(tmp_path)
+        rows = ["a", "crash"] + ["row-%d" % i for i in range(2, 10)]
+
+        results = sorted(render_many(None, rows, build_or_crash, out_dir, workers=2))
+
+        assert [r.index for r in results] == list(range(10))
+        assert results[1].path is None
+        assert "BrokenProcessPool" in results[1].error
+        assert results[9].path == os.path.join(out_dir, "9.pptx")
+        assert sorted(os.listdir(out_dir)) == sorted(
+            os.path.basename(r.path) for r in results if r.path is not None
+        )
+
+    def it_names_the_files_it_saves_using_the_filename_template(self, tmp_path):
+        results = list(render_many(None, ["a"], build, str(tmp_path), 1, "deck-%03d.pptx"))
+
+        assert results == [
+            RenderResult(0, os.path.join(str(tmp_path), "deck-000.pptx"), results[0].seconds, None)
+        ]
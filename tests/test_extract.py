@@ -0,0 +1,132 @@
+"""Unit-test suite for `pptx.extract` module."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from pptx import Presentation
+from pptx.extract import TextRecord, _iter_paragraphs, _notes_text, iter_text
+from pptx.oxml.ns import nsdecls
+from pptx.shapes.group import GroupShape
+
+from .unitutil.file import testfile
+
+
+class Describe_iter_text(object):
+    """Unit-test suite for `pptx.extract.iter_text()`."""
+
+    def it_generates_the_text_of_each_paragraph_of_each_slide(self, deck):
+        records = list(iter_text(deck))
+
+        assert records == [
+            TextRecord(0, 2, "Title 1", "Foo", ""),
+            TextRecord(0, 3, "Subtitle 2", "bar", ""),
+            TextRecord(0, 3, "Subtitle 2", "baz\vqux", ""),
+            TextRecord(1, 2, "Title 1", "Second", "Note 1\nNote 2"),
+            TextRecord(1, 3, "Subtitle 2", "", "Note 1\nNote 2"),
+            TextRecord(2, None, None, "", "Only notes"),
+        ]
+
+    def and_it_matches_the_text_of_the_object_model(self):
+        def iter_paragraphs(shapes):
+            for shape in shapes:
+                if isinstance(shape, GroupShape):
+                    yield from iter_paragraphs(shape.shapes)
+                elif shape.has_text_frame:
+                    for paragraph in shape.text_frame.paragraphs:
+                        yield shape.shape_id, shape.name, paragraph.text
+                elif shape.has_table:
+                    for cell in shape.table.iter_cells():
+                        for paragraph in cell.text_frame.paragraphs:
+                            yield shape.shape_id, shape.name, paragraph.text
+
+        prs = Presentation(testfile("test_slides.pptx"))
+
+        records = list(iter_text(testfile("test_slides.pptx")))
+
+        assert [r[1:4] for r in records] == list(iter_paragraphs(prs.slides[0].shapes))
+
+    def it_generates_nothing_for_a_presentation_having_no_slides(self):
+        assert list(iter_text(testfile("no-slides.pptx"))) == []
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def deck(self):
+        prs = Presentation()
+        title_layout, title_only_layout = prs.slide_layouts[0], prs.slide_layouts[6]
+        slide = prs.slides.add_slide(title_layout)
+        slide.shapes.title.text = "Foo"
+        slide.placeholders[1].text_frame.text = "bar\nbaz\vqux"
+        slide = prs.slides.add_slide(title_layout)
+        slide.shapes.title.text = "Second"
+        slide.notes_slide.notes_text_frame.text = "Note 1\nNote 2"
+        slide = prs.slides.add_slide(title_only_layout)
+        slide.notes_slide.notes_text_frame.text = "Only notes"
+        stream = io.BytesIO()
+        prs.save(stream)
+        return stream
+
+
+class Describe_iter_paragraphs(object):
+    """Unit-test suite for `pptx.extract._iter_paragraphs()`."""
+
+    def it_generates_the_shape_and_text_of_each_paragraph(self):
+        blob = (
+            "<p:sld %s><p:cSld><p:spTree>"
+            '<p:sp><p:nvSpPr><p:cNvPr id="2" name="A"/><p:cNvSpPr/><p:nvPr><p:ph type="title"/>'
+            "</p:nvPr></p:nvSpPr><p:txBody><a:p><a:r><a:t>x</a:t></a:r><a:br/>"
+            '<a:fld id="{1}"><a:t>y</a:t></a:fld></a:p></p:txBody></p:sp>'
+            '<p:grpSp><p:nvGrpSpPr><p:cNvPr id="3" name="G"/></p:nvGrpSpPr>'
+            '<p:sp><p:nvSpPr><p:cNvPr id="4" name="B"/><p:nvPr><p:ph idx="1"/></p:nvPr></p:nvSpPr>'
+            "<p:txBody><a:p/><a:p><a:r><a:t/></a:r><a:r><a:t> z</a:t></a:r></a:p></p:txBody>"
+            "</p:sp></p:grpSp>"
+            '<p:sp><p:nvSpPr><p:cNvPr id="5" name="C"/></p:nvSpPr>'
+            "<p:txBody><a:p><a:r><a:t>w</a:t></a:r></a:p></p:txBody></p:sp>"
+            "</p:spTree></p:cSld></p:sld>" % nsdecls("a", "p")
+        ).encode()
+
+        assert list(_iter_paragraphs(blob)) == [
+            (2, "A", "title", "x\vy"),
+            (4, "B", "obj", ""),
+            (4, "B", "obj", " z"),
+            (5, "C", None, "w"),
+        ]
+
+    def but_it_reads_only_the_choice_of_alternate_content(self):
+        blob = (
+            "<p:sld %s><p:cSld><p:spTree>"
+            '<ve:AlternateContent><ve:Choice Requires="p14">'
+            '<p:sp><p:nvSpPr><p:cNvPr id="2" name="A"/></p:nvSpPr>'
+            "<p:txBody><a:p><a:r><a:t>x</a:t></a:r></a:p></p:txBody></p:sp>"
+            "</ve:Choice><ve:Fallback>"
+            '<p:sp><p:nvSpPr><p:cNvPr id="2" name="A"/></p:nvSpPr>'
+            "<p:txBody><a:p><a:r><a:t>x</a:t></a:r></a:p></p:txBody></p:sp>"
+            "</ve:Fallback></ve:AlternateContent>"
+            '<p:sp><p:nvSpPr><p:cNvPr id="3" name="B"/></p:nvSpPr>'
+            "<p:txBody><a:p><a:r><a:t>y</a:t></a:r></a:p></p:txBody></p:sp>"
+            "</p:spTree></p:cSld></p:sld>" % nsdecls("a", "p", "ve")
+        ).encode()
+
+        assert list(_iter_paragraphs(blob)) == [(2, "A", None, "x"), (3, "B", None, "y")]
+
+
+class Describe_notes_text(object):
+    """Unit-test suite for `pptx.extract._notes_text()`."""
+
+    def it_takes_the_text_of_the_notes_placeholder(self):
+        blob = (
+            "<p:notes %s><p:cSld><p:spTree>"
+            '<p:sp><p:nvSpPr><p:cNvPr id="2" name="A"/><p:nvPr><p:ph type="sldImg"/></p:nvPr>'
+            "</p:nvSpPr><p:txBody><a:p><a:r><a:t>no</a:t></a:r></a:p></p:txBody></p:sp>"
+            '<p:sp><p:nvSpPr><p:cNvPr id="3" name="B"/><p:nvPr><p:ph type="body"/></p:nvPr>'
+            "</p:nvSpPr><p:txBody><a:p><a:r><a:t>a</a:t></a:r></a:p><a:p><a:r><a:t>b</a:t>"
+            "</a:r></a:p></p:txBody></p:sp>"
+            '<p:sp><p:nvSpPr><p:cNvPr id="4" name="C"/><p:nvPr><p:ph type="body"/></p:nvPr>'
+            "</p:nvSpPr><p:txBody><a:p><a:r><a:t>c</a:t></a:r></a:p></p:txBody></p:sp>"
+            "</p:spTree></p:cSld></p:notes>" % nsdecls("a", "p")
+        ).encode()
+
+        assert _notes_text(blob) == "a\nb"
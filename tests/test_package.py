@@ -5,15 +5,19 @@
 from __future__ import annotations
 
 import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
 import pptx
 from pptx.media import Video
+from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
-from pptx.opc.package import Part, _Relationship
+from pptx.opc.package import Part, XmlPart, _PartnameIndex
 from pptx.opc.packuri import PackURI
-from pptx.package import Package, _ImageParts, _MediaParts
+from pptx.package import Package, PackageCache, _ImageParts, _MediaParts
 from pptx.parts.coreprops import CorePropertiesPart
 from pptx.parts.image import Image, ImagePart
 from pptx.parts.media import MediaPart
@@ -53,6 +57,22 @@ class DescribePackage(object):
         partname = package.next_media_partname(ext)
         assert partname == expected_value
 
+    def it_removes_a_dropped_part_from_its_part_indexes(
+        self, _image_parts_prop_, image_parts_, _media_parts_prop_, media_parts_
+    ):
+        _image_parts_prop_.return_value = image_parts_
+        _media_parts_prop_.return_value = media_parts_
+        part = Part(PackURI("/ppt/media/image1.png"), CT.PNG, None)
+        package = Package(None)
+        package._partname_index = _PartnameIndex((part.partname,))
+        package._indexed_parts = {part}
+
+        package._drop_part(part)
+
+        assert package.next_image_partname("png") == "/ppt/media/image1.png"
+        image_parts_.remove.assert_called_once_with(part)
+        media_parts_.remove.assert_called_once_with(part)
+
     def it_provides_access_to_its_MediaParts_object(self, m_parts_fixture):
         package, _MediaParts_, media_parts_ = m_parts_fixture
         media_parts = package._media_parts
@@ -83,19 +103,23 @@ class DescribePackage(object):
         return package, _MediaParts_, media_parts_
 
     @pytest.fixture(params=[((3, 4, 2), 1), ((4, 2, 1), 3), ((2, 3, 1), 4)])
-    def next_fixture(self, request, iter_parts_):
+    def next_fixture(self, request):
         idxs, idx = request.param
         package = Package(None)
-        package.iter_parts.return_value = self.i_image_parts(request, idxs)
+        for i in idxs:
+            image_part = Part(PackURI("/ppt/media/image%d.png" % i), CT.PNG, package)
+            package.relate_to(image_part, RT.IMAGE)
         ext = "foo"
         expected_value = "/ppt/media/image%d.%s" % (idx, ext)
         return package, ext, expected_value
 
     @pytest.fixture(params=[((3, 4, 2), 1), ((4, 2, 1), 3), ((2, 3, 1), 4)])
-    def nmp_fixture(self, request, iter_parts_):
+    def nmp_fixture(self, request):
         idxs, idx = request.param
         package = Package(None)
-        package.iter_parts.return_value = self.i_media_parts(request, idxs)
+        for i in idxs:
+            media_part = Part(PackURI("/ppt/media/media%d.mp4" % i), CT.MP4, package)
+            package.relate_to(media_part, RT.MEDIA)
         ext = "foo"
         expected_value = "/ppt/media/media%d.%s" % (idx, ext)
         return package, ext, expected_value
@@ -114,24 +138,6 @@ class DescribePackage(object):
     def _image_parts_prop_(self, request):
         return property_mock(request, Package, "_image_parts")
 
-    def i_image_parts(self, request, idxs):
-        def part(idx):
-            partname = PackURI("/ppt/media/image%d.png" % idx)
-            return instance_mock(request, Part, partname=partname)
-
-        return iter([part(idx) for idx in idxs])
-
-    def i_media_parts(self, request, idxs):
-        def part(idx):
-            partname = PackURI("/ppt/media/media%d.mp4" % idx)
-            return instance_mock(request, Part, partname=partname)
-
-        return iter([part(idx) for idx in idxs])
-
-    @pytest.fixture
-    def iter_parts_(self, request):
-        return property_mock(request, Package, "iter_parts")
-
     @pytest.fixture
     def media_(self, request):
         return instance_mock(request, Video)
@@ -156,9 +162,13 @@ class DescribePackage(object):
 class Describe_ImageParts(object):
     """Unit-test suite for `pptx.package._ImageParts` objects."""
 
-    def it_can_iterate_over_the_package_image_parts(self, iter_fixture):
-        image_parts, expected_parts = iter_fixture
-        assert list(image_parts) == expected_parts
+    def it_can_iterate_over_the_package_image_parts(self, request, package_):
+        image_part_ = instance_mock(request, ImagePart)
+        package_.iter_target_parts.return_value = iter((image_part_,))
+        image_parts = _ImageParts(package_)
+
+        assert list(image_parts) == [image_part_]
+        package_.iter_target_parts.assert_called_once_with(RT.IMAGE)
 
     def it_can_get_a_matching_image_part(self, Image_, image_, image_part_, _find_by_sha1_):
         Image_.from_file.return_value = image_
@@ -185,6 +195,7 @@ class Describe_ImageParts(object):
         _find_by_sha1_.assert_called_once_with(image_parts, image_.sha1)
         ImagePart_.new.assert_called_once_with(package_, image_)
         assert image_part is image_part_
+        assert image_parts._sha1_index == {image_.sha1: {image_part_: None}}
 
     def it_can_find_an_image_part_by_sha1_hash(self, find_fixture):
         image_parts, sha1, expected_value = find_fixture
@@ -203,6 +214,56 @@ class Describe_ImageParts(object):
 
         assert result == png_part_
 
+    def it_indexes_the_image_parts_only_once(self, _iter_, image_part_):
+        image_part_.sha1 = "f00beed"
+        _iter_.side_effect = lambda _: iter((image_part_,))
+        image_parts = _ImageParts(None)
+
+        assert image_parts._find_by_sha1("f00beed") is image_part_
+        assert image_parts._find_by_sha1("f00beed") is image_part_
+        assert _iter_.call_count == 1
+
+    def and_it_removes_just_the_entry_of_an_image_part_that_is_dropped(
+        self, request, _iter_, image_part_
+    ):
+        image_part_.sha1 = "f00beed"
+        image_part_2_ = instance_mock(request, ImagePart, sha1="beefed")
+        duplicate_part_ = instance_mock(request, ImagePart, sha1="beefed")
+        _iter_.return_value = iter((image_part_, image_part_2_, duplicate_part_))
+        image_parts = _ImageParts(None)
+        assert image_parts._find_by_sha1("f00beed") is image_part_
+
+        image_parts.remove(duplicate_part_)
+        image_parts.remove(instance_mock(request, Part))
+        assert image_parts._sha1_index == {
+            "f00beed": {image_part_: None},
+            "beefed": {image_part_2_: None},
+        }
+
+        image_parts.remove(image_part_)
+        assert image_parts._sha1_index == {"beefed": {image_part_2_: None}}
+        assert _iter_.call_count == 1
+
+    def and_it_finds_a_surviving_image_part_with_the_same_image_when_one_is_dropped(
+        self, request, _iter_
+    ):
+        image_part_, duplicate_part_ = (
+            instance_mock(request, ImagePart, sha1="f00beed") for _ in range(2)
+        )
+        _iter_.return_value = iter((image_part_, duplicate_part_))
+        image_ = instance_mock(request, Image, sha1="f00beed")
+        method_mock(request, Image, "from_file", autospec=False, return_value=image_)
+        ImagePart_new_ = method_mock(request, ImagePart, "new", autospec=False)
+        image_parts = _ImageParts(None)
+        assert image_parts._find_by_sha1("f00beed") is image_part_
+
+        image_parts.remove(image_part_)
+
+        assert image_parts.get_or_add_image_part("foobar.png") is duplicate_part_
+        ImagePart_new_.assert_not_called()
+        image_parts.remove(duplicate_part_)
+        assert image_parts._find_by_sha1("f00beed") is None
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(params=[True, False])
@@ -219,25 +280,6 @@ class Describe_ImageParts(object):
             expected_value = None
         return image_parts, sha1, expected_value
 
-    @pytest.fixture
-    def iter_fixture(self, request, package_):
-        def rel(is_external, reltype):
-            part = instance_mock(request, Part)
-            return instance_mock(
-                request,
-                _Relationship,
-                is_external=is_external,
-                reltype=reltype,
-                target_part=part,
-            )
-
-        rels = (rel(True, RT.IMAGE), rel(False, RT.SLIDE), rel(False, RT.IMAGE))
-
-        package_.iter_rels.return_value = iter((rels[0], rels[1], rels[2], rels[2]))
-        image_parts = _ImageParts(package_)
-        expected_parts = [rels[2].target_part]
-        return image_parts, expected_parts
-
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -272,9 +314,13 @@ class Describe_ImageParts(object):
 class Describe_MediaParts(object):
     """Unit-test suite for `pptx.package._MediaParts` objects."""
 
-    def it_can_iterate_the_media_parts_in_the_package(self, iter_fixture):
-        media_parts, expected_parts = iter_fixture
-        assert list(media_parts) == expected_parts
+    def it_can_iterate_the_media_parts_in_the_package(self, request, package_):
+        media_part_ = instance_mock(request, MediaPart)
+        package_.iter_target_parts.return_value = iter((media_part_,))
+        media_parts = _MediaParts(package_)
+
+        assert list(media_parts) == [media_part_]
+        package_.iter_target_parts.assert_called_once_with(RT.MEDIA, RT.VIDEO)
 
     def it_can_get_or_add_a_media_part(self, get_or_add_fixture):
         media_parts, media_, sha1, MediaPart_, calls = get_or_add_fixture[:5]
@@ -291,6 +337,45 @@ class Describe_MediaParts(object):
         media_part = media_parts._find_by_sha1(sha1)
         assert media_part is expected_value
 
+    def it_indexes_a_media_part_it_adds(self, package_, media_, MediaPart_, media_part_, _iter_):
+        _iter_.return_value = iter(())
+        media_.sha1 = "2468"
+        MediaPart_.new.return_value = media_part_
+        media_parts = _MediaParts(package_)
+
+        assert media_parts.get_or_add_media_part(media_) is media_part_
+        assert media_parts.get_or_add_media_part(media_) is media_part_
+        MediaPart_.new.assert_called_once_with(package_, media_)
+        _iter_.assert_called_once_with(media_parts)
+
+    def and_it_removes_the_entry_of_a_media_part_that_is_dropped(self, _iter_, media_part_):
+        media_part_.sha1 = "2468"
+        _iter_.return_value = iter((media_part_,))
+        media_parts = _MediaParts(None)
+        assert media_parts._find_by_sha1("2468") is media_part_
+
+        media_parts.remove(media_part_)
+
+        assert media_parts._find_by_sha1("2468") is None
+        assert _iter_.call_count == 1
+
+    def and_it_finds_a_surviving_media_part_with_the_same_media_when_one_is_dropped(
+        self, request, _iter_, media_
+    ):
+        media_part_, duplicate_part_ = (
+            instance_mock(request, MediaPart, sha1="2468") for _ in range(2)
+        )
+        _iter_.return_value = iter((media_part_, duplicate_part_))
+        media_.sha1 = "2468"
+        MediaPart_new_ = method_mock(request, MediaPart, "new", autospec=False)
+        media_parts = _MediaParts(None)
+        assert media_parts._find_by_sha1("2468") is media_part_
+
+        media_parts.remove(media_part_)
+
+        assert media_parts.get_or_add_media_part(media_) is duplicate_part_
+        MediaPart_new_.assert_not_called()
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(params=[True, False])
@@ -319,37 +404,6 @@ class Describe_MediaParts(object):
         MediaPart_.new.return_value = None if media_present else media_part_
         return media_parts, media_, sha1, MediaPart_, calls, media_part_
 
-    @pytest.fixture
-    def iter_fixture(self, request, package_):
-        def rel(is_external, reltype, part):
-            return instance_mock(
-                request,
-                _Relationship,
-                is_external=is_external,
-                reltype=reltype,
-                target_part=part,
-            )
-
-        part_mocks = (
-            instance_mock(request, Part, name="linked-media"),
-            instance_mock(request, Part, name="slide"),
-            instance_mock(request, Part, name="embeded-media"),
-        )
-
-        rels = (
-            rel(True, RT.MEDIA, part_mocks[0]),
-            rel(True, RT.VIDEO, part_mocks[0]),
-            rel(False, RT.SLIDE, part_mocks[1]),
-            rel(False, RT.MEDIA, part_mocks[2]),
-            rel(False, RT.VIDEO, part_mocks[2]),
-        )
-
-        package_.iter_rels.return_value = iter(rels)
-
-        media_parts = _MediaParts(package_)
-        expected_parts = [part_mocks[2]]
-        return media_parts, expected_parts
-
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -375,3 +429,113 @@ class Describe_MediaParts(object):
     @pytest.fixture
     def package_(self, request):
         return instance_mock(request, Package)
+
+
+class DescribePackageCache(object):
+    """Unit-test suite for `pptx.package.PackageCache` objects."""
+
+    def it_loads_a_template_once_and_hands_out_clones_of_it(self, request, template_path):
+        _load_ = method_mock(request, PackageCache, "_load", side_effect=Package.open)
+        cache = PackageCache()
+
+        package = cache.open(template_path)
+        package_2 = cache.open(template_path)
+
+        _load_.assert_called_once_with(os.path.abspath(template_path))
+        assert package is not package_2
+        assert package.presentation_part is not package_2.presentation_part
+
+    def and_it_parses_the_template_xml_parts_once_when_it_loads_it(self, template_path):
+        package = PackageCache._load(template_path)
+
+        assert all(
+            part._preparsed_element is not None
+            for part in package.iter_parts()
+            if isinstance(part, XmlPart)
+        )
+
+    def and_its_clones_can_share_the_template_xml_until_they_use_it(self, template_path):
+        cache = PackageCache(share=True)
+        package = cache.open(template_path)
+        package_2 = cache.open(template_path)
+        prs = package.presentation_part.presentation
+
+        prs.slide_layouts.remove(prs.slide_layouts[6])
+
+        layout_parts = [
+            p for p in package_2.iter_parts() if p.partname.startswith("/ppt/slideLayouts/")
+        ]
+        assert len(layout_parts) == 11
+        assert all(p._parsed_element is None for p in layout_parts)
+        assert len(package_2.presentation_part.presentation.slide_layouts) == 11
+        assert len(prs.slide_layouts) == 10
+
+    def but_its_clones_copy_the_template_xml_by_default(self, template_path):
+        cache = PackageCache()
+
+        package = cache.open(template_path)
+
+        assert all(
+            p._shared_element is None for p in package.iter_parts() if isinstance(p, XmlPart)
+        )
+
+    def and_it_can_be_shared_between_threads(self, request, template_path, tmp_path):
+        _load_ = method_mock(request, PackageCache, "_load", side_effect=Package.open)
+        path_2 = str(tmp_path / "b.pptx")
+        shutil.copy(template_path, path_2)
+        cache = PackageCache(maxsize=2)
+        cache.open(template_path)
+        cache.open(path_2)
+        barrier = threading.Barrier(8)
+
+        def open_template(path: str) -> Package:
+            barrier.wait()
+            return cache.open(path)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            packages = list(executor.map(open_template, [template_path, path_2] * 4))
+
+        assert _load_.call_count == 2
+        assert len({id(p) for p in packages}) == 8
+        assert len({id(p.presentation_part) for p in packages}) == 8
+        for package in packages:
+            package.presentation_part.presentation.slides.add_slide(
+                package.presentation_part.presentation.slide_layouts[0]
+            )
+        assert all(len(p.presentation_part.presentation.slides) == 1 for p in packages)
+
+    def but_it_reloads_a_template_whose_file_has_changed(self, request, template_path):
+        _load_ = method_mock(request, PackageCache, "_load", side_effect=Package.open)
+        cache = PackageCache()
+        cache.open(template_path)
+        stat = os.stat(template_path)
+        os.utime(template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+        cache.open(template_path)
+
+        assert _load_.call_count == 2
+
+    def and_it_discards_the_least_recently_opened_template_when_full(
+        self, request, template_path, tmp_path
+    ):
+        _load_ = method_mock(request, PackageCache, "_load", side_effect=Package.open)
+        path_2, path_3 = str(tmp_path / "b.pptx"), str(tmp_path / "c.pptx")
+        shutil.copy(template_path, path_2)
+        shutil.copy(template_path, path_3)
+        cache = PackageCache(maxsize=2)
+
+        for path in (template_path, path_2, template_path, path_3, template_path, path_2):
+            cache.open(path)
+
+        assert [c.args[0] for c in _load_.call_args_list] == [
+            os.path.abspath(p) for p in (template_path, path_2, path_3, path_2)
+        ]
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def template_path(self, tmp_path):
+        default_pptx = os.path.join(os.path.split(pptx.__file__)[0], "templates", "default.pptx")
+        path = str(tmp_path / "a.pptx")
+        shutil.copy(default_pptx, path)
+        return path
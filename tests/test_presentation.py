@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import pytest
 
+from pptx.oxml.ns import qn
 from pptx.parts.coreprops import CorePropertiesPart
 from pptx.parts.presentation import PresentationPart
 from pptx.parts.slide import NotesMasterPart
@@ -54,6 +55,23 @@ class DescribePresentation(object):
         assert prs._element.xml == expected_xml
         assert slides is slides_
 
+    @pytest.mark.parametrize(
+        "prs_cxml", ("p:presentation", "p:presentation/p:sldIdLst/p:sldId{r:id=a}")
+    )
+    def but_it_leaves_the_slides_of_a_read_only_presentation_as_they_are(
+        self, prs_cxml, part_prop_, Slides_, slides_
+    ):
+        prs_elm = element(prs_cxml)
+        prs = Presentation(prs_elm, None)
+        part_prop_.return_value.package.read_only = True
+
+        slides = prs.slides
+
+        part_prop_.return_value.rename_slide_parts.assert_not_called()
+        assert Slides_.call_args.args[0].tag == qn("p:sldIdLst")
+        assert prs_elm.xml == xml(prs_cxml)
+        assert slides is slides_
+
     def it_provides_access_to_its_slide_layouts(self, layouts_fixture):
         prs, slide_layouts_ = layouts_fixture
         assert prs.slide_layouts is slide_layouts_
@@ -73,8 +91,27 @@ class DescribePresentation(object):
 
     def it_can_save_the_presentation_to_a_file(self, save_fixture):
         prs, file_, prs_part_ = save_fixture
-        prs.save(file_)
-        prs_part_.save.assert_called_once_with(file_)
+        prs.save(file_, incremental=True)
+        prs_part_.save.assert_called_once_with(file_, None, None, True)
+
+    def it_can_generate_the_presentation_file_in_chunks(self, prs_part_):
+        prs_part_.iter_save.return_value = iter((b"foo", b"bar"))
+        prs = Presentation(None, prs_part_)
+
+        chunks = prs.iter_save(compression=6)
+
+        prs_part_.iter_save.assert_called_once_with(None, 6)
+        assert list(chunks) == [b"foo", b"bar"]
+
+    def it_can_close_its_package_file(self, prs_part_):
+        prs = Presentation(None, prs_part_)
+        prs.close()
+        prs_part_.package.close.assert_called_once_with()
+
+    def it_closes_its_package_file_on_context_exit(self, prs_part_):
+        with Presentation(None, prs_part_) as prs:
+            assert isinstance(prs, Presentation)
+        prs_part_.package.close.assert_called_once_with()
 
     # fixtures -------------------------------------------------------
 
@@ -180,6 +217,7 @@ class DescribePresentation(object):
     def slides_fixture(self, request, part_prop_, Slides_, slides_):
         prs_cxml, rIds, expected_cxml = request.param
         prs = Presentation(element(prs_cxml), None)
+        part_prop_.return_value.package.read_only = False
         rename_slide_parts_ = part_prop_.return_value.rename_slide_parts
         expected_xml = xml(expected_cxml)
         return prs, rename_slide_parts_, rIds, Slides_, slides_, expected_xml
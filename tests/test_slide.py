@@ -11,7 +11,6 @@ from pptx.enum.shapes import PP_PLACEHOLDER
 from pptx.package import Package
 from pptx.parts.presentation import PresentationPart
 from pptx.parts.slide import SlideLayoutPart, SlideMasterPart, SlidePart
-from pptx.presentation import Presentation
 from pptx.shapes.base import BaseShape
 from pptx.shapes.placeholder import LayoutPlaceholder, NotesSlidePlaceholder
 from pptx.shapes.shapetree import (
@@ -460,6 +459,7 @@ class DescribeSlides(object):
     def it_knows_the_index_of_a_slide_it_contains(self, index_fixture):
         slides, slide, expected_value = index_fixture
         index = slides.index(slide)
+        slides.part.slide_idx.assert_called_once_with(slide.part)
         assert index == expected_value
 
     def it_raises_on_slide_not_in_collection(self, raises_fixture):
@@ -473,6 +473,25 @@ class DescribeSlides(object):
         assert related_slide_.call_args_list == calls
         assert slide_lst == expected_value
 
+    def and_it_releases_each_slide_of_a_read_only_presentation_when_done_with_it(
+        self, request, part_prop_
+    ):
+        slides = Slides(element("p:sldIdLst/(p:sldId{r:id=a},p:sldId{r:id=b})"), None)
+        slide_parts = [instance_mock(request, SlidePart) for _ in range(2)]
+        part_prop_.return_value.package.read_only = True
+        part_prop_.return_value.related_slide.side_effect = [
+            Slide(element("p:sld"), slide_part) for slide_part in slide_parts
+        ]
+        slide_iter = iter(slides)
+
+        next(slide_iter)
+        slide_parts[0].release.assert_not_called()
+        next(slide_iter)
+        slide_parts[0].release.assert_called_once_with()
+        slide_parts[1].release.assert_not_called()
+        assert list(slide_iter) == []
+        slide_parts[1].release.assert_called_once_with()
+
     def it_supports_len(self, len_fixture):
         slides, expected_value = len_fixture
         assert len(slides) == expected_value
@@ -486,6 +505,7 @@ class DescribeSlides(object):
         part_.add_slide.assert_called_once_with(slide_layout_)
         clone_layout_placeholders_.assert_called_once_with(slide_layout_)
         assert slides._sldIdLst.xml == expected_xml
+        part_.index_slide.assert_called_once_with(slides._sldIdLst[1])
         assert slide is slide_
 
     def it_finds_a_slide_by_slide_id(self, get_fixture):
@@ -537,16 +557,16 @@ class DescribeSlides(object):
     @pytest.fixture(params=[0, 1])
     def index_fixture(self, request, part_prop_):
         idx = request.param
-        sldIdLst = element("p:sldIdLst/(p:sldId{r:id=a},p:sldId{r:id=b})")
-        slides = Slides(sldIdLst, None)
-        _slides = [Slide(element("p:sld"), None), Slide(element("p:sld"), None)]
-        part_prop_.return_value.related_slide.side_effect = _slides
-        return slides, _slides[idx], idx
+        slides = Slides(element("p:sldIdLst/(p:sldId{r:id=a},p:sldId{r:id=b})"), None)
+        slide = Slide(element("p:sld"), instance_mock(request, SlidePart))
+        part_prop_.return_value.slide_idx.return_value = idx
+        return slides, slide, idx
 
     @pytest.fixture
     def iter_fixture(self, part_prop_, slide_):
         sldIdLst = element("p:sldIdLst/(p:sldId{r:id=a},p:sldId{r:id=b})")
         slides = Slides(sldIdLst, None)
+        part_prop_.return_value.package.read_only = False
         related_slide_ = part_prop_.return_value.related_slide
         related_slide_.return_value = slide_
         calls = [call("a"), call("b")]
@@ -566,9 +586,10 @@ class DescribeSlides(object):
         return slides, expected_value
 
     @pytest.fixture
-    def raises_fixture(self):
+    def raises_fixture(self, request, part_prop_):
         slides = Slides(element("p:sldIdLst"), None)
-        slide = Slide(element("p:sld"), None)
+        slide = Slide(element("p:sld"), instance_mock(request, SlidePart))
+        part_prop_.return_value.slide_idx.side_effect = ValueError
         return slides, slide
 
     # fixture components ---------------------------------------------
@@ -631,23 +652,19 @@ class DescribeSlideLayout(object):
         assert slide_master is slide_master_
 
     def it_knows_which_slides_are_based_on_it(
-        self,
-        used_by_fixture,
-        part_prop_,
-        slide_layout_part_,
-        package_,
-        presentation_part_,
-        presentation_,
+        self, request, part_prop_, slide_layout_part_, package_, presentation_part_
     ):
-        presentation_, slide_layout, expected_value = used_by_fixture
-        part_prop_.return_value = slide_layout_part_
+        slides = tuple(instance_mock(request, Slide) for _ in range(2))
+        slide_parts = tuple(instance_mock(request, SlidePart, slide=s) for s in slides)
         slide_layout_part_.package = package_
         package_.presentation_part = presentation_part_
-        presentation_part_.presentation = presentation_
+        presentation_part_.slide_parts_based_on.return_value = slide_parts
+        slide_layout = SlideLayout(None, None)
 
         used_by_slides = slide_layout.used_by_slides
 
-        assert used_by_slides == expected_value
+        presentation_part_.slide_parts_based_on.assert_called_once_with(slide_layout_part_)
+        assert used_by_slides == slides
 
     # fixtures -------------------------------------------------------
 
@@ -669,17 +686,6 @@ class DescribeSlideLayout(object):
         placeholders_prop_.return_value = _placeholders
         return slide_layout, expected_placeholders
 
-    @pytest.fixture(params=[(), (0,), (1,), (0, 1)])
-    def used_by_fixture(self, request, presentation_, slide_, slide_2_):
-        used_by_idxs = request.param
-        slides = (slide_, slide_2_)
-        slide_layout = SlideLayout(None, None)
-        for idx, s in enumerate(slides):
-            s.slide_layout = slide_layout if idx in used_by_idxs else None
-        presentation_.slides = slides
-        expected_value = tuple(s for i, s in enumerate(slides) if i in used_by_idxs)
-        return presentation_, slide_layout, expected_value
-
     # fixture components -----------------------------------
 
     @pytest.fixture
@@ -714,10 +720,6 @@ class DescribeSlideLayout(object):
     def placeholders_prop_(self, request, placeholders_):
         return property_mock(request, SlideLayout, "placeholders", return_value=placeholders_)
 
-    @pytest.fixture
-    def presentation_(self, request):
-        return instance_mock(request, Presentation)
-
     @pytest.fixture
     def presentation_part_(self, request):
         return instance_mock(request, PresentationPart)
@@ -726,14 +728,6 @@ class DescribeSlideLayout(object):
     def shapes_(self, request):
         return instance_mock(request, LayoutShapes)
 
-    @pytest.fixture
-    def slide_(self, request):
-        return instance_mock(request, Slide)
-
-    @pytest.fixture
-    def slide_2_(self, request):
-        return instance_mock(request, Slide)
-
     @pytest.fixture
     def slide_layout_part_(self, request):
         return instance_mock(request, SlideLayoutPart)